@@ -0,0 +1,158 @@
+import collections
+import hashlib
+import logging
+import os
+import sys
+import time
+
+# --- 로깅 관련 상수 ---
+LOGGER_NAME = "unipaste"
+LOG_RING_SIZE = 1000                  # 메모리에 보관하는 최근 로그 수
+LOG_DUMP_FILE = "recent_log.txt"
+LOG_LEVEL_ENV = "UNIPASTE_LOG_LEVEL"  # 설정보다 우선하는 로그 레벨 (예: DEBUG)
+LOG_CLIPS_ENV = "UNIPASTE_LOG_CLIPS"  # "1"이면 항목 내용 앞부분과 피어 주소를 로그에 표시 (디버깅용)
+CLIP_PREVIEW_CHARS = 30
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+_show_clip_contents = False
+_show_peer_addresses = False
+
+
+def get_logger(name):
+    """
+    모듈별 로거 반환 ("unipaste.<name>")
+    setup_logging() 전에는 WARNING 미만 로그가 만들어지지 않음
+    """
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+
+class ClipText:
+    """
+    로그에 넣을 항목 텍스트
+    로그가 실제로 출력될 때만 문자열로 바뀌며, 기본적으로 내용 대신 길이와 짧은 해시만 표시함
+    """
+    __slots__ = ("text",)
+
+    def __init__(self, text):
+        self.text = text
+
+    def __str__(self):
+        text = self.text
+        if not isinstance(text, str):
+            return repr(text)
+        if _show_clip_contents:
+            preview = text[:CLIP_PREVIEW_CHARS]
+            return repr(preview) + ("..." if len(text) > CLIP_PREVIEW_CHARS else "")
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=4).hexdigest()
+        return f"<clip len={len(text)} id={digest}>"
+
+    __repr__ = __str__
+
+
+def redact(text):
+    """항목 텍스트를 로그 인자로 감싸기 (예: log.debug("붙여넣기 %s", redact(text)))"""
+    return ClipText(text)
+
+
+class PeerAddress:
+    """
+    로그에 넣을 피어 주소 ("호스트:포트")
+    기본적으로 호스트 대신 짧은 해시만 표시함 (같은 피어는 같은 값으로 표시되어 구분 가능)
+    """
+    __slots__ = ("address",)
+
+    def __init__(self, address):
+        self.address = address
+
+    def __str__(self):
+        if _show_peer_addresses:
+            return str(self.address)
+        host, _, port = str(self.address).rpartition(":")
+        digest = hashlib.blake2b(host.encode("utf-8"), digest_size=3).hexdigest()
+        return f"<peer {digest}:{port}>"
+
+    __repr__ = __str__
+
+
+def redact_address(address):
+    """피어 주소를 로그 인자로 감싸기"""
+    return PeerAddress(address)
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    최근 로그를 메모리에 보관하는 핸들러 (개수 제한)
+    기록 시점에 메시지를 문자열로 만들어 두므로 항목 텍스트 참조를 붙잡고 있지 않음
+    """
+
+    def __init__(self, capacity=LOG_RING_SIZE):
+        super().__init__(logging.DEBUG)
+        self.records = collections.deque(maxlen=capacity)
+        self.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    def resize(self, capacity):
+        self.records = collections.deque(self.records, maxlen=max(1, int(capacity)))
+
+    def emit(self, record):
+        try:
+            self.records.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+    def lines(self):
+        """보관 중인 로그 (오래된 순서)"""
+        return list(self.records)
+
+    def dump(self, path=LOG_DUMP_FILE):
+        """
+        보관 중인 로그를 파일로 저장
+
+        Returns:
+            저장한 파일 경로
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"# {time.strftime('%Y-%m-%d %H:%M:%S')} 최근 로그 {len(self.records)}개\n")
+            for line in self.lines():
+                f.write(line + "\n")
+        return path
+
+
+ring_buffer = RingBufferHandler()
+
+
+def _parse_level(name, default):
+    level = logging.getLevelName(str(name).upper())
+    return level if isinstance(level, int) else default
+
+
+def setup_logging(config=None):
+    """
+    로그 레벨/핸들러 설정 (앱 시작 시 한 번 호출, 다시 호출하면 설정만 갱신)
+    콘솔은 level, 최근 로그 보관(ring_buffer)은 ring_level 이상만 기록하며, 로거 레벨은 둘 중 낮은 값이므로
+    둘 다 기록하지 않는 로그는 isEnabledFor 확인에서 걸러져 메시지 포맷 비용이 없음
+
+    Args:
+        config: 로깅 설정 딕셔너리 (config_manager.DEFAULT_LOGGING_CONFIG 형식)
+    """
+    global _show_clip_contents, _show_peer_addresses
+    config = config or {}
+    level = _parse_level(os.environ.get(LOG_LEVEL_ENV) or config.get("level", "INFO"), logging.INFO)
+    ring_level = _parse_level(config.get("ring_level", "DEBUG"), logging.DEBUG)
+    _show_clip_contents = bool(config.get("show_clip_contents")) or os.environ.get(LOG_CLIPS_ENV) == "1"
+    _show_peer_addresses = bool(config.get("show_peer_addresses")) or os.environ.get(LOG_CLIPS_ENV) == "1"
+
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(min(level, ring_level))
+    logger.propagate = False
+    console = next((handler for handler in logger.handlers if getattr(handler, "_unipaste_console", False)), None)
+    if console is None:
+        console = logging.StreamHandler(sys.stdout)
+        console.setFormatter(logging.Formatter(LOG_FORMAT))
+        console._unipaste_console = True
+        logger.addHandler(console)
+    console.setLevel(level)
+    ring_buffer.setLevel(ring_level)
+    if ring_buffer not in logger.handlers:
+        logger.addHandler(ring_buffer)
+    ring_buffer.resize(config.get("ring_size", LOG_RING_SIZE))
+    return logger
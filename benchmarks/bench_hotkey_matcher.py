@@ -0,0 +1,448 @@
+"""
+단축키 매칭 벤치마크
+
+실제 키보드 없이 생성(또는 기록)된 pynput Key/KeyCode 이벤트 열을 HotkeyMatcher에
+재생하여 이벤트당 처리 시간, 이벤트당 메모리 할당, 잘못된 인식/놓친 인식 횟수를 측정함.
+X 서버가 없는 리눅스에서도 실행되도록 pynput의 dummy 백엔드를 사용하며,
+dummy 백엔드의 Key는 모든 멤버 값이 같으므로 멤버 값이 서로 다른 대체 열거형을 만들어 사용함.
+
+사용법:
+    python benchmarks/bench_hotkey_matcher.py [--events 1000000] [--seed 1] [--json]
+    python benchmarks/bench_hotkey_matcher.py --replay events.json
+
+기록 파일 형식: [[시각(초), "press" | "release", 키 이름], ...]
+    키 이름은 "ctrl_l" 같은 특수 키 이름, 한 글자 문자, 또는 "<86>" 형식의 가상 키 코드
+"""
+import argparse
+import enum
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 디스플레이가 없는 리눅스에서는 xorg 백엔드를 불러올 수 없으므로 dummy 백엔드 사용
+if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+    os.environ.setdefault("PYNPUT_BACKEND", "dummy")
+
+from pynput.keyboard import Key, KeyCode
+
+from config_manager import DEFAULT_BINDINGS, DEFAULT_HOTKEY_CONFIG, HOTKEY_ACTIONS
+from hotkey_matcher import HOTKEY_DEBOUNCE_SEC, HotkeyMatcher, build_bindings
+
+# --- 이벤트 생성 관련 상수 ---
+DEFAULT_EVENT_COUNT = 1_000_000
+DEFAULT_TIMING_RUNS = 3
+TYPING_CHARS = "abcdefghijklmnopqrstuvwxyz0123456789 "
+SCENARIO_WEIGHTS = (
+    ("typing", 80),     # 일반 타이핑 (가끔 Shift로 대문자)
+    ("chord", 12),      # 등록된 단축키 입력
+    ("repeat", 5),      # 단축키를 누른 채 주 키 자동 반복
+    ("near_miss", 3),   # 수정자나 주 키가 하나 다른 조합
+)
+MODIFIER_SIDES = {
+    "ctrl": ("ctrl_l", "ctrl_r"),
+    "shift": ("shift_l", "shift_r"),
+    "alt": ("alt_l", "alt_r"),
+    "cmd": ("cmd_l", "cmd_r"),
+}
+
+
+def resolve_key_enum():
+    """
+    매칭에 사용할 특수 키 열거형 반환
+    pynput 백엔드의 Key 멤버 값이 서로 겹치면(dummy 백엔드) 대체 열거형을 생성
+    """
+    if len(Key) == len(Key.__members__):
+        return Key
+    return enum.Enum("Key", {
+        name: KeyCode.from_vk(0x10000 + index)
+        for index, name in enumerate(Key.__members__)
+    })
+
+
+def _logical_name(mod_name):
+    """설정의 수정자 이름 -> 좌우 구분 없는 이름 ("ctrl_l" -> "ctrl", "alt_gr" -> "alt")"""
+    return "alt" if mod_name == "alt_gr" else mod_name.split("_")[0]
+
+
+class Oracle:
+    """
+    HotkeyMatcher와 별도로 구현한 기대 결과 계산기
+    누른 수정자 이름 집합과 단축키 설정을 직접 비교함 (속도는 고려하지 않음)
+    """
+
+    def __init__(self, bindings, debounce):
+        self.bindings = bindings
+        self.debounce = debounce
+        self.held = []  # 눌린 수정자 키 이름 (중복 허용)
+        self.last_fired = {}
+        self.ignore_cmd = sys.platform != "darwin"
+        self.specs = []
+        for binding in bindings:
+            mods = frozenset(_logical_name(m) for m in binding.config.get("modifiers", []))
+            key = binding.config["key"]
+            self.specs.append((mods, key.lower() if len(key) == 1 else key))
+
+    def press_modifier(self, name):
+        self.held.append(name)
+
+    def release_modifier(self, name):
+        if name in self.held:
+            self.held.remove(name)
+
+    def press(self, key_name, now):
+        """
+        주 키 누름에 대한 기대 결과
+
+        Args:
+            key_name: 소문자 문자 또는 특수 키 이름
+            now: 이벤트 시각
+
+        Returns:
+            인식되어야 하는 HotkeyBinding 또는 None
+        """
+        held = frozenset(_logical_name(m) for m in self.held)
+        candidates = [held]
+        if self.ignore_cmd and "cmd" in held:
+            candidates.append(held - {"cmd"})
+        for mods in candidates:
+            matched = [b for b, spec in zip(self.bindings, self.specs) if spec[0] == mods]
+            if not matched:
+                continue
+            for binding, spec in zip(self.bindings, self.specs):
+                if spec[0] == mods and spec[1] == key_name:
+                    last = self.last_fired.get(id(binding), float("-inf"))
+                    if now - last <= self.debounce:
+                        return None
+                    self.last_fired[id(binding)] = now
+                    return binding
+            return None
+        return None
+
+
+class EventGenerator:
+    """
+    타이핑, 단축키, 자동 반복, 비슷한 조합이 섞인 키 이벤트 열 생성기
+    """
+
+    def __init__(self, bindings, key_enum, seed):
+        self.bindings = bindings
+        self.key_enum = key_enum
+        self.random = random.Random(seed)
+        self.oracle = Oracle(bindings, HOTKEY_DEBOUNCE_SEC)
+        self.events = []    # (누름 여부, 키, 시각)
+        self.expected = []  # 누름 이벤트(수정자 포함)별 기대 결과 (HotkeyBinding 또는 None)
+        self.now = 0.0
+        self._char_keys = {}
+
+    def _char_key(self, char):
+        """문자 KeyCode (같은 문자는 같은 객체를 재사용)"""
+        key = self._char_keys.get(char)
+        if key is None:
+            key = self._char_keys[char] = KeyCode.from_char(char)
+        return key
+
+    def _key_for(self, key_name):
+        """
+        주 키 이름 -> 실제 이벤트로 전달될 키 객체
+        Ctrl이 눌린 상태의 영문자는 Windows처럼 제어 문자로 전달됨
+        """
+        if len(key_name) != 1:
+            return getattr(self.key_enum, key_name)
+        held = [_logical_name(m) for m in self.oracle.held]
+        if "ctrl" in held and "a" <= key_name <= "z":
+            return self._char_key(chr(ord(key_name) - 96))
+        if "shift" in held:
+            return self._char_key(key_name.upper())
+        return self._char_key(key_name)
+
+    def _advance(self, low, high):
+        self.now += self.random.uniform(low, high)
+
+    def _modifier(self, name, press):
+        self.events.append((press, getattr(self.key_enum, name), self.now))
+        if press:
+            self.expected.append(None)
+            self.oracle.press_modifier(name)
+        else:
+            self.oracle.release_modifier(name)
+
+    def _tap(self, key_name, hold=0.05):
+        key = self._key_for(key_name)
+        self.events.append((True, key, self.now))
+        self.expected.append(self.oracle.press(key_name, self.now))
+        self._advance(0.01, hold)
+        self.events.append((False, key, self.now))
+
+    def _random_sides(self, modifiers):
+        """설정의 수정자 목록을 임의의 좌/우 키 이름으로 변환"""
+        return [self.random.choice(MODIFIER_SIDES[_logical_name(m)]) for m in modifiers]
+
+    def typing(self):
+        for _ in range(self.random.randint(5, 40)):
+            char = self.random.choice(TYPING_CHARS)
+            if char == " ":
+                self._tap("space")
+            elif char.isalpha() and self.random.random() < 0.1:
+                side = self.random.choice(MODIFIER_SIDES["shift"])
+                self._modifier(side, True)
+                self._advance(0.01, 0.05)
+                self._tap(char)
+                self._modifier(side, False)
+            else:
+                self._tap(char)
+            self._advance(0.03, 0.15)
+
+    def chord(self, modifiers=None, key_name=None, repeats=1):
+        binding = self.random.choice(self.bindings)
+        if modifiers is None:
+            modifiers = self._random_sides(binding.config.get("modifiers", []))
+        if key_name is None:
+            key_name = binding.config["key"].lower()
+        for name in modifiers:
+            self._modifier(name, True)
+            self._advance(0.01, 0.08)
+        key = self._key_for(key_name)
+        for _ in range(repeats):
+            # 자동 반복 중에는 해제 이벤트 없이 누름 이벤트만 반복됨
+            self.events.append((True, key, self.now))
+            self.expected.append(self.oracle.press(key_name, self.now))
+            self._advance(0.03, 0.04)
+        self.events.append((False, key, self.now))
+        for name in reversed(modifiers):
+            self._advance(0.01, 0.05)
+            self._modifier(name, False)
+
+    def repeat(self):
+        self.chord(repeats=self.random.randint(5, 30))
+
+    def near_miss(self):
+        binding = self.random.choice(self.bindings)
+        modifiers = self._random_sides(binding.config.get("modifiers", []))
+        key_name = binding.config["key"].lower()
+        if len(modifiers) > 1 and self.random.random() < 0.5:
+            modifiers.pop(self.random.randrange(len(modifiers)))
+        else:
+            key_name = self.random.choice([c for c in "b0x" if c != key_name])
+        self.chord(modifiers, key_name)
+
+    def generate(self, count):
+        """
+        이벤트가 count개 이상이 될 때까지 시나리오를 임의로 이어 붙임
+
+        Returns:
+            (이벤트 리스트, 누름 이벤트별 기대 결과 리스트)
+        """
+        names = [name for name, _ in SCENARIO_WEIGHTS]
+        weights = [weight for _, weight in SCENARIO_WEIGHTS]
+        while len(self.events) < count:
+            getattr(self, self.random.choices(names, weights)[0])()
+            self._advance(0.2, 2.0)
+        return self.events, self.expected
+
+
+def load_recorded_events(path, key_enum):
+    """
+    기록 파일에서 이벤트 열 로드
+
+    Returns:
+        (누름 여부, 키, 시각) 리스트
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        records = json.load(f)
+    events = []
+    for timestamp, kind, name in records:
+        if name in key_enum.__members__:
+            key = key_enum[name]
+        elif name.startswith("<") and name.endswith(">"):
+            key = KeyCode.from_vk(int(name[1:-1]))
+        else:
+            key = KeyCode.from_char(name)
+        events.append((kind == "press", key, float(timestamp)))
+    return events
+
+
+class ReplayClock:
+    """재생 중인 이벤트의 시각을 반환하는 시계 (디바운스 판정이 실제 시간과 무관하도록)"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def replay(matcher, clock, events):
+    """
+    이벤트 열을 매처에 재생
+
+    Returns:
+        누름 이벤트별 매칭 결과 리스트
+    """
+    on_press = matcher.on_press
+    on_release = matcher.on_release
+    results = []
+    append = results.append
+    for press, key, timestamp in events:
+        clock.now = timestamp
+        if press:
+            append(on_press(key))
+        else:
+            on_release(key)
+    return results
+
+
+def _time_replay(matcher, clock, events):
+    """결과를 저장하지 않는 재생 루프의 경과 시간 (나노초)"""
+    on_press = matcher.on_press
+    on_release = matcher.on_release
+    matcher.reset()
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        for press, key, timestamp in events:
+            clock.now = timestamp
+            if press:
+                on_press(key)
+            else:
+                on_release(key)
+        return time.perf_counter_ns() - start
+    finally:
+        gc.enable()
+
+
+def _time_baseline(clock, events):
+    """매처 호출을 제외한 같은 루프의 경과 시간 (나노초, 루프 자체 비용 보정용)"""
+    noop = lambda key: None
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        for press, key, timestamp in events:
+            clock.now = timestamp
+            if press:
+                noop(key)
+            else:
+                noop(key)
+        return time.perf_counter_ns() - start
+    finally:
+        gc.enable()
+
+
+def _measure_allocations(matcher, clock, events):
+    """
+    재생 중 메모리 할당 측정 (tracemalloc)
+
+    Returns:
+        (재생 후 남은 메모리 블록 수, 재생 중 일시적으로 늘어난 최대 바이트 수)
+    """
+    matcher.reset()
+    on_press = matcher.on_press
+    on_release = matcher.on_release
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        base_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        for press, key, timestamp in events:
+            clock.now = timestamp
+            if press:
+                on_press(key)
+            else:
+                on_release(key)
+        peak_bytes = tracemalloc.get_traced_memory()[1] - base_bytes
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    diff = after.filter_traces(filters).compare_to(before.filter_traces(filters), "lineno")
+    retained_blocks = sum(stat.count_diff for stat in diff if stat.count_diff > 0)
+    return retained_blocks, peak_bytes
+
+
+def run_benchmark(events, expected, key_enum, bindings, timing_runs):
+    """
+    벤치마크 실행
+
+    Returns:
+        결과 딕셔너리
+    """
+    clock = ReplayClock()
+    matcher = HotkeyMatcher(bindings, clock=clock, key_enum=key_enum)
+    count = len(events)
+
+    # 정확도 확인 (결과 저장 포함, 시간 측정과 분리)
+    results = replay(matcher, clock, events)
+    triggers = sum(1 for result in results if result is not None)
+    false_triggers = missed_triggers = None
+    if expected is not None:
+        false_triggers = sum(
+            1 for got, want in zip(results, expected) if got is not None and got is not want
+        )
+        missed_triggers = sum(1 for got, want in zip(results, expected) if want is not None and got is None)
+
+    # 시간 측정 (디바운스 상태를 초기화하기 위해 매번 새 매처 사용)
+    gross_ns = []
+    for _ in range(timing_runs):
+        matcher = HotkeyMatcher(bindings, clock=clock, key_enum=key_enum)
+        gross_ns.append(_time_replay(matcher, clock, events))
+    baseline_ns = min(_time_baseline(clock, events) for _ in range(timing_runs))
+    best_ns = min(gross_ns)
+
+    matcher = HotkeyMatcher(bindings, clock=clock, key_enum=key_enum)
+    retained_blocks, peak_bytes = _measure_allocations(matcher, clock, events)
+
+    return {
+        "events": count,
+        "press_events": len(results),
+        "triggers": triggers,
+        "expected_triggers": None if expected is None else sum(1 for want in expected if want is not None),
+        "false_triggers": false_triggers,
+        "missed_triggers": missed_triggers,
+        "ns_per_event": round(best_ns / count, 1),
+        "ns_per_event_net": round(max(best_ns - baseline_ns, 0) / count, 1),
+        "retained_blocks_per_event": round(retained_blocks / count, 6),
+        "transient_peak_bytes": peak_bytes,
+        "key_enum": "pynput" if key_enum is Key else "synthetic",
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HotkeyMatcher 키 이벤트 재생 벤치마크")
+    parser.add_argument("--events", type=int, default=DEFAULT_EVENT_COUNT, help="생성할 이벤트 수")
+    parser.add_argument("--seed", type=int, default=1, help="이벤트 생성 시드")
+    parser.add_argument("--runs", type=int, default=DEFAULT_TIMING_RUNS, help="시간 측정 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--replay", metavar="FILE", help="생성 대신 기록 파일의 이벤트 재생 (정확도 확인 생략)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    key_enum = resolve_key_enum()
+    # 기본 빠른 붙여넣기 단축키는 꺼진 상태로 제공되므로 켜서 측정
+    binding_configs = [dict(config, enabled=True) for config in DEFAULT_BINDINGS]
+    bindings = build_bindings(DEFAULT_HOTKEY_CONFIG, binding_configs, HOTKEY_ACTIONS)
+
+    if args.replay:
+        events, expected = load_recorded_events(args.replay, key_enum), None
+    else:
+        events, expected = EventGenerator(bindings, key_enum, args.seed).generate(args.events)
+
+    result = run_benchmark(events, expected, key_enum, bindings, max(args.runs, 1))
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for name, value in result.items():
+            print(f"{name:>26}: {value}")
+    if result["false_triggers"] or result["missed_triggers"]:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,478 @@
+"""
+시작 시간/메모리 벤치마크 모음
+
+디스플레이 없는 리눅스에서도 실행되도록 Qt offscreen 플랫폼과 메모리 안의 가짜 클립보드를 사용하며,
+측정 항목마다 새 프로세스를 띄워 서로 영향을 주지 않도록 함.
+
+측정 항목:
+    cold_start      프로세스 시작 -> 트레이 아이콘/첫 클립보드 확인/준비 완료까지의 시간
+    load            히스토리 N개가 저장된 설정 파일을 읽고 ClipboardMonitorThread를 만든 뒤의 RSS 증가량
+    ui              N개 항목에 대한 ClipboardHistoryPopup.update_displayed_items / filter_history 시간
+    ingest          ClipboardMonitorThread를 통한 클립보드 수집 처리량 (히스토리 N개 상태에서)
+    ingest_burst    기본 수집 설정/확인 간격에서 스크립트가 클립보드를 연속으로 바꿀 때 묶인 항목 수
+
+사용법:
+    python benchmarks/bench_suite.py [--sizes 50,1000,10000,100000] [--runs 3] [--output results.json]
+    python benchmarks/bench_suite.py --baseline old.json [--threshold 0.2]
+
+기준 결과(--baseline)와 비교해 시간/메모리가 threshold 비율 이상 늘었거나
+처리량(*_per_sec)이 그만큼 줄어든 항목이 있으면 종료 코드 1을 반환함.
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+_CHILD_STARTED_AT = time.perf_counter()  # 자식 프로세스의 시작 시간 측정 기준
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# 디스플레이가 없는 리눅스에서는 xorg 백엔드를 불러올 수 없으므로 dummy 백엔드 사용
+if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+    os.environ.setdefault("PYNPUT_BACKEND", "dummy")
+
+from config_manager import CONFIG_FILE, DEFAULT_HOTKEY_CONFIG, DEFAULT_INGEST_CONFIG
+
+# --- 벤치마크 관련 상수 ---
+DEFAULT_SIZES = (50, 1000, 10_000, 100_000)
+DEFAULT_RUNS = 3
+DEFAULT_UI_MAX_ITEMS = 20_000   # 이보다 큰 히스토리는 카드 생성 시간이 너무 길어 UI 측정 생략
+DEFAULT_INGEST_CLIPS = 200
+DEFAULT_THRESHOLD = 0.2         # 기준 대비 20% 이상 나빠지면 회귀로 판단
+COLD_START_ITEMS = 50
+CHILD_TIMEOUT_SEC = 600
+READY_TIMEOUT_SEC = 30.0
+SEARCH_TIMEOUT_SEC = 60.0
+INGEST_POLL_SEC = 0.0005        # 수집 처리량 측정 시 클립보드 확인 간격 (폴링 대기 시간 제외)
+BURST_CLIPS = 100               # 연속 변경 측정에서 바꿀 클립보드 내용 수
+BURST_INTERVAL_SEC = 0.01       # 연속 변경 간격 (스크립트가 초당 100번 바꾸는 경우)
+SEARCH_QUERIES = ("a", "type:url", "len>200", "/[0-9]{3}/")
+RESULT_PREFIX = "BENCH_RESULT "
+WORDS = ("clip", "paste", "history", "sync", "hotkey", "popup", "note", "template", "search", "queue",
+         "안녕하세요", "클립보드", "붙여넣기", "검색", "설정")
+
+
+class FakeClipboard:
+    """
+    메모리 안의 클립보드 (pyperclip.copy/paste 대체)
+    실제 클립보드가 없는 환경에서 모니터/붙여넣기 경로를 그대로 실행하기 위해 사용
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._lock = threading.Lock()
+
+    def copy(self, text):
+        with self._lock:
+            self._text = str(text)
+
+    def paste(self):
+        with self._lock:
+            return self._text
+
+    def install(self):
+        import pyperclip
+        pyperclip.copy = self.copy
+        pyperclip.paste = self.paste
+        return self
+
+
+def make_history(count, seed=1):
+    """
+    여러 유형이 섞인 히스토리 항목 생성 (모두 서로 다른 내용)
+
+    Returns:
+        (항목 리스트, 복사 시각 리스트) - 오래된 항목부터
+    """
+    rnd = random.Random(seed)
+    now = time.time()
+    items, times = [], []
+    for index in range(count):
+        kind = rnd.random()
+        words = " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(3, 60)))
+        if kind < 0.15:
+            text = f"https://example.com/{rnd.choice(WORDS)}/{index}?q={rnd.randint(0, 999)}"
+        elif kind < 0.30:
+            text = f"def handler_{index}(value):\n    return value * {rnd.randint(2, 999)}  # {words}"
+        elif kind < 0.35:
+            text = f"user{index}@example.com"
+        elif kind < 0.40:
+            text = f"{rnd.randint(0, 10 ** 9)},{index}"
+        else:
+            text = f"{words} #{index}"
+        items.append(text)
+        times.append(now - (count - index) * 60.0)
+    return items, times
+
+
+def write_config(directory, count, seed=1):
+    """히스토리 N개가 저장된 설정 파일 생성"""
+    items, times = make_history(count, seed)
+    with open(os.path.join(directory, CONFIG_FILE), "w", encoding="utf-8") as f:
+        json.dump({"hotkey": DEFAULT_HOTKEY_CONFIG, "history": items, "history_times": times}, f, ensure_ascii=False)
+
+
+def read_rss_kb():
+    """현재 프로세스의 RSS (KB, 측정할 수 없으면 None)"""
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak  # 최대 RSS로 대신함
+    except ImportError:
+        return None
+
+
+def _wait_until(app, predicate, timeout):
+    """Qt 이벤트를 처리하면서 조건이 참이 될 때까지 대기 (시간 초과 시 False)"""
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            return False
+        app.processEvents()
+        time.sleep(0.0005)
+    return True
+
+
+def _emit_result(result):
+    """부모 프로세스로 결과 전달 (앱의 다른 출력과 구분되도록 접두어 사용)"""
+    sys.stdout.write(RESULT_PREFIX + json.dumps(result) + "\n")
+    sys.stdout.flush()
+
+
+# --- 자식 프로세스 측정 ---
+
+def child_cold_start():
+    """ClipboardManagerApp을 실제 순서대로 시작하고 준비 완료까지의 시간 측정"""
+    FakeClipboard().install()
+    from PyQt6.QtCore import QTimer
+    import main as app_main
+    from latency_tracker import latency_tracker
+
+    manager = app_main.ClipboardManagerApp(started_at=_CHILD_STARTED_AT)
+    deadline = time.perf_counter() + READY_TIMEOUT_SEC
+
+    def check_ready():
+        snapshot = latency_tracker.snapshot()
+        done = "startup_to_ready" in snapshot and "startup_to_first_capture" in snapshot
+        if done or time.perf_counter() > deadline:
+            manager.app.quit()
+
+    poll = QTimer()
+    poll.timeout.connect(check_ready)
+    poll.start(5)
+    manager.run()
+    poll.stop()
+
+    snapshot = latency_tracker.snapshot()
+    result = {
+        f"{metric}_ms": snapshot[metric]["mean_ms"]
+        for metric in ("startup_to_tray", "startup_to_first_capture", "startup_to_ready", "popup_build")
+        if metric in snapshot
+    }
+    result["rss_kb"] = read_rss_kb()
+    _emit_result(result)
+    manager.quit_application()
+
+
+def child_size(count, runs, ui_max_items, ingest_clips):
+    """히스토리 N개에 대한 로드 메모리, UI 갱신/검색 시간, 수집 처리량 측정"""
+    clipboard = FakeClipboard().install()
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    import clipboard_monitor
+    from clipboard_monitor import ClipboardMonitorThread
+    from config_manager import load_config
+    from latency_tracker import latency_tracker
+
+    result = {"items": count}
+
+    # 1. 설정 파일 로드 후 메모리
+    gc.collect()
+    rss_before = read_rss_kb()
+    start = time.perf_counter()
+    config = load_config()
+    monitor = ClipboardMonitorThread(
+        config["history"], config.get("history_times"), config.get("usage_scores"), {"max_per_sec": 0, "settle_ms": 0}
+    )
+    result["load_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    del config
+    gc.collect()
+    rss_after = read_rss_kb()
+    result["rss_kb"] = rss_after
+    result["rss_delta_kb"] = None if rss_before is None or rss_after is None else rss_after - rss_before
+
+    # 2. 팝업 카드 갱신 / 검색
+    if count <= ui_max_items:
+        from ui_components import ClipboardHistoryPopup
+        popup = ClipboardHistoryPopup()
+        history = ClipboardMonitorThread.get_history()
+        popup.current_history_items = history
+
+        samples = []
+        for _ in range(runs):
+            popup.filtered_items = list(history)
+            start = time.perf_counter()
+            popup.update_displayed_items()
+            samples.append(time.perf_counter() - start)
+        result["update_displayed_items_ms"] = round(min(samples) * 1000, 3)
+
+        finished = []
+        popup.search_worker.search_finished.connect(lambda *args: finished.append(args))
+        searches = {}
+        for query in SEARCH_QUERIES:
+            samples = []
+            for _ in range(runs):
+                finished.clear()
+                start = time.perf_counter()
+                popup.filter_history(query)
+                if not _wait_until(app, lambda: finished, SEARCH_TIMEOUT_SEC):
+                    samples = []
+                    break
+                samples.append(time.perf_counter() - start)
+            searches[query] = round(min(samples) * 1000, 3) if samples else None
+        result["filter_history_ms"] = searches
+        popup.search_worker.stop()
+        popup.search_worker.wait(1000)
+        popup.deleteLater()
+        app.processEvents()
+
+    # 3. 수집 처리량 (속도 제한/연속 변경 묶기 없이, 폴링 대기 시간을 줄여 처리 시간만 측정)
+    poll_sec = clipboard_monitor.CLIPBOARD_POLL_SEC
+    clipboard_monitor.CLIPBOARD_POLL_SEC = INGEST_POLL_SEC
+    clipboard.copy("")
+    latency_tracker.mark("first_capture")
+    monitor.start()
+    _wait_until(app, lambda: "startup_to_first_capture" in latency_tracker.snapshot(), READY_TIMEOUT_SEC)
+    queue = monitor.ingest_queue
+    start = time.perf_counter()
+    for index in range(ingest_clips):
+        clipboard.copy(f"ingest benchmark clip {index} {WORDS[index % len(WORDS)]}")
+        target = index + 1
+        deadline = time.perf_counter() + READY_TIMEOUT_SEC
+        while queue.captured < target and time.perf_counter() < deadline:
+            time.sleep(0.0001)
+    deadline = time.perf_counter() + READY_TIMEOUT_SEC
+    while queue.released + queue.coalesced + queue.dropped < ingest_clips and time.perf_counter() < deadline:
+        time.sleep(0.0005)
+    elapsed = time.perf_counter() - start
+    monitor.stop()
+    monitor.wait(2000)
+    stats = monitor.ingest_stats()
+    result["ingest_per_sec"] = round(stats["released"] / elapsed, 1) if elapsed > 0 else None
+    result["ingest_batches"] = stats["batches"]
+    result["ingest_coalesced"] = stats["coalesced"]
+
+    # 4. 연속 변경 묶기 (기본 수집 설정과 실제 확인 간격 사용)
+    clipboard_monitor.CLIPBOARD_POLL_SEC = poll_sec
+    clipboard.copy("")
+    monitor = ClipboardMonitorThread(ClipboardMonitorThread.get_history(), ingest_config=DEFAULT_INGEST_CONFIG)
+    monitor.start()
+    time.sleep(poll_sec)
+    for index in range(BURST_CLIPS):
+        if index:
+            time.sleep(BURST_INTERVAL_SEC)
+        clipboard.copy(f"burst benchmark clip {index} {WORDS[index % len(WORDS)]}")
+    last_text = clipboard.paste()
+    deadline = time.perf_counter() + READY_TIMEOUT_SEC
+    while ClipboardMonitorThread.clipboard_history[-1:] != [last_text] and time.perf_counter() < deadline:
+        time.sleep(0.001)
+    monitor.stop()
+    monitor.wait(2000)
+    stats = monitor.ingest_stats()
+    result["ingest_burst"] = {
+        "changes": BURST_CLIPS,
+        "captured": stats["captured"],
+        "coalesced": stats["coalesced"],
+        "recorded": stats["released"],
+        "saves": stats["batches"],
+        "last_recorded": ClipboardMonitorThread.clipboard_history[-1:] == [last_text],
+    }
+    _emit_result(result)
+
+
+# --- 부모 프로세스 ---
+
+def run_child(mode, directory, extra_args=()):
+    """
+    자식 프로세스에서 측정 실행
+
+    Returns:
+        결과 딕셔너리 (실패하면 {"error": ...})
+    """
+    command = [sys.executable, os.path.abspath(__file__), "--child", mode, *map(str, extra_args)]
+    try:
+        completed = subprocess.run(
+            command, cwd=directory, capture_output=True, text=True, timeout=CHILD_TIMEOUT_SEC,
+            env=dict(os.environ),
+        )
+    except subprocess.TimeoutExpired:
+        return {"error": "timeout"}
+    for line in completed.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    tail = (completed.stderr or completed.stdout).strip().splitlines()[-5:]
+    return {"error": f"exit {completed.returncode}: " + " | ".join(tail)}
+
+
+def measure_cold_start(runs):
+    """cold start를 여러 번 측정해 중앙값 반환 (프로세스 생성부터 준비 완료 보고까지의 시간 포함)"""
+    samples = []
+    errors = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as directory:
+            write_config(directory, COLD_START_ITEMS)
+            start = time.perf_counter()
+            result = run_child("cold_start", directory)
+            if "error" in result:
+                errors.append(result["error"])
+                continue
+            result["spawn_to_ready_ms"] = round((time.perf_counter() - start) * 1000, 3)
+            samples.append(result)
+    if not samples:
+        return {"error": errors[-1] if errors else "no runs"}
+    summary = {}
+    for key in samples[0]:
+        values = [sample[key] for sample in samples if sample.get(key) is not None]
+        summary[key] = round(statistics.median(values), 3) if values else None
+    return summary
+
+
+def measure_size(count, runs, ui_max_items, ingest_clips):
+    with tempfile.TemporaryDirectory() as directory:
+        write_config(directory, count)
+        return run_child("size", directory, ("--items", count, "--runs", runs,
+                                             "--ui-max-items", ui_max_items, "--ingest-clips", ingest_clips))
+
+
+def flatten_metrics(result, prefix=""):
+    """중첩된 결과에서 숫자 지표만 "a.b.c" 형식 키로 추출"""
+    metrics = {}
+    for key, value in result.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            metrics.update(flatten_metrics(value, name + "."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            metrics[name] = value
+    return metrics
+
+
+def _is_compared(name):
+    """회귀 비교 대상 지표 (시간, 메모리, 처리량)"""
+    return name.endswith(("_ms", "_kb", "_per_sec")) and not name.startswith("meta.")
+
+
+def find_regressions(current, baseline, threshold):
+    """
+    기준 결과와 비교해 나빠진 지표 찾기
+
+    Returns:
+        (지표 이름, 기준값, 현재값, 변화율) 리스트
+    """
+    now, before = flatten_metrics(current), flatten_metrics(baseline)
+    regressions = []
+    for name, old in before.items():
+        new = now.get(name)
+        if new is None or not _is_compared(name) or old <= 0:
+            continue
+        change = (new - old) / old
+        worse = change < -threshold if name.endswith("_per_sec") else change > threshold
+        if worse:
+            regressions.append((name, old, new, round(change, 3)))
+    return regressions
+
+
+def _iter_errors(result, prefix=""):
+    """측정에 실패한 항목 (이름, 오류 메시지)"""
+    for key, value in result.items():
+        if isinstance(value, dict):
+            if "error" in value:
+                yield f"{prefix}{key}", value["error"]
+            else:
+                yield from _iter_errors(value, f"{prefix}{key}.")
+
+
+def run_suite(sizes, runs, ui_max_items, ingest_clips):
+    result = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "qt_platform": os.environ.get("QT_QPA_PLATFORM"),
+            "sizes": list(sizes),
+            "runs": runs,
+            "ingest_clips": ingest_clips,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "cold_start": measure_cold_start(runs),
+        "sizes": {},
+    }
+    for count in sizes:
+        print(f"히스토리 {count}개 측정 중...", file=sys.stderr)
+        result["sizes"][str(count)] = measure_size(count, runs, ui_max_items, ingest_clips)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="UniPaste 시작 시간/메모리 벤치마크")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="히스토리 항목 수 목록 (쉼표 구분)")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="측정 반복 횟수")
+    parser.add_argument("--ui-max-items", type=int, default=DEFAULT_UI_MAX_ITEMS, help="UI 측정을 수행할 최대 항목 수")
+    parser.add_argument("--ingest-clips", type=int, default=DEFAULT_INGEST_CLIPS, help="수집 처리량 측정에 사용할 항목 수")
+    parser.add_argument("--output", metavar="FILE", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", metavar="FILE", help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="회귀로 판단할 변화율 (0.2 = 20%%)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--items", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child == "cold_start":
+        child_cold_start()
+        os._exit(0)  # 남은 Qt 스레드 정리를 기다리지 않음 (결과는 이미 전달됨)
+    if args.child == "size":
+        child_size(args.items, max(args.runs, 1), args.ui_max_items, args.ingest_clips)
+        os._exit(0)
+
+    sizes = [int(value) for value in args.sizes.split(",") if value.strip()]
+    result = run_suite(sizes, max(args.runs, 1), args.ui_max_items, args.ingest_clips)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    else:
+        for name, value in flatten_metrics(result).items():
+            print(f"{name:>48}: {value}")
+        for name, error in _iter_errors(result):
+            print(f"{name:>48}: 실패 ({error})")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = find_regressions(result, baseline, args.threshold)
+        for name, old, new, change in regressions:
+            print(f"회귀: {name} {old} -> {new} ({change:+.1%})")
+        if regressions:
+            return 1
+        print(f"회귀 없음 (기준 {args.baseline}, 허용 {args.threshold:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,66 @@
+import collections
+import hashlib
 import threading
 import time
 import pyperclip
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from config_manager import load_config, save_config, MAX_HISTORY_ITEMS
+from ingest_queue import IngestQueue
+from latency_tracker import latency_tracker
+from app_logging import get_logger, redact
+from metrics import metrics
+from usage_ranker import UsageRanker
+
+log = get_logger(__name__)
+
+CLIPS_INGESTED = metrics.counter("unipaste_clips_ingested_total", "History items added", ("source",))
+DEDUPE_HITS = metrics.counter("unipaste_dedupe_hits_total", "Copied items already in history (moved to the top)")
+EVICTIONS = metrics.counter("unipaste_history_evictions_total", "Oldest items dropped at the history limit")
+HISTORY_SAVE_SECONDS = metrics.summary("unipaste_history_save_seconds", "Time to write history to the config file")
+
+SELF_WRITE_TTL_SEC = 3.0  # 앱이 직접 쓴 클립보드 내용을 자체 출처로 인정하는 시간
+CLIPBOARD_POLL_SEC = 0.5  # 클립보드 확인 간격
+CLIPBOARD_BURST_POLL_SEC = 0.05  # 기록 대기 중인 항목이 있을 때(연속 변경 중)의 확인 간격
+
+CODE_PREFIXES = ('{"', '[{', '<?xml', '<html', '<!DOCTYPE', 'function', 'class', 'def ', 'import ', 'from ')
+LINK_PREFIXES = ('http://', 'https://', 'www.')
+
+def detect_clip_type(text):
+    """
+    클립보드 항목 유형 판별 함수
+    
+    Args:
+        text: 항목 텍스트
+    
+    Returns:
+        "link", "code", "email", "number", "text" 중 하나
+    """
+    if text.startswith(LINK_PREFIXES):
+        return "link"
+    elif text.startswith(CODE_PREFIXES):
+        return "code"
+    elif '@' in text and '.' in text.split('@')[1]:
+        return "email"
+    elif all(c.isdigit() or c in ',.+-*/() ' for c in text.strip()) and any(c.isdigit() for c in text):
+        return "number"
+    return "text"
+
+def make_clip_meta(text, timestamp):
+    """
+    검색에 사용할 항목 메타데이터 생성 함수 (유형, 복사 시각, 마지막 사용 시각, 길이)
+    
+    Args:
+        text: 항목 텍스트
+        timestamp: 복사 시각 (time.time() 기준)
+    """
+    return {"type": detect_clip_type(text), "time": timestamp, "last_used": timestamp, "length": len(text)}
+
+def clip_digest(text):
+    """
+    클립보드 항목의 고정 길이 다이제스트 반환 함수 (원문을 보관하지 않고 비교할 때 사용)
+    """
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
 
 class ClipboardMonitorThread(QThread):
     """
@@ -11,71 +68,144 @@ class ClipboardMonitorThread(QThread):
     """
     new_clipboard_item = pyqtSignal(str)
     clipboard_history = []
+    clipboard_meta = {}  # 항목 텍스트 -> 메타데이터 (유형, 시각, 길이)
+    _self_writes = {}  # 앱이 직접 쓴 내용의 다이제스트 -> 만료 시각 (time.monotonic 기준)
+    usage_ranker = UsageRanker()  # 붙여넣기 사용 빈도 순위 ("자주 쓰는 항목" 탭)
+    history_listeners = []  # 히스토리 변경 시 호출할 함수 목록 (added, timestamp, removed), 잠금을 보유한 채 호출됨
     _running = True
     _lock = threading.Lock()
 
-    def __init__(self, initial_history):
+    def __init__(self, initial_history, initial_times=None, initial_usage=None, ingest_config=None):
         """
         초기화 함수
         
         Args:
             initial_history: 초기 클립보드 히스토리 리스트
+            initial_times: 히스토리와 같은 순서의 복사 시각 리스트 (없으면 현재 시각 사용)
+            initial_usage: 저장된 사용 빈도 데이터 (UsageRanker.to_dict() 형식)
+            ingest_config: 수집 속도 제한 설정 (config_manager.DEFAULT_INGEST_CONFIG 형식)
         """
         super().__init__()
         ClipboardMonitorThread.clipboard_history = list(initial_history)
+        ClipboardMonitorThread._rebuild_meta(initial_times)
+        ClipboardMonitorThread.usage_ranker = UsageRanker.from_dict(
+            initial_usage, set(ClipboardMonitorThread.clipboard_history)
+        )
         self._last_copied_text = None
-        try:
-            self._last_copied_text = pyperclip.paste()
-        except pyperclip.PyperclipException:
-            self._last_copied_text = ""
+        self.paused = False  # True이면 클립보드 변경을 기록하지 않음
+        self.on_ingest = None  # 새 로컬 항목 기록 후 호출할 함수 (text, timestamp), 모니터 스레드에서 호출됨
+        self.on_remote_rejected = None  # 히스토리에 넣지 못한 원격 항목마다 호출할 함수 (text, timestamp), 모니터 스레드에서 호출됨
+        self.ingest_queue = IngestQueue.from_config(ingest_config)
+        self.ingest_batches = 0  # 한 번에 기록/저장한 묶음 수 (저장 횟수와 같음)
+        self._remote_pending = collections.deque()  # 동기화로 받아 아직 기록하지 않은 (텍스트, 복사 시각, 클립보드 복사 여부)
+        self._wake_event = threading.Event()  # 원격 항목이 들어오면 대기 중인 모니터 스레드를 깨움
 
     def run(self):
         """
         스레드 실행 함수
         클립보드 내용 변경을 모니터링하고 변경 시 저장
         """
+        # 시작 시점의 클립보드 내용은 기록하지 않음 (GUI 스레드의 시작 경로를 막지 않도록 여기서 읽음)
+        try:
+            self._last_copied_text = pyperclip.paste()
+        except pyperclip.PyperclipException:
+            self._last_copied_text = ""
+        latency_tracker.record_since("first_capture", "startup_to_first_capture", clear=True)
+        
         while self._running:
+            self._wake_event.clear()
+            if self._remote_pending:
+                try:
+                    self._ingest_remote_batch(self._take_remote_items())
+                except Exception as e:
+                    log.error("동기화 항목 기록 오류: %s", e)
             try:
                 current_text = pyperclip.paste()
-                if isinstance(current_text, str) and current_text != self._last_copied_text and current_text.strip():
+                if self.paused:
+                    # 일시 정지 중 복사된 내용은 재개 후에도 기록하지 않음
+                    self._last_copied_text = current_text
+                elif isinstance(current_text, str) and current_text != self._last_copied_text and current_text.strip():
                     # 현재 클립보드 내용이 변경되었고 유효한 경우
                     self._last_copied_text = current_text  # 먼저 마지막 복사된 텍스트 업데이트
                     
-                    # 중복 확인 및 히스토리에 추가
-                    with self._lock:
-                        # 이미 있는 항목이면 제거하고 맨 뒤로 이동
-                        if current_text in ClipboardMonitorThread.clipboard_history:
-                            ClipboardMonitorThread.clipboard_history.remove(current_text)
-                        
-                        # 최대 항목 수 제한
-                        if len(ClipboardMonitorThread.clipboard_history) >= MAX_HISTORY_ITEMS:
-                            ClipboardMonitorThread.clipboard_history.pop(0)
-                        
-                        # 새 항목 추가
-                        ClipboardMonitorThread.clipboard_history.append(current_text)
-                        
-                        # 설정 파일에 저장
-                        config_data = load_config()
-                        config_data["history"] = list(ClipboardMonitorThread.clipboard_history)
-                        save_config(config_data)
-                    
-                    # 변경 이벤트 발생 - 항상 발생하여 UI가 업데이트되도록 함
-                    print(f"클립보드 변경 감지: {current_text[:30]}...")
-                    self.new_clipboard_item.emit(current_text)
+                    # 앱이 직접 쓴 내용(히스토리에서 붙여넣기)이면 전체 처리 없이 사용 시각만 갱신
+                    if ClipboardMonitorThread._self_writes and ClipboardMonitorThread._consume_self_write(current_text):
+                        ClipboardMonitorThread.touch_item(current_text)
+                    else:
+                        self.ingest_queue.offer(current_text, time.time())
+                
+                # 허용 속도 안에서 대기 중인 항목을 한 번에 기록
+                batch = self.ingest_queue.drain()
+                if batch:
+                    self._ingest_batch(batch)
             except pyperclip.PyperclipException:
                 pass
             except Exception as e:
                 # 로깅 추가
-                print(f"클립보드 모니터링 오류: {e}")
-            time.sleep(0.5)
-        print("ClipboardMonitorThread: 중지됨.")
+                log.error("클립보드 모니터링 오류: %s", e)
+            delay = self.ingest_queue.next_delay()
+            # 대기 중인 항목이 있으면 연속 변경의 중간 항목도 감지해 묶을 수 있도록 짧은 간격으로 확인
+            self._wake_event.wait(CLIPBOARD_POLL_SEC if delay is None else min(CLIPBOARD_BURST_POLL_SEC, delay))
+        log.info("ClipboardMonitorThread: 중지됨.")
+
+    def _ingest_batch(self, batch):
+        """
+        수집 대기열에서 꺼낸 항목들을 히스토리에 기록 (설정 파일 저장과 UI 알림은 묶음당 한 번)
+        
+        Args:
+            batch: (텍스트, 복사 시각) 리스트 (오래된 순서)
+        """
+        with self._lock:
+            history = ClipboardMonitorThread.clipboard_history
+            meta = ClipboardMonitorThread.clipboard_meta
+            for text, copied_at in batch:
+                # 이미 있는 항목이면 제거하고 맨 뒤로 이동
+                if text in history:
+                    history.remove(text)
+                    DEDUPE_HITS.inc()
+                
+                # 최대 항목 수 제한
+                evicted = None
+                if len(history) >= MAX_HISTORY_ITEMS:
+                    evicted = history.pop(0)
+                    meta.pop(evicted, None)
+                    ClipboardMonitorThread.usage_ranker.forget(evicted)
+                
+                # 새 항목 추가
+                history.append(text)
+                meta[text] = make_clip_meta(text, copied_at)
+                ClipboardMonitorThread._notify_history(text, copied_at, evicted)
+            
+            # 설정 파일에 저장
+            ClipboardMonitorThread._save_history()
+        self.ingest_batches += 1
+        CLIPS_INGESTED.inc(len(batch), source="local")
+        
+        # 동기화 등 다른 기기로 전달 (원격 항목은 자체 출처로 처리되어 여기까지 오지 않음)
+        if self.on_ingest is not None:
+            for text, copied_at in batch:
+                self.on_ingest(text, copied_at)
+        
+        # 변경 이벤트는 묶음당 한 번 (가장 최근 항목)
+        latest = batch[-1][0]
+        log.debug("클립보드 변경 감지: %s (%s개)", redact(latest), len(batch))
+        self.new_clipboard_item.emit(latest)
+
+    def ingest_stats(self):
+        """
+        수집 대기열 통계 (감지/건너뜀/버림/기록 항목 수, 저장 횟수)
+        """
+        stats = self.ingest_queue.stats()
+        stats["batches"] = self.ingest_batches
+        return stats
 
     def stop(self):
         """
         스레드 정지 함수
         """
-        print("ClipboardMonitorThread: stop() 호출됨.")
+        log.info("ClipboardMonitorThread: stop() 호출됨.")
         self._running = False
+        self._wake_event.set()
 
     @staticmethod
     def get_history():
@@ -87,23 +217,262 @@ class ClipboardMonitorThread(QThread):
         """
         with ClipboardMonitorThread._lock:
             history = list(ClipboardMonitorThread.clipboard_history)
-            print(f"클립보드 히스토리 가져오기: {len(history)}개 항목")
+            log.debug("클립보드 히스토리 가져오기: %s개 항목", len(history))
             
             # 설정 파일에서 히스토리 재로드(히스토리가 비어있을 경우)
             if not history:
                 try:
                     config_data = load_config()
                     if "history" in config_data and config_data["history"]:
-                        print("설정 파일에서 히스토리 복원 시도")
+                        log.info("설정 파일에서 히스토리 복원 시도")
                         history = list(config_data["history"])
                         # 히스토리 복원
                         ClipboardMonitorThread.clipboard_history = history
-                        print(f"설정 파일에서 {len(history)}개 항목 복원됨")
+                        ClipboardMonitorThread._rebuild_meta(config_data.get("history_times"))
+                        log.info("설정 파일에서 %s개 항목 복원됨", len(history))
                 except Exception as e:
-                    print(f"히스토리 복원 중 오류: {e}")
+                    log.error("히스토리 복원 중 오류: %s", e)
             
             return history
 
+    @staticmethod
+    def mark_self_write(item_text):
+        """
+        앱이 곧 클립보드에 쓸 내용을 자체 출처로 등록 (모니터가 다시 수집하지 않도록 함)
+        
+        Args:
+            item_text: 클립보드에 쓸 텍스트
+        """
+        now = time.monotonic()
+        digest = clip_digest(item_text)
+        with ClipboardMonitorThread._lock:
+            registry = ClipboardMonitorThread._self_writes
+            for expired in [d for d, expiry in registry.items() if expiry < now]:
+                del registry[expired]
+            registry[digest] = now + SELF_WRITE_TTL_SEC
+
+    @staticmethod
+    def _consume_self_write(item_text):
+        """
+        자체 출처로 등록된 내용인지 확인하고 등록 해제
+        
+        Returns:
+            만료되지 않은 자체 출처 내용이면 True
+        """
+        digest = clip_digest(item_text)
+        with ClipboardMonitorThread._lock:
+            expiry = ClipboardMonitorThread._self_writes.pop(digest, None)
+        return expiry is not None and expiry >= time.monotonic()
+
+    @staticmethod
+    def touch_item(item_text):
+        """
+        항목의 마지막 사용 시각만 갱신 (O(1), 히스토리 순서 변경이나 파일 저장 없음)
+        """
+        meta = ClipboardMonitorThread.clipboard_meta.get(item_text)
+        if meta is not None:
+            meta["last_used"] = time.time()
+
+    @staticmethod
+    def record_use(item_text):
+        """
+        히스토리 항목을 붙여넣은 사용 기록 (마지막 사용 시각과 사용 빈도 갱신)
+        사용 빈도는 다음 히스토리 저장 시 함께 저장됨
+        
+        Args:
+            item_text: 붙여넣은 항목 텍스트 (히스토리에 없는 항목은 무시)
+        """
+        if item_text not in ClipboardMonitorThread.clipboard_meta:
+            return
+        ClipboardMonitorThread.touch_item(item_text)
+        ClipboardMonitorThread.usage_ranker.record(item_text)
+
+    @staticmethod
+    def get_frequent_items(limit=None):
+        """
+        사용 빈도가 높은 순서의 히스토리 항목 리스트 반환 함수
+        
+        Args:
+            limit: 최대 항목 수 (기본값: usage_ranker.USAGE_TOP_N)
+        """
+        ranker = ClipboardMonitorThread.usage_ranker
+        return ranker.top_n() if limit is None else ranker.top_n(limit)
+
+    @staticmethod
+    def save_usage():
+        """
+        사용 빈도 데이터만 설정 파일에 저장 (종료 시 호출)
+        """
+        with ClipboardMonitorThread._lock:
+            config_data = load_config()
+            config_data["usage_scores"] = ClipboardMonitorThread.usage_ranker.to_dict()
+            save_config(config_data)
+
+    @staticmethod
+    def search_meta():
+        """
+        검색 스레드용 메타데이터 딕셔너리 복사본 반환 (search_query.QueryPlan.match_meta 형식)
+        """
+        with ClipboardMonitorThread._lock:
+            return {text: dict(meta) for text, meta in ClipboardMonitorThread.clipboard_meta.items()}
+
+    @staticmethod
+    def get_meta(item_text):
+        """
+        항목 메타데이터 반환 함수 (히스토리에 없는 항목이면 None)
+        """
+        return ClipboardMonitorThread.clipboard_meta.get(item_text)
+
+    @staticmethod
+    def _rebuild_meta(times):
+        """
+        현재 히스토리에 대한 메타데이터 재구성 (잠금을 보유한 상태에서 호출)
+        
+        Args:
+            times: 히스토리와 같은 순서의 복사 시각 리스트 또는 None
+        """
+        history = ClipboardMonitorThread.clipboard_history
+        if not isinstance(times, list) or len(times) != len(history):
+            times = [time.time()] * len(history)
+        ClipboardMonitorThread.clipboard_meta = {
+            text: make_clip_meta(text, timestamp) for text, timestamp in zip(history, times)
+        }
+
+    @staticmethod
+    def _store_history(config_data):
+        """
+        히스토리와 복사 시각을 설정 데이터에 기록 (잠금을 보유한 상태에서 호출)
+        """
+        history = ClipboardMonitorThread.clipboard_history
+        meta = ClipboardMonitorThread.clipboard_meta
+        now = time.time()
+        config_data["history"] = list(history)
+        config_data["history_times"] = [meta[text]["time"] if text in meta else now for text in history]
+        config_data["usage_scores"] = ClipboardMonitorThread.usage_ranker.to_dict()
+
+    @staticmethod
+    def _save_history():
+        """히스토리를 설정 파일에 저장 (잠금을 보유한 상태에서 호출)"""
+        with HISTORY_SAVE_SECONDS.time():
+            config_data = load_config()
+            ClipboardMonitorThread._store_history(config_data)
+            save_config(config_data)
+
+    @staticmethod
+    def history_bytes():
+        """히스토리 전체 크기 (UTF-8 바이트, 지표용)"""
+        with ClipboardMonitorThread._lock:
+            return sum(len(text.encode("utf-8", "surrogatepass")) for text in ClipboardMonitorThread.clipboard_history)
+
+    @staticmethod
+    def _notify_history(added=None, timestamp=None, removed=None):
+        """히스토리 변경 알림 (잠금을 보유한 상태에서 호출)"""
+        if removed is not None:
+            EVICTIONS.inc()
+        for listener in ClipboardMonitorThread.history_listeners:
+            try:
+                listener(added, timestamp, removed)
+            except Exception as e:
+                log.error("히스토리 변경 알림 오류: %s", e)
+
+    def queue_remote_item(self, item_text, timestamp, set_clipboard=True):
+        """
+        다른 기기에서 동기화된 항목을 기록 대기열에 추가 (어느 스레드에서나 호출 가능)
+        모니터 스레드가 대기 중인 항목을 한 번에 기록하고 설정 파일은 묶음당 한 번만 저장함
+        
+        Args:
+            item_text: 항목 텍스트
+            timestamp: 원래 기기에서 복사된 시각
+            set_clipboard: 이 기기의 클립보드에도 복사할지 여부
+        """
+        if not item_text:
+            return
+        self._remote_pending.append((item_text, timestamp, set_clipboard))
+        self._wake_event.set()
+
+    def _take_remote_items(self):
+        """대기 중인 원격 항목을 모두 꺼냄 (받은 순서)"""
+        items = []
+        pending = self._remote_pending
+        while pending:
+            items.append(pending.popleft())
+        return items
+
+    def _ingest_remote_batch(self, items):
+        """
+        동기화로 받은 항목들을 히스토리에 기록 (다시 전송되지 않도록 자체 출처로 등록)
+        설정 파일 저장과 UI 알림은 묶음당 한 번이며, 클립보드에는 마지막으로 받은 항목만 복사함
+        
+        Args:
+            items: (텍스트, 복사 시각, 클립보드 복사 여부) 리스트
+        
+        Returns:
+            히스토리에 추가된 항목 수
+        """
+        added = []
+        rejected = []  # 가장 오래된 항목보다 오래되어 넣지 못한 항목
+        with self._lock:
+            meta = ClipboardMonitorThread.clipboard_meta
+            for item_text, timestamp, set_clipboard in items:
+                if ClipboardMonitorThread._insert_remote_item(item_text, timestamp):
+                    added.append((item_text, set_clipboard))
+                elif item_text not in meta:
+                    rejected.append((item_text, timestamp))
+            if added:
+                ClipboardMonitorThread._save_history()
+        if self.on_remote_rejected is not None:
+            for item_text, timestamp in rejected:
+                self.on_remote_rejected(item_text, timestamp)
+        if not added:
+            return 0
+        self.ingest_batches += 1
+        CLIPS_INGESTED.inc(len(added), source="remote")
+        
+        latest, set_clipboard = added[-1]
+        if set_clipboard:
+            ClipboardMonitorThread.mark_self_write(latest)
+            try:
+                pyperclip.copy(latest)
+            except pyperclip.PyperclipException as e:
+                log.error("동기화 항목 클립보드 복사 오류: %s", e)
+        log.debug("동기화 항목 수신: %s (%s개)", redact(latest), len(added))
+        self.new_clipboard_item.emit(latest)
+        return len(added)
+
+    @staticmethod
+    def _insert_remote_item(item_text, timestamp):
+        """
+        동기화된 항목 하나를 히스토리에 넣음 (잠금을 보유한 상태에서 호출, 저장하지 않음)
+        재연결 동기화로 받은 이전 항목은 복사 시각 순서에 맞는 위치에 들어감
+        
+        Returns:
+            히스토리에 추가되었으면 True (이미 더 최근 항목이 있거나 가장 오래된 항목보다 오래되어 바로 밀려나는 경우 False)
+        """
+        history = ClipboardMonitorThread.clipboard_history
+        meta = ClipboardMonitorThread.clipboard_meta
+        existing = meta.get(item_text)
+        if existing is not None and existing["time"] >= timestamp:
+            return False  # 이미 같거나 더 최근에 복사된 항목
+        if item_text in history:
+            history.remove(item_text)
+            DEDUPE_HITS.inc()
+        # 복사 시각 순서 위치 찾기 (대부분 맨 뒤이므로 뒤에서부터 탐색)
+        index = len(history)
+        while index > 0 and history[index - 1] in meta and meta[history[index - 1]]["time"] > timestamp:
+            index -= 1
+        evicted = None
+        if len(history) >= MAX_HISTORY_ITEMS:
+            if index == 0:
+                return False
+            evicted = history.pop(0)
+            meta.pop(evicted, None)
+            ClipboardMonitorThread.usage_ranker.forget(evicted)
+            index -= 1
+        history.insert(index, item_text)
+        meta[item_text] = make_clip_meta(item_text, timestamp)
+        ClipboardMonitorThread._notify_history(item_text, timestamp, evicted)
+        return True
+
     @staticmethod
     def add_item_manually(item_text, set_clipboard=True):
         """
@@ -119,6 +488,19 @@ class ClipboardMonitorThread(QThread):
             with ClipboardMonitorThread._lock:
                 if item_text in ClipboardMonitorThread.clipboard_history:
                     ClipboardMonitorThread.clipboard_history.remove(item_text)
+                    DEDUPE_HITS.inc()
+                added_at = time.time()
                 ClipboardMonitorThread.clipboard_history.append(item_text)
+                ClipboardMonitorThread.clipboard_meta[item_text] = make_clip_meta(item_text, added_at)
+                evicted = None
                 if len(ClipboardMonitorThread.clipboard_history) > MAX_HISTORY_ITEMS:
-                    ClipboardMonitorThread.clipboard_history.pop(0) 
\ No newline at end of file
+                    evicted = ClipboardMonitorThread.clipboard_history.pop(0)
+                    ClipboardMonitorThread.clipboard_meta.pop(evicted, None)
+                    ClipboardMonitorThread.usage_ranker.forget(evicted)
+                ClipboardMonitorThread._notify_history(item_text, added_at, evicted)
+            CLIPS_INGESTED.inc(source="manual")
+
+
+metrics.gauge("unipaste_history_items", "Items currently in history",
+              func=lambda: len(ClipboardMonitorThread.clipboard_history))
+metrics.gauge("unipaste_history_bytes", "Total UTF-8 size of history items", func=ClipboardMonitorThread.history_bytes)
@@ -1,5 +1,10 @@
 import os
 import json
+import copy
+
+from app_logging import get_logger
+
+log = get_logger(__name__)
 
 # --- 설정 파일 관련 상수 ---
 CONFIG_FILE = "clipboard_manager_config.json"
@@ -7,6 +12,101 @@ DEFAULT_HOTKEY_CONFIG = {"modifiers": ["ctrl_l", "shift_l"], "key": "v"}
 MAX_HISTORY_ITEMS = 50
 CLIP_PREVIEW_MAX_LEN = 120 # 미리보기 길이 증가
 
+# 붙여넣기 단계별 대기 시간 설정 (밀리초)
+DEFAULT_PASTE_CONFIG = {
+    "hide_timeout_ms": 300,   # 팝업이 숨겨질 때까지 최대 대기 시간
+    "focus_timeout_ms": 150,  # 이전 앱으로 포커스가 돌아올 때까지 최대 대기 시간
+    "focus_poll_ms": 5,       # 포커스 복귀 확인 간격
+    "key_interval_ms": 5,     # 개별 키 입력 사이 간격 (SendInput은 한 번에 전송)
+    "clipboard_retries": 5,   # Qt 클립보드 쓰기 재시도 횟수 (이후 pyperclip 사용)
+    "clipboard_retry_ms": 20, # 쓰기 확인(read-back/dataChanged)을 기다리는 시간
+    "release_timeout_ms": 1000, # 빠른 붙여넣기 단축키의 수정자 키가 떼어질 때까지 최대 대기 시간
+}
+
+# 단축키로 실행할 수 있는 동작
+HOTKEY_ACTIONS = ("open_popup", "paste_recent", "open_frequent", "open_settings", "toggle_monitoring")
+
+# 추가 단축키 목록 기본값 (팝업 열기 단축키는 "hotkey" 설정 사용)
+# 예: {"modifiers": ["ctrl_l", "alt_l"], "key": "s", "action": "open_settings"}
+# 연속 단축키 예: {"sequence": [{"modifiers": ["ctrl_l", "shift_l"], "key": "v"}, {"key": "3"}],
+#                  "action": "paste_recent", "arg": 3}  (단계별 "timeout_ms"로 대기 시간 지정 가능)
+# "enabled": false인 단축키는 등록하지 않음
+# 기본값: Ctrl+Alt+1~9로 N번째 최근 항목을 팝업 없이 바로 붙여넣기 (꺼진 상태로 제공)
+# Windows의 유럽 자판 등에서는 AltGr이 Ctrl+Alt로 전달되어 AltGr+숫자로 입력하는 문자({, [, @ 등)와 겹치므로
+# 사용하려면 "enabled"를 true로 바꿀 것
+DEFAULT_BINDINGS = [
+    {"modifiers": ["ctrl_l", "alt_l"], "key": str(n), "action": "paste_recent", "arg": n, "enabled": False}
+    for n in range(1, 10)
+]
+
+# 이메일 템플릿 기본값 ({name}, {date}, {time}, {clipboard} 치환자 사용 가능)
+DEFAULT_EMAIL_TEMPLATES = [
+    {
+        "id": "default_greeting",
+        "title": "기본 인사",
+        "body": "안녕하세요, {name}입니다.\n\n{clipboard}\n\n감사합니다.\n{name} 드림 ({date})",
+    },
+]
+
+# LAN 클립보드 동기화 기본값 (sync_service.py)
+DEFAULT_SYNC_CONFIG = {
+    "enabled": False,
+    "port": 48650,
+    "host": "127.0.0.1",        # 수신 대기 주소 (다른 기기의 연결을 받으려면 이 기기의 LAN 주소 또는 "0.0.0.0")
+    "peers": [],                # 연결할 다른 기기 주소 ("192.168.0.10:48650")
+    "secret": "",               # 기기 간 공유 비밀값 (필수, 같은 값을 쓰는 기기끼리만 연결)
+    "name": "",                 # 다른 기기에 표시될 이 기기의 이름
+    "apply_to_clipboard": True, # 받은 항목을 이 기기의 클립보드에도 복사
+}
+
+# 클립보드 수집 속도 제한 기본값 (ingest_queue.py)
+# 스크립트 등이 클립보드를 빠르게 바꾸면 연속 변경/허용 속도를 넘는 중간 항목은 건너뛰고 가장 최근 항목만 기록
+DEFAULT_INGEST_CONFIG = {
+    "max_per_sec": 20,   # 초당 기록할 수 있는 항목 수 (0이면 제한 없음)
+    "burst": 10,         # 한꺼번에 기록할 수 있는 항목 수
+    "queue_size": 64,    # 수집 대기열 최대 길이
+    "settle_ms": 150,    # 이 시간 안에 다시 바뀌면 연속 변경으로 보고 마지막 내용만 기록 (0이면 묶지 않음)
+    "max_wait_ms": 1000, # 연속 변경이 계속되어도 이 시간마다 가장 최근 내용을 기록
+}
+
+# 로그 기본 설정 (환경 변수 UNIPASTE_LOG_LEVEL이 있으면 level보다 우선)
+DEFAULT_LOGGING_CONFIG = {
+    "level": "INFO",              # 콘솔에 출력하는 로그 수준: DEBUG, INFO, WARNING, ERROR
+    "ring_level": "DEBUG",        # 메모리에 보관하는 최근 로그의 수준 (level보다 낮으면 출력되지 않는 로그도 보관)
+    "show_clip_contents": False,  # True면 항목 내용 앞부분을 로그에 표시 (기본: 길이와 해시만)
+    "show_peer_addresses": False, # True면 동기화 피어 주소를 로그에 표시 (기본: 해시만)
+    "ring_size": 1000,            # 메모리에 보관하는 최근 로그 수 (지연 시간 통계 메뉴에서 파일로 저장)
+}
+
+# 지표 내보내기 기본 설정 (Prometheus 텍스트 형식)
+DEFAULT_METRICS_CONFIG = {
+    "enabled": False,    # True면 아래 주소로 지표를 내보냄 (지표 파일은 지연 시간 통계 메뉴에서 항상 저장)
+    "port": 9464,        # 127.0.0.1에서 여는 HTTP 포트 (0이면 사용하지 않음)
+    "unix_socket": "",   # Unix 소켓 경로 (Windows에서는 무시)
+}
+
+# 설정 파일에 없을 때 채워 넣는 기본 설정값
+DEFAULT_SETTINGS = {
+    "prewarm_popup": True,  # 팝업 내용을 백그라운드에서 미리 준비하여 단축키 응답 속도 향상
+    "paste": DEFAULT_PASTE_CONFIG,
+    "email_templates": DEFAULT_EMAIL_TEMPLATES,
+    "template_variables": {"name": ""},  # 템플릿의 사용자 변수 값
+    "bindings": DEFAULT_BINDINGS,
+    "sync": DEFAULT_SYNC_CONFIG,
+    "ingest": DEFAULT_INGEST_CONFIG,
+    "logging": DEFAULT_LOGGING_CONFIG,
+    "metrics": DEFAULT_METRICS_CONFIG,
+}
+
+def _apply_default_settings(config):
+    """
+    설정에 누락된 기본 설정값을 채워 넣는 함수
+    """
+    for key, value in DEFAULT_SETTINGS.items():
+        if key not in config:
+            config[key] = copy.deepcopy(value)
+    return config
+
 def load_config():
     """
     설정 파일을 로드하는 함수
@@ -20,10 +120,10 @@ def load_config():
                     config["hotkey"] = DEFAULT_HOTKEY_CONFIG.copy()
                 if "history" not in config:
                     config["history"] = []
-                return config
+                return _apply_default_settings(config)
         except json.JSONDecodeError:
-            print(f"Error decoding {CONFIG_FILE}, using defaults.")
-    return {"hotkey": DEFAULT_HOTKEY_CONFIG.copy(), "history": []}
+            log.warning("Error decoding %s, using defaults.", CONFIG_FILE)
+    return _apply_default_settings({"hotkey": DEFAULT_HOTKEY_CONFIG.copy(), "history": []})
 
 def save_config(config_data):
     """
@@ -33,7 +133,7 @@ def save_config(config_data):
         with open(CONFIG_FILE, "w", encoding="utf-8") as f:
             json.dump(config_data, f, indent=4, ensure_ascii=False)
     except Exception as e:
-        print(f"Error saving config to {CONFIG_FILE}: {e}")
+        log.error("Error saving config to %s: %s", CONFIG_FILE, e)
 
 def format_hotkey_for_display(config):
     """
@@ -2,253 +2,257 @@ import sys
 from PyQt6.QtCore import QThread, pyqtSignal, pyqtSlot
 from pynput import keyboard
 from pynput.keyboard import Key, KeyCode, Controller
-from config_manager import format_hotkey_for_display
+from config_manager import format_hotkey_for_display, HOTKEY_ACTIONS
+from hotkey_matcher import HotkeyMatcher, build_bindings
+from latency_tracker import latency_tracker
+from app_logging import get_logger
+from metrics import metrics
+import queue
+import threading
 import time
 
+log = get_logger(__name__)
+
+LISTENER_RESTARTS = metrics.counter("unipaste_listener_restarts_total", "Keyboard listener restarts after it stopped unexpectedly")
+
+# --- 리스너 감시 관련 상수 ---
+LISTENER_MAX_RESTARTS = 5          # 연속 재시작 최대 횟수
+LISTENER_RESTART_BACKOFF_SEC = 0.5 # 재시작 대기 시간 (연속 실패 횟수만큼 늘어남)
+LISTENER_STABLE_SEC = 60.0         # 이 시간 이상 동작한 뒤 종료되면 연속 실패 횟수 초기화
+BACKSPACE_DELAY_SEC = 0.01         # 단축키 인식 후 백스페이스를 보내기 전 대기 시간
+HOOK_LATENCY_SAMPLE_INTERVAL = 64  # 단축키가 아닌 키는 이 개수마다 한 번만 후킹 콜백 시간을 기록
+
+
+class HotkeyActionExecutor(threading.Thread):
+    """
+    단축키 인식 후 처리(백스페이스 시뮬레이션, 로그 출력 등)를 실행하는 작업 스레드
+    키보드 후킹 콜백이 오래 걸리면 시스템 전체의 키 입력이 지연되고
+    OS가 후킹을 해제할 수 있으므로, 콜백은 작업을 큐에 넣기만 하고 바로 반환함
+    """
+
+    def __init__(self):
+        super().__init__(name="HotkeyActionExecutor", daemon=True)
+        self._queue = queue.SimpleQueue()
+
+    def submit(self, func, *args):
+        """작업 추가 (잠금 없이 바로 반환)"""
+        self._queue.put((func, args))
+
+    def shutdown(self):
+        """남은 작업을 처리한 뒤 스레드 종료"""
+        self._queue.put(None)
+
+    def run(self):
+        while True:
+            task = self._queue.get()
+            if task is None:
+                break
+            func, args = task
+            try:
+                func(*args)
+            except Exception as e:
+                log.error("HotkeyActionExecutor: 작업 실행 중 오류: %s", e)
+
+
 class HotkeyListenerThread(QThread):
     """
     등록된 단축키 조합을 감지하는 스레드 클래스
     """
-    hotkey_pressed_signal = pyqtSignal()
+    hotkey_pressed_signal = pyqtSignal()  # 팝업 열기 단축키
+    action_triggered = pyqtSignal(str, int)  # 그 외 단축키 (동작 이름, 동작 인자)
+    listener_died = pyqtSignal(int, str)  # 누적 재시작 횟수, 종료 사유
 
-    def __init__(self, hotkey_config):
+    def __init__(self, hotkey_config, binding_configs=None):
         """
         초기화 함수
         
         Args:
-            hotkey_config: 단축키 설정 딕셔너리
+            hotkey_config: 팝업 열기 단축키 설정 딕셔너리
+            binding_configs: 추가 단축키 설정 리스트 (config의 "bindings")
         """
         super().__init__()
         self.hotkey_config = hotkey_config
-        self.pressed_keys = set()
+        # 수정자 비트마스크 기반 단축키 매처 (중복 인식 방지 간격 포함)
+        self.matcher = HotkeyMatcher()
+        self.update_bindings(hotkey_config, binding_configs)
         self.listener_instance = None
         self._should_run = True
-        # 마지막 단축키 처리 시간 추적
-        self.last_hotkey_time = 0
+        self._stop_event = threading.Event()
+        self.restart_count = 0
+        # 마지막 신호 발생 시각 (time.perf_counter 기준, 표시 지연 측정용)
+        self.last_signal_time = 0.0
         # 키보드 컨트롤러 (백스페이스 시뮬레이션용)
         self.keyboard = Controller()
-        # 백스페이스 필요 플래그
-        self.need_backspace = False
+        # 단축키 인식 후 처리를 실행하는 작업 스레드 (run()에서 시작)
+        self.executor = None
 
     def run(self):
         """
         스레드 실행 함수
         키보드 이벤트를 감지하고 설정된 단축키와 일치하는지 확인
         """
-        target_modifiers = set()
-        for mod_name in self.hotkey_config.get("modifiers", []):
-            try: 
-                # Mac에서는 특별히 cmd 키를 처리
-                if mod_name == "cmd" and sys.platform == "darwin":
-                    target_modifiers.add(keyboard.Key.cmd)
-                else:
-                    key_attr = getattr(keyboard.Key, mod_name)
-                    target_modifiers.add(key_attr)
-            except AttributeError: 
-                print(f"HotkeyListenerThread: 알 수 없는 수정자 키 '{mod_name}'")
-                
-        target_key_str = self.hotkey_config.get("key", "")
-        target_key_obj = None
-        
-        if not target_key_str: 
-            print("HotkeyListenerThread: 대상 키 문자열이 설정에 없습니다. 리스너가 효과적으로 시작되지 않습니다.")
-            return
-        
-        # 설정에 '\x16'과 같은 제어 문자가 있는 경우 처리
-        if len(target_key_str) == 1 and ('\x00' < target_key_str < '\x20'):
-            print(f"HotkeyListenerThread: 경고 - 대상 키 '{repr(target_key_str)}'는 제어 문자입니다. 단축키가 예상대로 작동하지 않을 수 있습니다.")
-            # KeyCode 생성 시도
-            try:
-                target_key_obj = keyboard.KeyCode.from_char(target_key_str)
-            except Exception as e:
-                print(f"HotkeyListenerThread: 제어 문자 '{repr(target_key_str)}'에서 KeyCode를 생성할 수 없습니다: {e}")
-                return
-        elif len(target_key_str) == 1: 
-            target_key_obj = keyboard.KeyCode.from_char(target_key_str)
-        else:  # 'space', 'enter'와 같은 특수 키
-            try: 
-                target_key_obj = getattr(keyboard.Key, target_key_str)
-            except AttributeError: 
-                print(f"HotkeyListenerThread: 알 수 없는 특수 키 이름 '{target_key_str}'")
-                return
-        
-        if not target_key_obj: 
-            print("HotkeyListenerThread: 대상 키 객체를 확인할 수 없습니다. 리스너를 중지합니다.")
-            return
+        self.matcher.reset()
+        log.info("HotkeyListenerThread: 리스너 시작됨. 단축키: %s", format_hotkey_for_display(self.hotkey_config))
 
-        # 디버깅 정보 추가
-        print(f"HotkeyListenerThread: 리스너 시작됨. 단축키: {format_hotkey_for_display(self.hotkey_config)}")
-        print(f"HotkeyListenerThread: 타겟 키 정보: {target_key_obj}, 타입: {type(target_key_obj)}")
-        if hasattr(target_key_obj, 'vk'):
-            print(f"HotkeyListenerThread: 타겟 키 VK: {target_key_obj.vk}")
-        if hasattr(target_key_obj, 'char'):
-            print(f"HotkeyListenerThread: 타겟 키 문자: {repr(target_key_obj.char)}")
-        print(f"HotkeyListenerThread: 타겟 수정자 키: {target_modifiers}")
+        matcher = self.matcher
+        executor = self.executor = HotkeyActionExecutor()
+        executor.start()
+        now = latency_tracker.now
 
-        def on_press(key):
-            try:
-                # 키 정보 로깅 (디버깅용)
-                # print(f"키 누름: {key}")
-                
-                # 수정자 키를 간소화하여 처리 (좌우 구분 없음)
-                simple_key = key
-                if key in (keyboard.Key.ctrl_r, keyboard.Key.ctrl_l): 
-                    simple_key = keyboard.Key.ctrl_l
-                elif key in (keyboard.Key.shift_r, keyboard.Key.shift_l): 
-                    simple_key = keyboard.Key.shift_l
-                elif key in (keyboard.Key.alt_r, keyboard.Key.alt_l): 
-                    simple_key = keyboard.Key.alt_l
-                elif sys.platform == "darwin" and key in (keyboard.Key.cmd_r, keyboard.Key.cmd_l): 
-                    simple_key = keyboard.Key.cmd
-                
-                self.pressed_keys.add(simple_key)
+        def dispatch(binding, key, started):
+            # 핫키 감지 이벤트 발생
+            self.last_signal_time = started
+            latency_tracker.mark("hotkey", started)
+            if binding.action == "open_popup":
+                self.hotkey_pressed_signal.emit()
+            else:
+                self.action_triggered.emit(binding.action, binding.arg)
+            
+            # 입력된 문자 삭제를 위한 백스페이스는 작업 스레드에서 처리 (단축키별 설정)
+            backspace = binding.backspace and isinstance(key, keyboard.KeyCode) and bool(key.char)
+            executor.submit(self._after_hotkey, binding.action, backspace)
 
-                # 단축키 일치 확인 
-                is_target_key_pressed_now = False
-                
-                # 타겟 키와 현재 키 비교
-                if isinstance(target_key_obj, keyboard.KeyCode) and isinstance(key, keyboard.KeyCode):
-                    # 가상 키 코드로 비교
-                    if hasattr(key, 'vk') and hasattr(target_key_obj, 'vk') and key.vk == target_key_obj.vk:
-                        is_target_key_pressed_now = True
-                    # 문자값으로 비교 (대소문자 구분 없이)
-                    elif (hasattr(key, 'char') and key.char and 
-                          hasattr(target_key_obj, 'char') and target_key_obj.char and 
-                          key.char.lower() == target_key_obj.char.lower()):
-                        is_target_key_pressed_now = True
-                elif simple_key == target_key_obj:  # 특수 키인 경우
-                    is_target_key_pressed_now = True
+        # 연속 단축키의 대기 시간이 지나 실행되는 단축키 (matcher의 타이머 스레드에서 호출됨)
+        matcher.on_sequence_timeout = lambda binding, key: dispatch(binding, key, now())
 
-                if is_target_key_pressed_now:
-                    # 필요한 모든 수정자 키가 눌렸는지 확인
-                    current_pressed_modifiers = {k for k in self.pressed_keys if k in target_modifiers}
-                    all_target_mods_pressed = (len(current_pressed_modifiers) == len(target_modifiers))
-                    
-                    if all_target_mods_pressed:
-                        # 다른 수정자 키가 눌리지 않았는지 확인
-                        all_relevant_modifiers = {keyboard.Key.ctrl_l, keyboard.Key.shift_l, keyboard.Key.alt_l}
-                        if sys.platform == "darwin": 
-                            all_relevant_modifiers.add(keyboard.Key.cmd)
-                        
-                        extra_modifiers_pressed = False
-                        for pressed_mod_key in self.pressed_keys:
-                            if (pressed_mod_key in all_relevant_modifiers and 
-                                pressed_mod_key not in target_modifiers and 
-                                pressed_mod_key != target_key_obj):
-                                extra_modifiers_pressed = True
-                                break
+        unmatched_keys = 0
 
-                        if not extra_modifiers_pressed:
-                            # 중복 처리 방지 (시간 간격 체크)
-                            current_time = time.time()
-                            if current_time - self.last_hotkey_time > 0.3:
-                                self.last_hotkey_time = current_time
-                                print("핫키 조합이 일치함 - 신호 발생!")
-                                
-                                # 입력된 문자 삭제를 위해 백스페이스 필요 플래그 설정
-                                if isinstance(key, keyboard.KeyCode) and hasattr(key, 'char') and key.char:
-                                    self.need_backspace = True
-                                    
-                                # 핫키 감지 이벤트 발생
-                                self.hotkey_pressed_signal.emit()
-                                
-                                # 0.01초 후 백스페이스 시뮬레이션
-                                if self.need_backspace:
-                                    time.sleep(0.01)
-                                    try:
-                                        self.keyboard.press(Key.backspace)
-                                        self.keyboard.release(Key.backspace)
-                                        print("백스페이스 키 시뮬레이션 완료")
-                                    except Exception as e:
-                                        print(f"백스페이스 키 시뮬레이션 오류: {e}")
-                                    self.need_backspace = False
-                                
-                                # 키 상태 초기화
-                                self.pressed_keys.clear()
+        def on_press(key):
+            nonlocal unmatched_keys
+            started = now()
+            binding = None
+            try:
+                binding = matcher.on_press(key)
+                if binding is not None:
+                    dispatch(binding, key, started)
             except Exception as e: 
-                print(f"HotkeyListenerThread: 키 처리 중 오류: {e}")
+                log.error("HotkeyListenerThread: 키 처리 중 오류: %s", e)
+            # 콜백 시간은 단축키일 때와 그 외 키의 일부만 측정하고, 기록(잠금)은 작업 스레드에서 처리
+            if binding is None:
+                unmatched_keys += 1
+                if unmatched_keys % HOOK_LATENCY_SAMPLE_INTERVAL:
+                    return True
+            executor.submit(latency_tracker.record, "hotkey_hook_callback", now() - started)
             
             return True  # 모든 키 이벤트를 시스템으로 전달
 
         def on_release(key):
             try:
-                # 키 해제 정보 로깅 (디버깅용)
-                # print(f"키 해제: {key}")
-                
-                simple_key = key
-                if key in (keyboard.Key.ctrl_r, keyboard.Key.ctrl_l): 
-                    simple_key = keyboard.Key.ctrl_l
-                elif key in (keyboard.Key.shift_r, keyboard.Key.shift_l): 
-                    simple_key = keyboard.Key.shift_l
-                elif key in (keyboard.Key.alt_r, keyboard.Key.alt_l): 
-                    simple_key = keyboard.Key.alt_l
-                elif sys.platform == "darwin" and key in (keyboard.Key.cmd_r, keyboard.Key.cmd_l): 
-                    simple_key = keyboard.Key.cmd
-                    
-                if simple_key in self.pressed_keys: 
-                    self.pressed_keys.remove(simple_key)
+                matcher.on_release(key)
             except Exception as e: 
-                print(f"HotkeyListenerThread: 키 해제 중 오류: {e}")
+                log.error("HotkeyListenerThread: 키 해제 중 오류: %s", e)
                 
+        # 리스너가 예기치 않게 종료되면 즉시 재시작 (주기적으로 상태를 확인하지 않음)
+        restart_count = 0
+        while self._should_run:
+            started_at = time.monotonic()
+            reason, fatal = self._run_listener(on_press, on_release)
+            if not self._should_run:
+                break
+            if time.monotonic() - started_at > LISTENER_STABLE_SEC:
+                restart_count = 0  # 오래 정상 동작한 뒤의 종료는 연속 실패로 보지 않음
+            restart_count += 1
+            self.restart_count += 1
+            LISTENER_RESTARTS.inc()
+            log.warning("HotkeyListenerThread: 리스너 종료 감지 (%s), 재시작 %s회째", reason, restart_count)
+            self.listener_died.emit(self.restart_count, reason)
+            if fatal or restart_count > LISTENER_MAX_RESTARTS:
+                log.warning("HotkeyListenerThread: 리스너를 다시 시작하지 않습니다.")
+                break
+            # 재시작 전 대기 (stop() 호출 시 즉시 깨어남)
+            if self._stop_event.wait(LISTENER_RESTART_BACKOFF_SEC * restart_count):
+                break
+            self.matcher.reset()
+        matcher.reset()
+        matcher.on_sequence_timeout = None
+        executor.shutdown()
+        log.info("HotkeyListenerThread: 리스너가 중지되었습니다. run 메서드가 종료됩니다.")
+
+    def _after_hotkey(self, action, backspace):
+        """
+        단축키 인식 후 처리 (작업 스레드에서 실행)
+
+        Args:
+            action: 인식된 동작 이름
+            backspace: 입력된 문자를 지우기 위해 백스페이스를 보낼지 여부
+        """
+        log.debug("핫키 조합이 일치함 - 신호 발생! (%s)", action)
+        if not backspace:
+            return
+        # 0.01초 후 백스페이스 시뮬레이션
+        time.sleep(BACKSPACE_DELAY_SEC)
+        try:
+            self.keyboard.press(Key.backspace)
+            self.keyboard.release(Key.backspace)
+            log.debug("백스페이스 키 시뮬레이션 완료")
+        except Exception as e:
+            log.error("백스페이스 키 시뮬레이션 오류: %s", e)
+
+    def _run_listener(self, on_press, on_release):
+        """
+        pynput 리스너를 시작하고 종료될 때까지 대기 (리스너 스레드에 join)
+        
+        Returns:
+            (종료 사유, 재시작해도 소용없는 오류인지 여부)
+        """
         try:
+            # 모든 키보드 이벤트를 시스템으로 전달하도록 설정
+            self.listener_instance = keyboard.Listener(
+                on_press=on_press, 
+                on_release=on_release, 
+                suppress=False
+            )
             # Mac 환경에서는 접근성 권한 문제 처리
             if sys.platform == "darwin":
-                print("HotkeyListenerThread: Mac 환경에서 키보드 리스너 생성 시도...")
-                try:
-                    # 모든 키보드 이벤트를 시스템으로 전달하도록 설정
-                    self.listener_instance = keyboard.Listener(
-                        on_press=on_press, 
-                        on_release=on_release, 
-                        suppress=False
-                    )
-                    self.listener_instance.start()
-                    
-                    # 리스너가 실제로 시작되었는지 확인
-                    time.sleep(0.2)
-                    if not self.listener_instance.is_alive():
-                        print("HotkeyListenerThread: 키보드 리스너가 시작되지 않았습니다. 접근성 권한을 확인하세요.")
-                        return
-                    
-                    print("HotkeyListenerThread: Mac에서 키보드 리스너 시작 성공!")
-                except Exception as mac_error:
-                    print(f"HotkeyListenerThread: Mac 환경 키보드 리스너 오류: {mac_error}")
-                    if "accessibility" in str(mac_error).lower() or "is not trusted" in str(mac_error).lower():
-                        print("HotkeyListenerThread: 접근성 권한이 필요합니다. 시스템 환경설정 > 개인 정보 보호 및 보안 > 개인 정보 보호 > 손쉬운 사용에서 이 앱을 활성화하세요.")
-                    return
-            else:
-                # 다른 플랫폼에서의 처리
-                self.listener_instance = keyboard.Listener(
-                    on_press=on_press, 
-                    on_release=on_release, 
-                    suppress=False
-                )
-                self.listener_instance.start()
+                log.info("HotkeyListenerThread: Mac 환경에서 키보드 리스너 생성 시도...")
+            self.listener_instance.start()
             
-            # 스레드 종료 플래그
-            self._should_run = True
+            if sys.platform == "darwin":
+                # 리스너가 준비될 때까지 대기 (권한이 없어도 준비 완료 후 바로 종료됨)
+                self.listener_instance.wait()
+                if not self.listener_instance.is_alive() or not getattr(self.listener_instance, "IS_TRUSTED", True):
+                    log.warning("HotkeyListenerThread: 접근성 권한이 필요합니다. 시스템 환경설정 > 개인 정보 보호 및 보안 > 개인 정보 보호 > 손쉬운 사용에서 이 앱을 활성화하세요.")
+                    return "접근성 권한 없음", True
+                log.info("HotkeyListenerThread: Mac에서 키보드 리스너 시작 성공!")
             
-            # 이벤트 기반 방식으로 관리
-            while (self.listener_instance and 
-                  self.listener_instance.is_alive() and 
-                  self.isRunning() and 
-                  self._should_run):
-                time.sleep(0.1)  # CPU 사용량 감소를 위한 짧은 대기
+            if not self._should_run:
+                return "중지 요청", False
+            # 리스너 스레드가 끝날 때까지 블로킹 대기 (콜백에서 발생한 예외는 여기서 다시 발생함)
+            self.listener_instance.join()
+            return "리스너 스레드 종료", False
         except Exception as e:
-            print(f"HotkeyListenerThread: 리스너 오류: {e}")
+            log.error("HotkeyListenerThread: 리스너 오류: %s", e)
+            if "accessibility" in str(e).lower() or "is not trusted" in str(e).lower():
+                return str(e), True
+            return str(e) or type(e).__name__, False
         finally:
             if self.listener_instance and self.listener_instance.is_alive(): 
                 try:
                     self.listener_instance.stop()
                 except Exception as e:
-                    print(f"HotkeyListenerThread: 리스너 종료 중 오류: {e}")
-            print("HotkeyListenerThread: 리스너가 중지되었습니다. run 메서드가 종료됩니다.")
+                    log.error("HotkeyListenerThread: 리스너 종료 중 오류: %s", e)
+
+    def update_bindings(self, hotkey_config, binding_configs=None):
+        """
+        단축키 목록 교체 (리스너를 다시 시작하지 않음)
+        새 조회 테이블을 만든 뒤 한 번에 교체하므로 교체 중에도 키 입력을 놓치지 않음
+        
+        Args:
+            hotkey_config: 팝업 열기 단축키 설정 딕셔너리
+            binding_configs: 추가 단축키 설정 리스트
+        """
+        bindings = build_bindings(hotkey_config, binding_configs, HOTKEY_ACTIONS)
+        self.matcher.set_bindings(bindings)
+        self.hotkey_config = hotkey_config
+        log.info("HotkeyListenerThread: 단축키 %s개 적용됨", len(bindings))
 
     def stop(self):
         """
         스레드 정지 함수
         """
-        print("HotkeyListenerThread: stop() 호출됨.")
+        log.info("HotkeyListenerThread: stop() 호출됨.")
         self._should_run = False  # 스레드 종료 플래그 설정
+        self._stop_event.set()
         if self.listener_instance:
             self.listener_instance.stop()
 
@@ -304,7 +308,7 @@ class HotkeyRecordingThread(QThread):
                     # \x01~\x1A 같은 제어 문자 필터링
                     # 수정자 키가 눌리지 않은 경우 pynput은 보통 정확한 문자를 제공함
                     if ('\x00' < key.char < '\x20') and key.char not in ['\t', '\n', '\r']:
-                        print(f"HotkeyRecordingThread: 주 키 부분에서 제어 문자 {repr(key.char)}을(를) 무시합니다.")
+                        log.debug("HotkeyRecordingThread: 주 키 부분에서 제어 문자 %r을(를) 무시합니다.", key.char)
                         # key_val을 설정하지 않음; 비수정자, 비제어 문자 키를 기다림
                     else:
                         key_val = key.char.lower()  # 'a'는 기록하되 'A'는 하지 않음
@@ -332,13 +336,13 @@ class HotkeyRecordingThread(QThread):
                     return False  # 리스너 중지
                 return True
             except Exception as e:
-                print(f"HotkeyRecordingThread: 키 처리 중 예외 발생: {e}")
+                log.error("HotkeyRecordingThread: 키 처리 중 예외 발생: %s", e)
                 # 예외가 발생해도 계속 진행, 중요 작업인 경우만 종료 시그널 발생
                 if self._listener and not self.recorded_key:
                     try: 
                         self._listener.stop()
                     except Exception as e2:
-                        print(f"HotkeyRecordingThread: 리스너 중지 시도 중 추가 예외: {e2}")
+                        log.error("HotkeyRecordingThread: 리스너 중지 시도 중 추가 예외: %s", e2)
                     self.recording_canceled.emit()
                     return False
                 return True
@@ -346,7 +350,7 @@ class HotkeyRecordingThread(QThread):
         try:
             # Mac 환경에서는 접근성 권한 문제로 예외 발생 가능성이 있음
             if sys.platform == "darwin":
-                print("Mac 환경에서 키보드 리스너 생성 시도...")
+                log.info("Mac 환경에서 키보드 리스너 생성 시도...")
                 try:
                     self._listener = keyboard.Listener(on_press=on_press, suppress=False)
                     self._listener.start()
@@ -356,16 +360,16 @@ class HotkeyRecordingThread(QThread):
                     if not self._listener.is_alive():
                         raise Exception("키보드 리스너가 시작되지 않았습니다. 접근성 권한을 확인하세요.")
                     
-                    print("Mac에서 키보드 리스너 시작 성공!")
+                    log.info("Mac에서 키보드 리스너 시작 성공!")
                     self.update_display_signal.emit("새 단축키 입력 대기 중...")
                     self._listener.join()
                 except Exception as mac_error:
                     error_msg = str(mac_error)
                     if "accessibility" in error_msg.lower() or "is not trusted" in error_msg.lower() or not error_msg:
-                        print("접근성 권한 오류: 시스템 환경설정 > 개인 정보 보호 및 보안 > 개인 정보 보호 > 손쉬운 사용에서 이 앱을 활성화해야 합니다.")
+                        log.error("접근성 권한 오류: 시스템 환경설정 > 개인 정보 보호 및 보안 > 개인 정보 보호 > 손쉬운 사용에서 이 앱을 활성화해야 합니다.")
                         self.update_display_signal.emit("접근성 권한 필요")
                     else:
-                        print(f"Mac 환경 키보드 리스너 오류: {mac_error}")
+                        log.error("Mac 환경 키보드 리스너 오류: %s", mac_error)
                         self.update_display_signal.emit("키보드 감지 오류")
                     
                     # 오류 발생 후 취소 처리
@@ -376,14 +380,14 @@ class HotkeyRecordingThread(QThread):
                 self._listener.start()
                 self._listener.join()
         except Exception as e: 
-            print(f"HotkeyRecordingThread: 리스너 생성/시작 오류: {e}")
+            log.error("HotkeyRecordingThread: 리스너 생성/시작 오류: %s", e)
             self.recording_canceled.emit()
         finally:
             if self._listener and self._listener.is_alive(): 
                 try:
                     self._listener.stop()
                 except Exception as e:
-                    print(f"HotkeyRecordingThread: 리스너 정리 중 오류: {e}")
+                    log.error("HotkeyRecordingThread: 리스너 정리 중 오류: %s", e)
             self._listener = None
 
     def stop_listener_and_quit(self):
@@ -394,5 +398,5 @@ class HotkeyRecordingThread(QThread):
             try:
                 self._listener.stop()
             except Exception as e:
-                print(f"HotkeyRecordingThread: stop_listener_and_quit 중 예외: {e}")
+                log.error("HotkeyRecordingThread: stop_listener_and_quit 중 예외: %s", e)
         self.quit() 
\ No newline at end of file
@@ -0,0 +1,530 @@
+import sys
+import threading
+import time
+
+from pynput.keyboard import Key, KeyCode
+
+from app_logging import get_logger
+
+log = get_logger(__name__)
+
+# --- 단축키 매칭 관련 상수 ---
+HOTKEY_DEBOUNCE_SEC = 0.3  # 같은 단축키가 다시 인식되기까지의 최소 간격
+SEQUENCE_STEP_TIMEOUT_SEC = 1.0  # 연속 단축키에서 다음 키를 기다리는 기본 시간
+
+# 논리 수정자 비트 (좌우 구분 없음)
+MOD_CTRL = 1
+MOD_SHIFT = 2
+MOD_ALT = 4
+MOD_CMD = 8
+
+# 설정 파일의 수정자 이름 -> 논리 수정자 비트
+MODIFIER_NAME_BITS = {
+    "ctrl": MOD_CTRL, "ctrl_l": MOD_CTRL, "ctrl_r": MOD_CTRL,
+    "shift": MOD_SHIFT, "shift_l": MOD_SHIFT, "shift_r": MOD_SHIFT,
+    "alt": MOD_ALT, "alt_l": MOD_ALT, "alt_r": MOD_ALT, "alt_gr": MOD_ALT,
+    "cmd": MOD_CMD, "cmd_l": MOD_CMD, "cmd_r": MOD_CMD,
+}
+
+
+def _build_physical_bits(key_enum=Key):
+    """
+    수정자 키 -> 물리 비트 (좌/우 키를 각각 다른 비트로 추적하여
+    양쪽 Ctrl을 누른 상태에서 한쪽만 떼도 Ctrl 상태가 유지되도록 함)
+
+    Args:
+        key_enum: 특수 키 열거형 (기본값: pynput의 Key)
+    """
+    physical = {}
+    names = [
+        ("ctrl", "ctrl_l", "ctrl_r"), ("shift", "shift_l", "shift_r"),
+        ("alt", "alt_l", "alt_r"), ("cmd", "cmd_l", "cmd_r"),
+    ]
+    for group_index, (generic, left, right) in enumerate(names):
+        left_bit = 1 << (group_index * 2)
+        right_bit = left_bit << 1
+        for name, bit in ((generic, left_bit), (left, left_bit), (right, right_bit)):
+            key = getattr(key_enum, name, None)
+            if key is not None:
+                physical.setdefault(key, bit)
+    alt_gr = getattr(key_enum, "alt_gr", None)
+    if alt_gr is not None:
+        physical.setdefault(alt_gr, 1 << 5)  # 오른쪽 Alt로 취급
+    return physical
+
+
+_PHYSICAL_BITS = _build_physical_bits()
+
+# 물리 비트 상태(8비트) -> 논리 수정자 마스크 (미리 계산해 두어 키 입력마다 계산하지 않음)
+_LOGICAL_MASKS = tuple(
+    (MOD_CTRL if state & 0b11 else 0) |
+    (MOD_SHIFT if state & 0b1100 else 0) |
+    (MOD_ALT if state & 0b110000 else 0) |
+    (MOD_CMD if state & 0b11000000 else 0)
+    for state in range(256)
+)
+
+# macOS 외 플랫폼에서는 Win/Super 키가 눌려 있어도 단축키 인식을 막지 않음 (기존 동작 유지)
+_IGNORABLE_MASK = 0 if sys.platform == "darwin" else MOD_CMD
+
+
+class HotkeyBinding:
+    """
+    컴파일된 단축키 하나 (매칭 결과로 반환됨)
+    """
+    __slots__ = ("config", "mask", "action", "arg", "backspace", "last_fired")
+
+    def __init__(self, config, mask, action="open_popup", arg=0, backspace=False):
+        self.config = config        # 원본 설정 딕셔너리
+        self.mask = mask            # 논리 수정자 마스크
+        self.action = action        # 동작 이름
+        self.arg = arg              # 동작 인자 (paste_recent의 N 등)
+        self.backspace = backspace  # 인식 후 입력된 문자를 지우기 위해 백스페이스를 보낼지 여부
+        self.last_fired = float("-inf")
+
+
+class SequenceNode:
+    """
+    연속 단축키(예: Ctrl+Shift+V 다음 3) 트라이의 중간 단계
+    단축키 테이블에서 HotkeyBinding 대신 이 노드가 조회되면 다음 키를 기다림
+    """
+    __slots__ = ("children", "timeout", "binding")
+
+    def __init__(self, timeout, binding=None):
+        self.children = {}       # 다음 단계 테이블 (compile_bindings의 반환값과 같은 형식)
+        self.timeout = timeout   # 다음 키를 기다리는 시간 (초)
+        self.binding = binding   # 이 단계까지만 입력하고 시간이 지났을 때 실행할 단축키 (없으면 None)
+
+
+def binding_steps(config):
+    """
+    단축키 설정의 단계 목록 반환
+    {"sequence": [{"modifiers": [...], "key": "v"}, {"key": "3"}], ...} 형식이면 각 단계,
+    일반 단축키면 설정 자체 하나
+    """
+    steps = config.get("sequence")
+    if steps is None:
+        return [config]
+    if not isinstance(steps, list) or not steps or not all(isinstance(step, dict) for step in steps):
+        raise ValueError("sequence는 단계 설정 딕셔너리의 리스트여야 합니다")
+    return steps
+
+
+def default_backspace(config):
+    """
+    backspace를 지정하지 않은 단축키의 기본값
+    연속 단축키의 마지막 단계가 수정자 없는 키(예: Ctrl+Shift+V 다음 3)면
+    그 문자가 입력란에 그대로 입력되므로 기본적으로 지움
+    """
+    steps = config.get("sequence")
+    return bool(steps) and isinstance(steps[-1], dict) and not steps[-1].get("modifiers")
+
+
+def _step_timeout(step):
+    """단계 설정의 대기 시간 (timeout_ms, 초 단위로 반환)"""
+    timeout_ms = step.get("timeout_ms")
+    return SEQUENCE_STEP_TIMEOUT_SEC if timeout_ms is None else float(timeout_ms) / 1000.0
+
+
+def _char_variants(char):
+    """
+    주 키 문자가 실제 키 이벤트에서 나타날 수 있는 형태 반환
+    (소문자/대문자, Ctrl과 함께 눌렸을 때의 제어 문자)
+    """
+    variants = {char, char.lower(), char.upper()}
+    upper = char.upper()
+    if len(upper) == 1 and "A" <= upper <= "Z":
+        variants.add(chr(ord(upper) - 64))  # Ctrl+V -> '\x16'
+    return variants
+
+
+def _vk_variants(char):
+    """Windows 가상 키 코드 (영문자/숫자는 대문자 ASCII 코드와 같음)"""
+    upper = char.upper()
+    if sys.platform == "win32" and len(upper) == 1 and ("A" <= upper <= "Z" or "0" <= upper <= "9"):
+        return {ord(upper)}
+    return set()
+
+
+def parse_hotkey(config, key_enum=Key):
+    """
+    단축키 설정을 (수정자 마스크, 특수 키, 문자 변형 집합, 가상 키 코드 집합)으로 변환
+
+    Args:
+        config: {"modifiers": [...], "key": "v"} 형식의 설정
+        key_enum: 특수 키 열거형 (기본값: pynput의 Key)
+
+    Raises:
+        ValueError: 알 수 없는 수정자 또는 주 키인 경우
+    """
+    mask = 0
+    for mod_name in config.get("modifiers", []):
+        bit = MODIFIER_NAME_BITS.get(mod_name)
+        if bit is None:
+            raise ValueError(f"알 수 없는 수정자 키 '{mod_name}'")
+        mask |= bit
+
+    key_str = config.get("key", "")
+    if not key_str:
+        raise ValueError("대상 키 문자열이 설정에 없습니다")
+    if len(key_str) == 1:
+        if "\x00" < key_str < "\x20":
+            # 예전 설정에 저장된 제어 문자 ('\x16' -> 'v')
+            if "\x01" <= key_str <= "\x1a":
+                key_str = chr(ord(key_str) + ord("a") - 1)
+            else:
+                raise ValueError(f"대상 키 '{repr(key_str)}'는 제어 문자입니다")
+        return mask, None, _char_variants(key_str), _vk_variants(key_str)
+
+    special = getattr(key_enum, key_str, None)
+    if special is None:
+        raise ValueError(f"알 수 없는 특수 키 이름 '{key_str}'")
+    return mask, special, set(), set()
+
+
+def _same_keys(first, second):
+    """parse_hotkey() 결과 두 개가 같은 키 입력에 인식되는지 여부"""
+    if first[0] != second[0]:
+        return False
+    if first[1] is not None or second[1] is not None:
+        return first[1] == second[1]
+    return bool(first[2] & second[2] or first[3] & second[3])
+
+
+def build_bindings(hotkey_config, binding_configs=(), actions=None):
+    """
+    설정으로부터 단축키 목록 생성
+
+    Args:
+        hotkey_config: 팝업 열기 단축키 설정 ("hotkey")
+        binding_configs: 추가 단축키 설정 리스트 ("bindings", action/arg/backspace 포함,
+                         연속 단축키는 modifiers/key 대신 sequence 단계 리스트 사용,
+                         backspace를 지정하지 않으면 default_backspace() 값 사용)
+        actions: 허용하는 동작 이름 집합 (None이면 제한 없음)
+
+    Returns:
+        HotkeyBinding 리스트 (잘못된 항목, "enabled": false인 항목, 첫 단계가 팝업 단축키와 같아
+        팝업을 대기 시간만큼 늦게 열게 되는 연속 단축키는 건너뜀)
+    """
+    bindings = []
+    popup_keys = None
+    if hotkey_config and hotkey_config.get("key"):
+        try:
+            popup_keys = parse_hotkey(hotkey_config)
+            bindings.append(HotkeyBinding(hotkey_config, 0, "open_popup", 0, backspace=True))
+        except ValueError as e:
+            log.error("hotkey_matcher: 팝업 단축키 설정 오류: %s", e)
+    for config in binding_configs or ():
+        if not isinstance(config, dict) or not config.get("enabled", True):
+            continue
+        action = config.get("action")
+        if actions is not None and action not in actions:
+            log.warning("hotkey_matcher: 알 수 없는 동작 '%s' - 건너뜀", action)
+            continue
+        try:
+            steps = binding_steps(config)
+            for step in steps:
+                parse_hotkey(step)
+                _step_timeout(step)
+            if popup_keys is not None and len(steps) > 1 and _same_keys(parse_hotkey(steps[0]), popup_keys):
+                raise ValueError("연속 단축키의 첫 단계가 팝업 단축키와 같습니다")
+            arg = int(config.get("arg", 0) or 0)
+        except (ValueError, TypeError) as e:
+            log.warning("hotkey_matcher: 잘못된 단축키 설정 %s: %s - 건너뜀", config, e)
+            continue
+        backspace = config.get("backspace")
+        if backspace is None:
+            backspace = default_backspace(config)
+        bindings.append(HotkeyBinding(config, 0, action, arg, bool(backspace)))
+    return bindings
+
+
+def compile_bindings(bindings, key_enum=Key):
+    """
+    단축키 목록을 조회 테이블로 컴파일
+
+    Args:
+        bindings: HotkeyBinding 리스트 (먼저 나온 단축키가 우선)
+        key_enum: 특수 키 열거형 (기본값: pynput의 Key)
+
+    Returns:
+        {수정자 마스크: (특수 키 딕셔너리, 가상 키 코드 딕셔너리, 문자 딕셔너리)}
+        연속 단축키의 중간 단계는 값이 SequenceNode이며, 그 children이 다음 단계 테이블임
+    """
+    table = {}
+    for binding in bindings:
+        steps = binding_steps(binding.config)
+        current = table
+        for index, step in enumerate(steps):
+            mask, special, chars, vks = parse_hotkey(step, key_enum)
+            if index == 0:
+                binding.mask = mask
+            by_special, by_vk, by_char = current.setdefault(mask, ({}, {}, {}))
+            slots = [(by_vk, vk) for vk in vks] + [(by_char, char) for char in chars]
+            if special is not None:
+                slots.insert(0, (by_special, special))
+
+            if index == len(steps) - 1:
+                # 마지막 단계: 비어 있는 칸에 단축키 등록 (먼저 나온 단축키가 우선)
+                for slot, key in slots:
+                    value = slot.get(key)
+                    if value is None:
+                        slot[key] = binding
+                    elif value.__class__ is SequenceNode and value.binding is None:
+                        value.binding = binding
+                break
+
+            # 중간 단계: 같은 키에 이미 있는 노드를 공유하고, 단일 단축키가 있던 칸은 노드로 교체
+            node = next((slot[key] for slot, key in slots if slot.get(key).__class__ is SequenceNode), None)
+            if node is None:
+                leaf = next((slot[key] for slot, key in slots if slot.get(key) is not None), None)
+                node = SequenceNode(0.0, leaf)
+            node.timeout = max(node.timeout, _step_timeout(steps[index + 1]))
+            for slot, key in slots:
+                value = slot.get(key)
+                if value is None or value is node.binding:
+                    slot[key] = node
+            current = node.children
+    return table
+
+
+class HotkeyMatcher:
+    """
+    키 이벤트를 컴파일된 단축키 테이블과 대조하는 클래스 (Qt 비의존)
+
+    수정자 상태는 정수 비트마스크로 관리하고, 단축키는 수정자 마스크별 딕셔너리로
+    미리 컴파일해 두므로 키 이벤트 하나의 처리 비용은 딕셔너리 조회 몇 번(O(1))이며
+    집합이나 문자열을 새로 만들지 않음.
+    pynput의 KeyCode는 해시 계산 시 repr 문자열을 만들기 때문에
+    KeyCode 객체 자체 대신 vk/char 값으로 조회함.
+
+    키보드 후킹과 무관하므로 기록되거나 생성된 Key/KeyCode 이벤트 열을
+    그대로 재생하여 측정할 수 있음 (benchmarks/bench_hotkey_matcher.py 참고)
+
+    연속 단축키는 트라이로 컴파일되며, 첫 단계가 인식되면 단계별 대기 타이머를 실행하고
+    다음 키는 _on_press_sequence에서 처리함. 진행 중인 연속 단축키가 없을 때 추가되는 비용은
+    on_press 시작의 대기 상태 확인 한 번뿐임.
+    """
+
+    def __init__(self, bindings=(), clock=time.monotonic, debounce=HOTKEY_DEBOUNCE_SEC, key_enum=Key,
+                 timer_factory=threading.Timer):
+        """
+        초기화 함수
+
+        Args:
+            bindings: HotkeyBinding 리스트
+            clock: 현재 시각(초)을 반환하는 함수 (테스트/벤치마크에서 교체 가능)
+            debounce: 같은 단축키 재인식 최소 간격 (초)
+            key_enum: 특수 키 열거형 (기본값: pynput의 Key, 키보드가 없는 환경에서
+                      이벤트를 재생할 때는 멤버 값이 서로 다른 열거형으로 교체)
+            timer_factory: 연속 단축키 대기 타이머 생성 함수 (threading.Timer와 같은 형식)
+        """
+        self._clock = clock
+        self.debounce = debounce
+        self._key_enum = key_enum
+        self._physical_bits = _PHYSICAL_BITS if key_enum is Key else _build_physical_bits(key_enum)
+        self._timer_factory = timer_factory
+        self._state = 0  # 눌린 수정자 키의 물리 비트
+        self._table = {}
+        # 진행 중인 연속 단축키 상태 (타이머 스레드와 공유하므로 잠금 사용)
+        self._sequence_lock = threading.Lock()
+        self._pending = None          # 현재 단계의 SequenceNode
+        self._pending_parent = None   # 현재 노드를 찾은 테이블 (자동 반복 무시용)
+        self._pending_key = None      # 현재 노드까지 오게 한 키
+        self._pending_deadline = 0.0
+        self._pending_timer = None
+        # 대기 시간이 지나 실행되는 단축키를 전달받는 함수 (binding, key), 타이머 스레드에서 호출됨
+        self.on_sequence_timeout = None
+        self.set_bindings(bindings)
+
+    def set_bindings(self, bindings):
+        """
+        단축키 목록 교체
+        새 테이블을 모두 만든 뒤 속성 하나만 바꾸므로 리스너 스레드는
+        항상 이전 테이블 또는 새 테이블 중 하나만 보게 됨
+
+        Raises:
+            ValueError: 잘못된 단축키가 포함된 경우 (기존 테이블 유지)
+        """
+        table = compile_bindings(list(bindings), self._key_enum)
+        self._cancel_sequence()
+        self._table = table
+
+    def reset(self):
+        """수정자 상태 초기화 (리스너 재시작 등으로 키 해제 이벤트를 놓쳤을 때)"""
+        self._state = 0
+        self._cancel_sequence()
+
+    @property
+    def sequence_pending(self):
+        """연속 단축키 입력이 진행 중인지 여부"""
+        return self._pending is not None
+
+    @property
+    def modifier_mask(self):
+        """현재 눌린 논리 수정자 마스크"""
+        return _LOGICAL_MASKS[self._state]
+
+    def on_press(self, key):
+        """
+        키 누름 처리
+
+        Returns:
+            인식된 HotkeyBinding 또는 None
+        """
+        if self._pending is not None:
+            return self._on_press_sequence(key)
+        return self._match(key)
+
+    def _match(self, key):
+        """대기 중인 연속 단축키가 없을 때의 키 누름 처리"""
+        if isinstance(key, KeyCode):
+            entry = self._lookup_entry()
+            if entry is None:
+                return None
+            binding = None
+            vk = key.vk
+            if vk is not None:
+                binding = entry[1].get(vk)
+            if binding is None:
+                char = key.char
+                if char is not None:
+                    binding = entry[2].get(char)
+        else:
+            bit = self._physical_bits.get(key)
+            if bit is not None:
+                self._state |= bit
+                return None
+            entry = self._lookup_entry()
+            if entry is None:
+                return None
+            binding = entry[0].get(key)
+
+        if binding is None:
+            return None
+        if binding.__class__ is SequenceNode:
+            self._begin_sequence(binding, self._table, key)
+            return None
+        return self._fire(binding)
+
+    def _fire(self, binding):
+        """디바운스 확인 후 인식된 단축키 반환"""
+        now = self._clock()
+        if now - binding.last_fired <= self.debounce:
+            return None
+        binding.last_fired = now
+        return binding
+
+    def _on_press_sequence(self, key):
+        """
+        연속 단축키 진행 중의 키 누름 처리
+
+        Returns:
+            인식된 HotkeyBinding 또는 None
+        """
+        if not isinstance(key, KeyCode):
+            bit = self._physical_bits.get(key)
+            if bit is not None:
+                self._state |= bit  # 다음 단계의 수정자 키는 대기 상태를 유지
+                return None
+
+        with self._sequence_lock:
+            node = self._pending
+            if node is None:
+                # 타이머가 방금 대기를 끝낸 경우
+                return self._match(key)
+            expired = self._clock() > self._pending_deadline
+            parent, pending_key = self._pending_parent, self._pending_key
+            self._end_sequence()
+
+        if expired:
+            # 타이머보다 키 입력이 먼저 처리된 경우 (시간 초과 단축키는 다음 키보다 먼저 전달)
+            self._notify_timeout(node, pending_key)
+            return self._match(key)
+
+        value = self._lookup_in(node.children, key)
+        if value is None:
+            if self._lookup_in(parent, key) is node:
+                # 앞 단계 키의 자동 반복은 무시하고 계속 대기
+                self._begin_sequence(node, parent, pending_key)
+                return None
+            # 이어지지 않는 키: 이 단계까지의 단축키가 있으면 실행, 없으면 일반 키로 처리
+            if node.binding is not None:
+                return self._fire(node.binding)
+            return self._match(key)
+        if value.__class__ is SequenceNode:
+            self._begin_sequence(value, node.children, key)
+            return None
+        return self._fire(value)
+
+    def _lookup_in(self, table, key):
+        """주어진 테이블에서 현재 수정자 상태와 키에 해당하는 값 조회"""
+        mask = _LOGICAL_MASKS[self._state]
+        entry = table.get(mask)
+        if entry is None and mask & _IGNORABLE_MASK:
+            entry = table.get(mask & ~_IGNORABLE_MASK)
+        if entry is None:
+            return None
+        if isinstance(key, KeyCode):
+            value = entry[1].get(key.vk) if key.vk is not None else None
+            if value is None and key.char is not None:
+                value = entry[2].get(key.char)
+            return value
+        return entry[0].get(key)
+
+    def _begin_sequence(self, node, parent, key):
+        """연속 단축키의 다음 단계 대기 시작 (타이머 시작)"""
+        with self._sequence_lock:
+            self._end_sequence()
+            self._pending = node
+            self._pending_parent = parent
+            self._pending_key = key
+            self._pending_deadline = self._clock() + node.timeout
+            timer = self._pending_timer = self._timer_factory(node.timeout, self._on_sequence_timer, (node,))
+            timer.daemon = True
+            timer.start()
+
+    def _end_sequence(self):
+        """대기 상태 해제 (잠금을 가진 상태에서 호출)"""
+        if self._pending_timer is not None:
+            self._pending_timer.cancel()
+            self._pending_timer = None
+        self._pending = self._pending_parent = self._pending_key = None
+
+    def _cancel_sequence(self):
+        """진행 중인 연속 단축키 취소 (시간 초과 단축키도 실행하지 않음)"""
+        with self._sequence_lock:
+            self._end_sequence()
+
+    def _on_sequence_timer(self, node):
+        """대기 시간 초과 (타이머 스레드에서 호출)"""
+        with self._sequence_lock:
+            if self._pending is not node:
+                return  # 이미 다음 단계로 넘어갔거나 취소됨
+            key = self._pending_key
+            self._end_sequence()
+        self._notify_timeout(node, key)
+
+    def _notify_timeout(self, node, key):
+        """시간이 지난 단계에 단축키가 있으면 on_sequence_timeout으로 전달"""
+        if node.binding is None or self.on_sequence_timeout is None:
+            return
+        binding = self._fire(node.binding)
+        if binding is not None:
+            self.on_sequence_timeout(binding, key)
+
+    def on_release(self, key):
+        """키 해제 처리 (수정자 상태만 갱신)"""
+        if not isinstance(key, KeyCode):
+            bit = self._physical_bits.get(key)
+            if bit is not None:
+                self._state &= ~bit
+
+    def _lookup_entry(self):
+        """현재 수정자 마스크에 해당하는 테이블 항목 반환"""
+        mask = _LOGICAL_MASKS[self._state]
+        table = self._table
+        entry = table.get(mask)
+        if entry is None and mask & _IGNORABLE_MASK:
+            entry = table.get(mask & ~_IGNORABLE_MASK)
+        return entry
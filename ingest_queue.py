@@ -0,0 +1,154 @@
+import collections
+import time
+
+# --- 클립보드 수집 대기열 관련 상수 ---
+INGEST_QUEUE_SIZE = 64       # 수집 대기열 최대 길이 (가득 차면 가장 오래된 항목을 버림)
+INGEST_MAX_PER_SEC = 20.0    # 초당 히스토리에 기록할 수 있는 항목 수 (이보다 빠르면 중간 항목을 건너뜀)
+INGEST_BURST = 10            # 짧은 시간 동안 한꺼번에 기록할 수 있는 항목 수
+INGEST_SETTLE_SEC = 0.15     # 이 시간 안에 다시 바뀌면 연속 변경으로 보고 이전 항목을 대체함
+INGEST_MAX_WAIT_SEC = 1.0    # 연속 변경이 계속되어도 이 시간이 지나면 가장 최근 항목을 기록
+
+
+class IngestQueue:
+    """
+    클립보드 변경 수집 대기열 (토큰 버킷 방식의 속도 제한)
+
+    스크립트가 클립보드를 초당 수백 번 바꾸는 경우, 허용 속도를 넘는 동안에는
+    중간 항목을 건너뛰고(coalesce) 가장 최근 항목만 남겨 두었다가 기록함.
+
+    감지 시점에서도 묶음: 앞 항목을 감지한 뒤 settle_sec 안에 다시 바뀌면 연속 변경으로 보고
+    앞 항목을 대체하며, 변경이 멈춘 뒤(또는 max_wait_sec이 지난 뒤)에 기록함.
+    모니터는 대기 중인 항목이 있는 동안 짧은 간격으로 확인하므로 연속 변경의 중간 항목도 감지됨.
+    """
+
+    def __init__(self, max_size=INGEST_QUEUE_SIZE, max_per_sec=INGEST_MAX_PER_SEC, burst=INGEST_BURST,
+                 clock=time.monotonic, settle_sec=INGEST_SETTLE_SEC, max_wait_sec=INGEST_MAX_WAIT_SEC):
+        """
+        초기화 함수
+
+        Args:
+            max_size: 대기열 최대 길이
+            max_per_sec: 초당 허용 항목 수 (0 이하이면 제한 없음)
+            burst: 토큰 버킷 크기
+            clock: 시간 함수 (테스트/벤치마크용)
+            settle_sec: 연속 변경으로 볼 감지 간격 (0이면 감지 시점에 묶지 않음)
+            max_wait_sec: 연속 변경 중에도 기록을 미루는 최대 시간
+        """
+        self.max_size = max(1, int(max_size))
+        self.max_per_sec = float(max_per_sec)
+        self.burst = max(1.0, float(burst))
+        self._clock = clock
+        self._queue = collections.deque()
+        self._tokens = self.burst
+        self._refilled_at = clock()
+        self.settle_sec = max(0.0, float(settle_sec))
+        self.max_wait_sec = max(self.settle_sec, float(max_wait_sec))
+        self._offered_at = float("-inf")      # 마지막으로 감지한 시각
+        self._burst_started_at = float("-inf")  # 대기 중인 마지막 항목의 연속 변경이 시작된 시각
+        self.captured = 0    # 대기열에 들어온 항목 수
+        self.coalesced = 0   # 연속 변경 또는 허용 속도 초과로 건너뛴 중간 항목 수 (같은 내용 반복 포함)
+        self.dropped = 0     # 대기열이 가득 차서 버린 항목 수
+        self.released = 0    # 기록하도록 내보낸 항목 수
+
+    @classmethod
+    def from_config(cls, config):
+        """설정 딕셔너리 ("ingest")로 생성"""
+        config = config or {}
+        return cls(
+            config.get("queue_size", INGEST_QUEUE_SIZE),
+            config.get("max_per_sec", INGEST_MAX_PER_SEC),
+            config.get("burst", INGEST_BURST),
+            settle_sec=float(config.get("settle_ms", INGEST_SETTLE_SEC * 1000)) / 1000.0,
+            max_wait_sec=float(config.get("max_wait_ms", INGEST_MAX_WAIT_SEC * 1000)) / 1000.0,
+        )
+
+    def __len__(self):
+        return len(self._queue)
+
+    def offer(self, text, timestamp):
+        """
+        새로 감지한 항목 추가
+
+        Args:
+            text: 항목 텍스트
+            timestamp: 복사 시각
+        """
+        queue = self._queue
+        now = self._clock()
+        self.captured += 1
+        in_burst = bool(queue) and (queue[-1][0] == text or now - self._offered_at < self.settle_sec)
+        self._offered_at = now
+        if in_burst:
+            queue[-1] = (text, timestamp)  # 같은 내용 반복 또는 연속 변경의 중간 항목 대체
+            self.coalesced += 1
+            return
+        if len(queue) >= self.max_size:
+            queue.popleft()
+            self.dropped += 1
+        queue.append((text, timestamp))
+        self._burst_started_at = now
+
+    def _settle_delay(self, now):
+        """마지막 항목의 연속 변경이 끝났다고 볼 때까지 남은 시간 (0이면 기록 가능)"""
+        remaining = min(self._offered_at + self.settle_sec, self._burst_started_at + self.max_wait_sec) - now
+        return remaining if remaining > 0 else 0.0
+
+    def _refill(self):
+        now = self._clock()
+        if self.max_per_sec > 0:
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.max_per_sec)
+        else:
+            self._tokens = float(len(self._queue)) or self.burst
+        self._refilled_at = now
+
+    def drain(self):
+        """
+        지금 기록할 수 있는 항목 꺼내기
+        허용량보다 많이 쌓여 있으면 가장 최근 항목만 남기고 나머지는 건너뜀
+
+        Returns:
+            (텍스트, 복사 시각) 리스트 (오래된 순서)
+        """
+        queue = self._queue
+        if not queue:
+            return []
+        self._refill()
+        if self._settle_delay(self._refilled_at) > 0:
+            return []  # 연속 변경 중 (다음 변경이 오면 마지막 항목이 대체됨)
+        available = int(self._tokens)
+        if len(queue) > available:
+            latest = queue.pop()
+            self.coalesced += len(queue)
+            queue.clear()
+            queue.append(latest)
+            if available < 1:
+                return []
+        batch = list(queue)
+        queue.clear()
+        self._tokens -= len(batch)
+        self.released += len(batch)
+        return batch
+
+    def next_delay(self):
+        """
+        대기 중인 항목을 기록할 수 있을 때까지 남은 시간 (초)
+
+        Returns:
+            대기 중인 항목이 없으면 None
+        """
+        if not self._queue:
+            return None
+        settle = self._settle_delay(self._clock())
+        if self.max_per_sec <= 0 or self._tokens >= 1:
+            return settle
+        return max(settle, (1 - self._tokens) / self.max_per_sec)
+
+    def stats(self):
+        """수집 통계 딕셔너리"""
+        return {
+            "captured": self.captured,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "released": self.released,
+            "pending": len(self._queue),
+        }
@@ -0,0 +1,217 @@
+import bisect
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+# --- 지연 시간 통계 관련 상수 ---
+LATENCY_DUMP_FILE = "latency_stats.json"
+HISTOGRAM_MIN_US = 1.0            # 가장 작은 버킷 경계 (마이크로초)
+HISTOGRAM_MAX_US = 60_000_000.0   # 가장 큰 버킷 경계 (60초)
+HISTOGRAM_GROWTH = 1.1            # 버킷 경계 증가율 (약 10% 해상도)
+
+
+def _build_bucket_bounds():
+    """로그 스케일 히스토그램 버킷 경계 생성"""
+    bounds = []
+    value = HISTOGRAM_MIN_US
+    while value < HISTOGRAM_MAX_US:
+        bounds.append(value)
+        value *= HISTOGRAM_GROWTH
+    bounds.append(HISTOGRAM_MAX_US)
+    return bounds
+
+
+_BUCKET_BOUNDS = _build_bucket_bounds()
+
+
+class LatencyHistogram:
+    """
+    로그 스케일 버킷에 지연 시간을 누적하는 히스토그램 클래스
+    샘플을 저장하지 않으므로 메모리 사용량이 일정함
+    """
+
+    def __init__(self):
+        self.counts = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total_us = 0.0
+        self.min_us = None
+        self.max_us = None
+
+    def record(self, elapsed_us):
+        """
+        지연 시간 기록
+
+        Args:
+            elapsed_us: 경과 시간 (마이크로초)
+        """
+        self.counts[bisect.bisect_left(_BUCKET_BOUNDS, elapsed_us)] += 1
+        self.count += 1
+        self.total_us += elapsed_us
+        if self.min_us is None or elapsed_us < self.min_us:
+            self.min_us = elapsed_us
+        if self.max_us is None or elapsed_us > self.max_us:
+            self.max_us = elapsed_us
+
+    def percentile(self, fraction):
+        """
+        백분위수 추정값 반환 (해당 버킷의 상한값, 최댓값을 넘지 않음)
+
+        Args:
+            fraction: 0.0 ~ 1.0 사이 값 (예: 0.95)
+
+        Returns:
+            마이크로초 단위 추정값 또는 기록이 없으면 None
+        """
+        if not self.count:
+            return None
+        threshold = fraction * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if bucket_count and cumulative >= threshold:
+                upper = _BUCKET_BOUNDS[index] if index < len(_BUCKET_BOUNDS) else self.max_us
+                return min(upper, self.max_us)
+        return self.max_us
+
+    def summary(self):
+        """밀리초 단위 요약 딕셔너리 반환"""
+        def to_ms(value_us):
+            return None if value_us is None else round(value_us / 1000.0, 3)
+
+        return {
+            "count": self.count,
+            "mean_ms": to_ms(self.total_us / self.count) if self.count else None,
+            "min_ms": to_ms(self.min_us),
+            "p50_ms": to_ms(self.percentile(0.50)),
+            "p95_ms": to_ms(self.percentile(0.95)),
+            "p99_ms": to_ms(self.percentile(0.99)),
+            "max_ms": to_ms(self.max_us),
+        }
+
+
+class LatencyTracker:
+    """
+    단조 시계(time.perf_counter) 기반 구간 측정 및 히스토그램 집계 클래스
+    여러 스레드(단축키 리스너, GUI)에서 동시에 사용 가능
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._marks = {}
+
+    @staticmethod
+    def now():
+        """현재 단조 시계 값 반환 (초)"""
+        return time.perf_counter()
+
+    def mark(self, name, timestamp=None):
+        """
+        구간 시작 시각 기록
+
+        Args:
+            name: 표시 이름 (예: "hotkey", "paste_click")
+            timestamp: 시작 시각 (기본값: 현재 시각)
+        """
+        self._marks[name] = self.now() if timestamp is None else timestamp
+
+    def get_mark(self, name):
+        """기록된 구간 시작 시각 반환 (없으면 None)"""
+        return self._marks.get(name)
+
+    def record(self, metric, elapsed_seconds):
+        """
+        측정값 기록
+
+        Args:
+            metric: 지표 이름
+            elapsed_seconds: 경과 시간 (초)
+        """
+        with self._lock:
+            histogram = self._histograms.get(metric)
+            if histogram is None:
+                histogram = self._histograms[metric] = LatencyHistogram()
+            histogram.record(elapsed_seconds * 1_000_000.0)
+
+    def record_since(self, mark_name, metric, end=None, clear=False):
+        """
+        표시 시각부터 현재(또는 end)까지의 경과 시간 기록
+
+        Args:
+            mark_name: 시작 표시 이름
+            metric: 기록할 지표 이름
+            end: 종료 시각 (기본값: 현재 시각)
+            clear: 기록 후 시작 표시를 지울지 여부 (한 번만 측정해야 하는 구간용)
+
+        Returns:
+            경과 시간(초) 또는 시작 표시가 없으면 None
+        """
+        start = self._marks.pop(mark_name, None) if clear else self._marks.get(mark_name)
+        if start is None:
+            return None
+        elapsed = (self.now() if end is None else end) - start
+        self.record(metric, elapsed)
+        return elapsed
+
+    @contextmanager
+    def span(self, metric):
+        """with 블록 실행 시간을 기록하는 컨텍스트 매니저"""
+        start = self.now()
+        try:
+            yield
+        finally:
+            self.record(metric, self.now() - start)
+
+    def timed(self, metric):
+        """함수 실행 시간을 기록하는 데코레이터"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                start = self.now()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(metric, self.now() - start)
+            return wrapper
+        return decorator
+
+    def snapshot(self):
+        """지표별 요약 딕셔너리 반환"""
+        with self._lock:
+            return {metric: histogram.summary() for metric, histogram in sorted(self._histograms.items())}
+
+    def format_summary(self):
+        """사람이 읽기 쉬운 요약 문자열 반환"""
+        snapshot = self.snapshot()
+        if not snapshot:
+            return "기록된 지연 시간이 없습니다."
+        lines = []
+        for metric, stats in snapshot.items():
+            lines.append(
+                f"{metric}: n={stats['count']} p50={stats['p50_ms']}ms "
+                f"p95={stats['p95_ms']}ms p99={stats['p99_ms']}ms max={stats['max_ms']}ms"
+            )
+        return "\n".join(lines)
+
+    def dump(self, path=LATENCY_DUMP_FILE):
+        """
+        요약을 JSON 파일로 저장
+
+        Returns:
+            저장한 파일 경로
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"generated_at": time.time(), "metrics": self.snapshot()}, f, indent=4)
+        return path
+
+    def reset(self):
+        """모든 기록 초기화"""
+        with self._lock:
+            self._histograms.clear()
+            self._marks.clear()
+
+
+# 애플리케이션 전역에서 공유하는 지연 시간 추적기
+latency_tracker = LatencyTracker()
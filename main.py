@@ -2,23 +2,32 @@ import sys
 import os
 import threading
 import time
-import traceback 
 
-from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu
+_PROCESS_STARTED_AT = time.perf_counter()  # 시작 시간 측정 기준 (무거운 모듈을 불러오기 전)
+
+from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QMessageBox
 from PyQt6.QtGui import QIcon, QPixmap, QColor
 from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer
 
-from PIL import Image as PILImage
-from pystray import Icon as PyStrayIcon, MenuItem as PyStrayMenuItem
-
 # --- 모듈화된 파일들에서 기능 import ---
+# 팝업/설정 UI(ui_components), 트레이 아이콘(PIL, pystray), 동기화(sync_service)와 지표 내보내기(metrics_exporter)는
+# 시작 시간을 줄이기 위해 필요할 때(설정에서 켜져 있을 때) 불러옴
 from config_manager import (
     load_config, save_config, 
     DEFAULT_HOTKEY_CONFIG, CONFIG_FILE, format_hotkey_for_display
 )
 from clipboard_monitor import ClipboardMonitorThread
 from hotkey_manager import HotkeyListenerThread
-from ui_components import ClipboardHistoryPopup, SettingsDialog
+from latency_tracker import latency_tracker
+from paste_pipeline import PasteController
+from app_logging import get_logger, redact, ring_buffer, setup_logging
+from metrics import metrics
+
+log = get_logger(__name__)
+
+# --- UI 갱신 관련 상수 ---
+UI_REFRESH_COALESCE_MS = 16  # 새 항목 알림을 모아 목록을 한 번만 갱신하는 간격 (한 프레임)
+STARTUP_DEFERRED_INIT_MS = 100  # 트레이 아이콘 표시 후 팝업 생성 등 나머지 준비를 시작하기까지의 대기 시간
 
 
 # --- Main Application (QObject) ---
@@ -26,29 +35,48 @@ class ClipboardManagerApp(QObject):
     _request_toggle_popup_signal = pyqtSignal()
     _request_open_settings_signal = pyqtSignal()
     _request_quit_signal = pyqtSignal()
+    _request_show_latency_signal = pyqtSignal()
 
-    def __init__(self):
+    def __init__(self, started_at=None):
+        """
+        초기화 함수
+        클립보드 모니터와 단축키 리스너, 트레이 아이콘만 바로 시작하고
+        팝업 등 나머지는 이벤트 루프가 시작된 뒤 유휴 시점에 준비함
+        
+        Args:
+            started_at: 시작 시간 측정 기준 시각 (latency_tracker.now() 기준, 기본값: 프로세스 시작 시각)
+        """
         super().__init__()
+        self.started_at = _PROCESS_STARTED_AT if started_at is None else started_at
+        latency_tracker.mark("startup", self.started_at)
+        latency_tracker.mark("first_capture", self.started_at)  # 클립보드 모니터가 한 번만 사용하고 지움
         self.app = QApplication.instance() 
         if not self.app: self.app = QApplication(sys.argv)
         self.app.setQuitOnLastWindowClosed(False)
         self.config = load_config()
+        setup_logging(self.config.get("logging"))
         
-        self.clipboard_history_popup = ClipboardHistoryPopup()
-        self.clipboard_history_popup.paste_requested_signal.connect(self.on_paste_requested)
-        
-        self.clipboard_monitor_thread = ClipboardMonitorThread(self.config.get("history", []))
-        self.clipboard_monitor_thread.new_clipboard_item.connect(self.handle_new_clipboard_item)
-        self.clipboard_monitor_thread.start()
+        self.paste_controller = PasteController(self.config.get("paste"), self)
+        self.paste_controller.paste_finished.connect(self.on_paste_finished)
         
-        # 초기화 시 클립보드 히스토리 로드
-        self.clipboard_history_popup.current_history_items = self.clipboard_monitor_thread.get_history()
+        self._popup = None  # 히스토리 팝업 (clipboard_history_popup 참고)
         
-        # 단축키 표시 업데이트
-        current_hotkey_conf = self.config.get("hotkey", DEFAULT_HOTKEY_CONFIG).copy()
-        self.clipboard_history_popup.status_label.setText(
-            "단축키: " + format_hotkey_for_display(current_hotkey_conf)
+        self.clipboard_monitor_thread = ClipboardMonitorThread(
+            self.config.get("history", []), self.config.get("history_times"),
+            self.config.get("usage_scores"), self.config.get("ingest")
         )
+        self.clipboard_monitor_thread.new_clipboard_item.connect(self.handle_new_clipboard_item)
+        
+        # 새 항목 알림이 연달아 와도 목록은 한 프레임에 한 번만 갱신
+        self._history_refresh_timer = QTimer(self)
+        self._history_refresh_timer.setSingleShot(True)
+        self._history_refresh_timer.setInterval(UI_REFRESH_COALESCE_MS)
+        self._history_refresh_timer.timeout.connect(self.refresh_history_view)
+        self.ui_refresh_coalesced = 0
+        self.sync_service = None
+        self.setup_sync_service()
+        self.metrics_exporter = None
+        self.clipboard_monitor_thread.start()
         
         self.hotkey_listener_thread = None
         self.setup_hotkey_listener()
@@ -58,27 +86,150 @@ class ClipboardManagerApp(QObject):
         self._request_toggle_popup_signal.connect(self.toggle_clipboard_history_popup)
         self._request_open_settings_signal.connect(self.open_settings_dialog)
         self._request_quit_signal.connect(self.quit_application)
+        self._request_show_latency_signal.connect(self.show_latency_stats)
         self.create_tray_icon()
+        
+        QTimer.singleShot(STARTUP_DEFERRED_INIT_MS, self.finish_startup)
+
+    @property
+    def clipboard_history_popup(self):
+        """히스토리 팝업 (보통 시작 직후 유휴 시점에 만들어지며, 그 전에 필요하면 바로 생성)"""
+        if self._popup is None:
+            self._build_popup()
+        return self._popup
+
+    def _build_popup(self):
+        """히스토리 팝업 생성 (ui_components 모듈도 이때 불러옴)"""
+        build_start = latency_tracker.now()
+        from ui_components import ClipboardHistoryPopup
+        
+        popup = ClipboardHistoryPopup()
+        popup.paste_requested_signal.connect(self.on_paste_requested)
+        popup.prewarm_enabled = bool(self.config.get("prewarm_popup", True))
+        
+        # 단축키 표시 업데이트
+        current_hotkey_conf = self.config.get("hotkey", DEFAULT_HOTKEY_CONFIG).copy()
+        popup.status_label.setText("단축키: " + format_hotkey_for_display(current_hotkey_conf))
+        
+        # 클립보드 히스토리 로드 (pre-warm 모드면 다음 유휴 시점에 카드까지 미리 생성)
+        popup.current_history_items = self.clipboard_monitor_thread.get_history()
+        self._popup = popup
+        popup.mark_content_dirty()
+        latency_tracker.record("popup_build", latency_tracker.now() - build_start)
+
+    def _popup_visible(self):
+        """팝업이 만들어져 있고 화면에 표시 중인지 여부 (팝업을 새로 만들지 않음)"""
+        return self._popup is not None and self._popup.isVisible()
+
+    @pyqtSlot()
+    def finish_startup(self):
+        """트레이 아이콘 표시 후 나머지 준비 (팝업 생성, 붙여넣기 준비)"""
+        if self._popup is None:
+            self._build_popup()
+        self.paste_controller.warm_up()
+        self.setup_metrics_exporter()
+        elapsed = latency_tracker.record_since("startup", "startup_to_ready")
+        if elapsed is not None:
+            log.info("시작 준비 완료: %.0fms", elapsed * 1000)
+
+    def _on_tray_ready(self):
+        """트레이 아이콘이 표시된 시점 기록"""
+        elapsed = latency_tracker.record_since("startup", "startup_to_tray")
+        if elapsed is not None:
+            log.info("트레이 아이콘 표시: 시작 후 %.0fms", elapsed * 1000)
+
+    def _on_pystray_setup(self, icon):
+        """pystray 아이콘 루프 시작 시 호출 (트레이 스레드)"""
+        icon.visible = True
+        self._on_tray_ready()
 
     def setup_hotkey_listener(self):
         """단축키 감지 스레드 설정/재설정"""
-        print("단축키 리스너 설정...")
+        log.info("단축키 리스너 설정...")
+        current_hotkey_conf = self.config.get("hotkey", DEFAULT_HOTKEY_CONFIG).copy()
+        binding_configs = self.config.get("bindings", [])
         
-        # 기존 리스너가 실행 중이면 중지
+        # 리스너가 실행 중이면 단축키 테이블만 교체 (키보드 후킹을 다시 시작하지 않음)
         if self.hotkey_listener_thread and self.hotkey_listener_thread.isRunning():
-            print("기존 핫키 리스너 중지...")
-            self.hotkey_listener_thread.stop()
-            self.hotkey_listener_thread.wait(1000)
-            print("기존 핫키 리스너 중지 완료")
+            self.hotkey_listener_thread.update_bindings(current_hotkey_conf, binding_configs)
+            log.info("핫키 리스너 단축키 교체됨: %s", format_hotkey_for_display(current_hotkey_conf))
+            return
             
         # 새 리스너 생성 및 시작
-        current_hotkey_conf = self.config.get("hotkey", DEFAULT_HOTKEY_CONFIG).copy()
-        self.hotkey_listener_thread = HotkeyListenerThread(current_hotkey_conf)
-        self.hotkey_listener_thread.hotkey_pressed_signal.connect(self.toggle_clipboard_history_popup)
+        self.hotkey_listener_thread = HotkeyListenerThread(current_hotkey_conf, binding_configs)
+        self.hotkey_listener_thread.hotkey_pressed_signal.connect(self.on_hotkey_pressed)
+        self.hotkey_listener_thread.action_triggered.connect(self.on_hotkey_action)
+        self.hotkey_listener_thread.listener_died.connect(self.on_hotkey_listener_died)
         self.hotkey_listener_thread.start()
-        print(f"새 핫키 리스너 시작됨: {format_hotkey_for_display(current_hotkey_conf)}")
+        log.info("새 핫키 리스너 시작됨: %s", format_hotkey_for_display(current_hotkey_conf))
+
+    @pyqtSlot(int, str)
+    def on_hotkey_listener_died(self, restart_count, reason):
+        """단축키 리스너가 예기치 않게 종료되었을 때 호출 (재시작은 리스너 스레드가 직접 수행)"""
+        log.warning("단축키 리스너 종료됨 (누적 %s회): %s", restart_count, reason)
+
+    def setup_metrics_exporter(self):
+        """설정에서 지표 내보내기가 켜져 있으면 localhost HTTP 포트/Unix 소켓으로 지표 제공"""
+        metrics_config = self.config.get("metrics") or {}
+        if not metrics_config.get("enabled"):
+            return
+        try:
+            from metrics_exporter import MetricsExporter
+            self.metrics_exporter = MetricsExporter.from_config(metrics_config)
+            if self.metrics_exporter:
+                for address in self.metrics_exporter.start():
+                    log.info("지표 내보내기: %s", address)
+        except Exception as e:
+            log.error("지표 내보내기 시작 오류: %s", e)
+            self.metrics_exporter = None
+
+    def setup_sync_service(self):
+        """설정에서 동기화가 켜져 있으면 LAN 클립보드 동기화 서비스 시작"""
+        sync_config = self.config.get("sync") or {}
+        if not sync_config.get("enabled"):
+            return
+        try:
+            from sync_service import SyncService
+            self.sync_service = SyncService(
+                port=int(sync_config.get("port", 0) or 0),
+                peers=sync_config.get("peers", []),
+                host=sync_config.get("host", ""),
+                secret=sync_config.get("secret", ""),
+                name=sync_config.get("name", ""),
+                on_remote_clip=lambda text, timestamp, origin, live: self.handle_remote_clip(text, timestamp, live),
+            )
+            # 재연결 시 차이만 교환할 수 있도록 현재 히스토리 요약을 만들고 이후 변경을 추적
+            self.sync_service.load_history(
+                (text, (ClipboardMonitorThread.get_meta(text) or {}).get("time", time.time()))
+                for text in ClipboardMonitorThread.clipboard_history
+            )
+            ClipboardMonitorThread.history_listeners.append(self._on_history_changed)
+            self.sync_service.start()
+            self.clipboard_monitor_thread.on_ingest = self.sync_service.publish
+            self.clipboard_monitor_thread.on_remote_rejected = self.sync_service.reject
+        except Exception as e:
+            log.error("동기화 서비스 시작 오류: %s", e)
+            self.sync_service = None
+
+    def _on_history_changed(self, added, timestamp, removed):
+        """히스토리 변경을 동기화 요약에 반영 (히스토리를 바꾼 스레드에서 호출됨)"""
+        if removed is not None:
+            self.sync_service.untrack(removed)
+        if added is not None:
+            self.sync_service.track(added, timestamp)
+
+    def handle_remote_clip(self, item_text, timestamp, live):
+        """
+        다른 기기에서 받은 항목을 모니터 스레드의 기록 대기열에 추가 (동기화 스레드에서 호출됨)
+        모니터 스레드가 묶어서 기록/저장한 뒤 new_clipboard_item 신호로 목록 갱신을 알림
+        재연결 동기화로 받은 이전 항목(live=False)은 클립보드에 복사하지 않음
+        """
+        apply_to_clipboard = live and bool((self.config.get("sync") or {}).get("apply_to_clipboard", True))
+        self.clipboard_monitor_thread.queue_remote_item(item_text, timestamp, apply_to_clipboard)
 
     def create_tray_icon(self):
+        from PIL import Image as PILImage
+        
         icon_image, icon_path = None, None
         try:
             if getattr(sys, 'frozen', False):
@@ -91,23 +242,28 @@ class ClipboardManagerApp(QObject):
                 icon_image = PILImage.open(icon_path)
                 icon_image = icon_image.convert('RGBA') if icon_image.mode != 'RGBA' else icon_image
         except Exception as e:
-            print(f"Error loading icon image: {e}")
+            log.error("Error loading icon image: %s", e)
             icon_image = None
 
         if icon_image is None:
             icon_image = PILImage.new('RGBA', (64,64), (70,130,180,255)) # 기본 아이콘
 
         try:
+            from pystray import Icon as PyStrayIcon, MenuItem as PyStrayMenuItem
+            
             menu_items = (
                 PyStrayMenuItem('클립보드 보기', self.toggle_clipboard_history_popup_threadsafe),
                 PyStrayMenuItem('설정', self.open_settings_dialog_threadsafe),
+                PyStrayMenuItem('지연 시간 통계', self.show_latency_stats_threadsafe),
                 PyStrayMenuItem('종료', self.quit_application_threadsafe)
             )
             self.tray_icon = PyStrayIcon("clipboard_manager", icon_image, "클립보드 매니저", menu_items)
-            self.tray_thread = threading.Thread(target=self.tray_icon.run, daemon=True)
+            self.tray_thread = threading.Thread(
+                target=self.tray_icon.run, kwargs={"setup": self._on_pystray_setup}, daemon=True
+            )
             self.tray_thread.start()
         except Exception as e:
-            print(f"pystray failed: {e}. Using Qt fallback.")
+            log.warning("pystray failed: %s. Using Qt fallback.", e)
             q_icon = QIcon(icon_path) if icon_path and os.path.exists(icon_path) else QIcon.fromTheme("edit-copy")
             if q_icon.isNull():
                 pixmap = QPixmap(64,64)
@@ -119,20 +275,35 @@ class ClipboardManagerApp(QObject):
             menu = QMenu()
             menu.addAction("클립보드 보기", self.toggle_clipboard_history_popup)
             menu.addAction("설정", self.open_settings_dialog)
+            menu.addAction("지연 시간 통계", self.show_latency_stats)
             menu.addSeparator()
             menu.addAction("종료", self.quit_application)
             self.qt_tray_icon.setContextMenu(menu)
             self.qt_tray_icon.show()
+            self._on_tray_ready()
 
     def handle_new_clipboard_item(self, item_text):
-        """새 클립보드 항목이 감지되었을 때 처리"""
+        """새 클립보드 항목이 감지되었을 때 처리 (목록 갱신은 다음 프레임에 한 번으로 묶음)"""
+        if self._history_refresh_timer.isActive():
+            self.ui_refresh_coalesced += 1
+            return
+        self._history_refresh_timer.start()
+
+    @pyqtSlot()
+    def refresh_history_view(self):
+        """모아 둔 새 항목 알림을 팝업 목록에 반영"""
         # 현재 클립보드 히스토리 가져오기
         current_history = ClipboardMonitorThread.get_history()
         
-        # 팝업이 열려 있을 때만 히스토리 실시간 업데이트
-        if self.clipboard_history_popup.isVisible():
-            print(f"새 클립보드 항목 감지됨: {item_text[:30]}... - 목록 업데이트")
-            self.clipboard_history_popup.update_history(current_history)
+        # 팝업이 열려 있으면 바로 업데이트, 숨겨져 있으면 다음 표시 전에 갱신되도록 표시
+        # (팝업이 아직 없으면 만들 때 최신 히스토리를 읽음)
+        if self._popup is None:
+            return
+        if self._popup.isVisible():
+            log.debug("새 클립보드 항목 감지됨 - 목록 업데이트")
+            self._popup.update_history(current_history)
+        else:
+            self._popup.mark_content_dirty()
 
     @pyqtSlot(str)
     def on_paste_requested(self, text_to_paste):
@@ -142,59 +313,119 @@ class ClipboardManagerApp(QObject):
         Args:
             text_to_paste: 붙여넣을 텍스트
         """
-        print(f"붙여넣기 요청: {text_to_paste[:30]}...")
+        log.debug("붙여넣기 요청: %s", redact(text_to_paste))
+        
+        # "자주 쓰는 항목" 순위를 위한 사용 기록
+        ClipboardMonitorThread.record_use(text_to_paste)
         
         # 팝업이 화면에서 사라지게 하기 (UI_components에서 이미 처리되고 있지만 확실히 하기 위해)
-        if self.clipboard_history_popup.isVisible():
+        if self._popup_visible():
             self.clipboard_history_popup.hide_popup()
             
-        # 팝업의 _perform_paste 메서드 호출 (자체적으로 클립보드 설정 및 키 시뮬레이션 수행)
-        self.clipboard_history_popup._perform_paste(text_to_paste)
+        # 팝업이 숨겨지고 포커스가 돌아온 뒤 클립보드 설정 및 키 시뮬레이션 수행 (비동기)
+        self.paste_controller.request_paste(text_to_paste, self._popup)
+
+    @pyqtSlot(bool, str)
+    def on_paste_finished(self, success, method):
+        """붙여넣기 완료 처리"""
+        if success:
+            log.debug("붙여넣기 작업 완료 (%s).", method)
+        else:
+            log.warning("붙여넣기 작업 실패 (%s).", method)
 
     @pyqtSlot()
-    def toggle_clipboard_history_popup(self):
+    def on_hotkey_pressed(self):
+        """단축키 신호 처리 (신호 발생 시각을 넘겨 표시 지연 시간을 측정)"""
+        signal_time = None
+        if self.hotkey_listener_thread:
+            signal_time = self.hotkey_listener_thread.last_signal_time or None
+        self.toggle_clipboard_history_popup(signal_time)
+
+    @pyqtSlot(str, int)
+    def on_hotkey_action(self, action, arg):
+        """팝업 열기 외의 단축키 동작 처리"""
+        if action == "open_settings":
+            self.open_settings_dialog()
+        elif action == "toggle_monitoring":
+            self.toggle_monitoring()
+        elif action == "paste_recent":
+            self.paste_recent_item(arg)
+        elif action == "open_frequent":
+            self.open_frequent_items()
+        else:
+            log.warning("알 수 없는 단축키 동작: %s", action)
+
+    def open_frequent_items(self):
+        """팝업을 열고 자주 쓰는 항목 탭으로 이동"""
+        signal_time = self.hotkey_listener_thread.last_signal_time if self.hotkey_listener_thread else None
+        self.clipboard_history_popup.show_popup_animated(signal_time or None)
+        self.clipboard_history_popup.change_category(1)
+
+    def toggle_monitoring(self):
+        """클립보드 기록 일시 정지/재개"""
+        monitor = self.clipboard_monitor_thread
+        monitor.paused = not monitor.paused
+        state_text = "일시 정지됨" if monitor.paused else "재개됨"
+        log.info("클립보드 기록 %s", state_text)
+        if hasattr(self, 'qt_tray_icon') and self.qt_tray_icon:
+            self.qt_tray_icon.showMessage("클립보드 매니저", f"클립보드 기록 {state_text}")
+
+    def paste_recent_item(self, n):
+        """
+        N번째 최근 히스토리 항목 빠른 붙여넣기 (1이 가장 최근 항목)
+        팝업 위젯을 만들거나 표시하지 않고 바로 클립보드 쓰기와 키 전송을 진행함
+        """
+        # 히스토리 리스트를 복사하지 않고 해당 항목만 읽음
+        history = ClipboardMonitorThread.clipboard_history
+        try:
+            text = history[-n] if n >= 1 else None
+        except IndexError:
+            text = None
+        if text is None:
+            log.info("붙여넣을 %s번째 항목이 없습니다.", n)
+            return
+        
+        # 팝업이 열려 있으면 포커스가 팝업에 있으므로 일반 경로 사용
+        if self._popup_visible():
+            self.on_paste_requested(text)
+            return
+        
+        ClipboardMonitorThread.record_use(text)
+        listener = self.hotkey_listener_thread
+        modifiers_held = (lambda: listener.matcher.modifier_mask != 0) if listener else None
+        self.paste_controller.request_quick_paste(text, modifiers_held)
+
+    @pyqtSlot()
+    def toggle_clipboard_history_popup(self, requested_at=None):
+        toggle_start = latency_tracker.now()
+        if requested_at is not None:
+            latency_tracker.record("hotkey_to_toggle", toggle_start - requested_at)
+        
         # 현재 상태 확인
         is_visible = self.clipboard_history_popup.isVisible()
         current_opacity = self.clipboard_history_popup.opacity_effect.opacity()
         animation_state = self.clipboard_history_popup.animation.state()
         
         # 디버깅 정보 출력
-        print(f"토글 호출됨: 보이기={is_visible}, 투명도={current_opacity}, 애니메이션 상태={animation_state}")
-        
-        # 단축키 리스너 생존 확인, 종료된 경우 재시작
-        if self.hotkey_listener_thread and not self.hotkey_listener_thread.isRunning():
-            print("단축키 리스너가 종료됨, 재시작합니다...")
-            self.setup_hotkey_listener()
+        log.debug("토글 호출됨: 보이기=%s, 투명도=%s, 애니메이션 상태=%s", is_visible, current_opacity, animation_state)
         
         # 완전히 표시된 상태
         if is_visible and abs(current_opacity - 1.0) < 0.01:
-            print("팝업 숨기기...")
+            log.debug("팝업 숨기기...")
             self.clipboard_history_popup.hide_popup()
         # 숨겨진 상태 또는 사라지는 중
         elif not is_visible or abs(current_opacity - 0.0) < 0.01:
-            print("팝업 표시하기...")
-            # 표시하기 전에 최신 클립보드 히스토리로 업데이트
-            self.refresh_clipboard_history()
-            self.clipboard_history_popup.show_popup_animated()
+            log.debug("팝업 표시하기...")
+            # 미리 준비되지 않은 경우 show_popup_animated 내부에서 최신 히스토리로 한 번만 갱신
+            self.clipboard_history_popup.show_popup_animated(requested_at)
         # 애니메이션 진행 중 - 현재 상태의 반대로 전환
         else:
-            print(f"애니메이션 진행 중 (opacity={current_opacity}), 현재 상태 전환")
+            log.debug("애니메이션 진행 중 (opacity=%s), 현재 상태 전환", current_opacity)
             if current_opacity > 0.5:
                 self.clipboard_history_popup.hide_popup()
-            else:
-                # 표시하기 전에 최신 클립보드 히스토리로 업데이트
-                self.refresh_clipboard_history()
-            self.clipboard_history_popup.show_popup_animated()
-    
-    def refresh_clipboard_history(self):
-        """최신 클립보드 히스토리로 UI 업데이트"""
-        try:
-            current_history = ClipboardMonitorThread.get_history()
-            print(f"클립보드 히스토리 새로고침: {len(current_history)}개 항목")
-            self.clipboard_history_popup.current_history_items = current_history
-            self.clipboard_history_popup.update_displayed_items()
-        except Exception as e:
-            print(f"클립보드 히스토리 새로고침 중 오류: {e}")
+            self.clipboard_history_popup.show_popup_animated(requested_at)
+        
+        latency_tracker.record("toggle_popup", latency_tracker.now() - toggle_start)
 
     def toggle_clipboard_history_popup_threadsafe(self):
         self._request_toggle_popup_signal.emit()
@@ -205,6 +436,8 @@ class ClipboardManagerApp(QObject):
             self.settings_dialog.activateWindow()
             return
         
+        from ui_components import SettingsDialog
+        
         current_conf = self.config.get("hotkey", DEFAULT_HOTKEY_CONFIG).copy()
         parent_widget = QApplication.activeWindow() 
         self.settings_dialog = SettingsDialog(current_conf, parent=parent_widget) 
@@ -216,59 +449,90 @@ class ClipboardManagerApp(QObject):
     def open_settings_dialog_threadsafe(self):
         self._request_open_settings_signal.emit()
 
+    @pyqtSlot()
+    def show_latency_stats(self):
+        """지연 시간 통계(p50/p95/p99)를 파일로 저장하고 요약을 표시"""
+        summary = latency_tracker.format_summary()
+        ingest = self.clipboard_monitor_thread.ingest_stats()
+        summary += (
+            f"\n\n클립보드 수집: 감지 {ingest['captured']}, 기록 {ingest['released']}, "
+            f"건너뜀 {ingest['coalesced']}, 버림 {ingest['dropped']}, 저장 {ingest['batches']}회, "
+            f"목록 갱신 생략 {self.ui_refresh_coalesced}"
+        )
+        if self.sync_service:
+            summary += "\n\n" + self.sync_service.format_peer_stats()
+        log.info("지연 시간 통계:\n%s", summary)
+        try:
+            dump_path = os.path.abspath(latency_tracker.dump())
+        except Exception as e:
+            log.error("지연 시간 통계 저장 중 오류: %s", e)
+            dump_path = None
+        try:
+            log_path = os.path.abspath(ring_buffer.dump())
+        except Exception as e:
+            log.error("최근 로그 저장 중 오류: %s", e)
+            log_path = None
+        try:
+            metrics_path = os.path.abspath(metrics.dump())
+        except Exception as e:
+            log.error("지표 저장 중 오류: %s", e)
+            metrics_path = None
+        
+        msg_box = QMessageBox()
+        msg_box.setWindowTitle("지연 시간 통계")
+        msg_box.setText(summary)
+        saved = [path for path in (dump_path, log_path, metrics_path) if path]
+        if saved:
+            msg_box.setInformativeText("저장 위치: " + ", ".join(saved))
+        msg_box.setIcon(QMessageBox.Icon.Information)
+        msg_box.exec()
+
+    def show_latency_stats_threadsafe(self):
+        self._request_show_latency_signal.emit()
+
     @pyqtSlot(dict)
     def on_hotkey_settings_updated(self, new_hotkey_config):
         """단축키 설정 업데이트 처리"""
-        print(f"단축키 설정 업데이트 요청: {new_hotkey_config}")
+        log.info("단축키 설정 업데이트 요청: %s", new_hotkey_config)
         
         # 단축키 설정 업데이트 및 저장
         self.config["hotkey"] = new_hotkey_config
         save_config(self.config)
         
         # 단축키 표시 업데이트
-        self.clipboard_history_popup.status_label.setText(
-            "단축키: " + format_hotkey_for_display(new_hotkey_config)
-        )
+        if self._popup is not None:
+            self._popup.status_label.setText(
+                "단축키: " + format_hotkey_for_display(new_hotkey_config)
+            )
         
         # 핫키 리스너 재설정
         self.setup_hotkey_listener()
-        print(f"단축키가 업데이트됨: {format_hotkey_for_display(new_hotkey_config)}")
+        log.info("단축키가 업데이트됨: %s", format_hotkey_for_display(new_hotkey_config))
 
     def run(self):
-        print("Starting application event loop...")
-        
-        # 리스너 체크 타이머 설정
-        self.check_listener_timer = QTimer()
-        self.check_listener_timer.timeout.connect(self.check_and_restart_listener)
-        self.check_listener_timer.start(10000)  # 10초마다 리스너 상태 확인
+        log.info("Starting application event loop...")
         
         if not self.app:
             return -1
         return self.app.exec()
         
-    def check_and_restart_listener(self):
-        """단축키 리스너 상태를 확인하고 필요시 재시작"""
-        if self.hotkey_listener_thread and not self.hotkey_listener_thread.isRunning():
-            print("단축키 리스너 스레드가 종료됨, 자동으로 재시작합니다...")
-            self.setup_hotkey_listener()
-
     @pyqtSlot()
     def quit_application(self):
-        print("SLOT: quit_application called")
+        log.info("SLOT: quit_application called")
         try:
             # 트레이 아이콘 정리
             if hasattr(self, 'tray_icon') and self.tray_icon:
                 try:
                     self.tray_icon.stop()
                 except Exception as e:
-                    print(f"트레이 아이콘 종료 중 오류: {e}")
+                    log.error("트레이 아이콘 종료 중 오류: %s", e)
             
             # 트레이 스레드 정리
             if hasattr(self, 'tray_thread') and self.tray_thread and self.tray_thread.is_alive():
                 try:
                     self.tray_thread.join(timeout=0.5)
                 except Exception as e:
-                    print(f"트레이 스레드 정리 중 오류: {e}")
+                    log.error("트레이 스레드 정리 중 오류: %s", e)
 
             # 핫키 리스너 스레드 정리
             if self.hotkey_listener_thread and self.hotkey_listener_thread.isRunning():
@@ -276,10 +540,10 @@ class ClipboardManagerApp(QObject):
                     self.hotkey_listener_thread.stop()
                     success = self.hotkey_listener_thread.wait(500)
                     if not success:
-                        print("핫키 리스너 스레드 종료 타임아웃, 강제 종료 시도")
+                        log.warning("핫키 리스너 스레드 종료 타임아웃, 강제 종료 시도")
                         self.hotkey_listener_thread.terminate()
                 except Exception as e:
-                    print(f"핫키 리스너 스레드 종료 중 오류: {e}")
+                    log.error("핫키 리스너 스레드 종료 중 오류: %s", e)
 
             # 클립보드 모니터 스레드 정리
             if self.clipboard_monitor_thread and self.clipboard_monitor_thread.isRunning():
@@ -287,11 +551,51 @@ class ClipboardManagerApp(QObject):
                     self.clipboard_monitor_thread.stop()
                     success = self.clipboard_monitor_thread.wait(500)
                     if not success:
-                        print("클립보드 모니터 스레드 종료 타임아웃, 강제 종료 시도")
+                        log.warning("클립보드 모니터 스레드 종료 타임아웃, 강제 종료 시도")
                         self.clipboard_monitor_thread.terminate()
                 except Exception as e:
-                    print(f"클립보드 모니터 스레드 종료 중 오류: {e}")
+                    log.error("클립보드 모니터 스레드 종료 중 오류: %s", e)
             
+            # 동기화 서비스 정리
+            if self.sync_service:
+                try:
+                    self.clipboard_monitor_thread.on_ingest = None
+                    ClipboardMonitorThread.history_listeners.remove(self._on_history_changed)
+                    self.sync_service.stop()
+                except Exception as e:
+                    log.error("동기화 서비스 종료 중 오류: %s", e)
+            
+            # 지표 내보내기 정리
+            if self.metrics_exporter:
+                try:
+                    self.metrics_exporter.stop()
+                except Exception as e:
+                    log.error("지표 내보내기 종료 중 오류: %s", e)
+            
+            # 편집 중인 메모 저장
+            try:
+                if self._popup is not None:
+                    self._popup.flush_notes()
+            except Exception as e:
+                log.error("메모 저장 중 오류: %s", e)
+            
+            # 마지막 저장 이후의 사용 빈도 기록 저장
+            try:
+                ClipboardMonitorThread.save_usage()
+            except Exception as e:
+                log.error("사용 빈도 저장 중 오류: %s", e)
+            
+            # 팝업 검색 스레드 정리
+            search_worker = getattr(self._popup, 'search_worker', None)
+            if search_worker and search_worker.isRunning():
+                try:
+                    search_worker.stop()
+                    if not search_worker.wait(500):
+                        log.warning("검색 스레드 종료 타임아웃, 강제 종료 시도")
+                        search_worker.terminate()
+                except Exception as e:
+                    log.error("검색 스레드 종료 중 오류: %s", e)
+
             # 설정 다이얼로그의 단축키 기록 스레드 정리
             if self.settings_dialog:
                 try:
@@ -302,20 +606,19 @@ class ClipboardManagerApp(QObject):
                                 rec_thread.stop_listener_and_quit()
                                 success = rec_thread.wait(500)
                                 if not success:
-                                    print("단축키 기록 스레드 종료 타임아웃, 강제 종료 시도")
+                                    log.warning("단축키 기록 스레드 종료 타임아웃, 강제 종료 시도")
                                     rec_thread.terminate()
                             except Exception as e:
-                                print(f"단축키 기록 스레드 종료 중 오류: {e}")
+                                log.error("단축키 기록 스레드 종료 중 오류: %s", e)
                 except Exception as e:
-                    print(f"설정 다이얼로그 정리 중 오류: {e}")
+                    log.error("설정 다이얼로그 정리 중 오류: %s", e)
 
             # 애플리케이션 종료
-            print("모든 스레드 정리 완료, 애플리케이션 종료")
+            log.info("모든 스레드 정리 완료, 애플리케이션 종료")
             if self.app:
                 self.app.quit()
         except Exception as e:
-            print(f"애플리케이션 종료 중 오류: {e}")
-            traceback.print_exc()
+            log.exception("애플리케이션 종료 중 오류: %s", e)
             # 심각한 오류 발생 시 강제 종료
             try:
                 if self.app:
@@ -329,11 +632,12 @@ class ClipboardManagerApp(QObject):
         self._request_quit_signal.emit()
 
 if __name__ == "__main__":
-    print("Application starting...")
+    setup_logging()  # 설정 파일을 읽은 뒤 ClipboardManagerApp에서 다시 설정함
+    log.info("Application starting...")
     
     # Mac 환경 접근성 권한 안내
     if sys.platform == "darwin":
-        print("""
+        log.warning("""
 =================================================
 중요한 안내: macOS 접근성 권한 설정 필요
 =================================================
@@ -366,16 +670,15 @@ if __name__ == "__main__":
     try:
         manager_app = ClipboardManagerApp()
         exit_code = manager_app.run()
-        print(f"Application finished with exit code: {exit_code}")
+        log.info("Application finished with exit code: %s", exit_code)
         sys.exit(exit_code)
     except Exception as e:
-        print(f"애플리케이션 실행 중 오류 발생: {e}")
-        traceback.print_exc()
+        log.exception("애플리케이션 실행 중 오류 발생: %s", e)
         
         # Mac에서 접근성 권한 관련 오류 확인
         error_msg = str(e).lower()
         if sys.platform == "darwin" and ("accessibility" in error_msg or "permission" in error_msg or "authorization" in error_msg):
-            print("""
+            log.error("""
 =================================================
 접근성 권한 문제로 앱이 종료되었습니다.
 시스템 환경설정 > 개인 정보 보호 및 보안 > 손쉬운 사용에서 이 앱을 활성화하세요.
@@ -0,0 +1,213 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from latency_tracker import LatencyHistogram
+
+# --- 지표 관련 상수 ---
+METRICS_DUMP_FILE = "metrics.prom"
+SUMMARY_QUANTILES = (0.5, 0.95, 0.99)
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labelnames, values, extra=()):
+    pairs = [f'{name}="{_escape_label(value)}"' for name, value in zip(labelnames, values)]
+    pairs.extend(f'{name}="{_escape_label(value)}"' for name, value in extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value):
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """지표 공통 부분 (이름, 설명, 레이블 이름)"""
+    kind = "untyped"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name}: 레이블이 맞지 않습니다 ({', '.join(self.labelnames)})")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self):
+        """(이름 접미사, 레이블 문자열, 값) 목록"""
+        return []
+
+
+class Counter(_Metric):
+    """증가만 하는 누적 값 (예: 수집한 항목 수)"""
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values = {} if self.labelnames else {(): 0}
+
+    def inc(self, amount=1, **labels):
+        """
+        값 증가
+
+        Args:
+            amount: 증가량 (0 이상)
+            labels: 레이블 값 (예: method="SendInput")
+        """
+        key = self._key(labels) if labels or self.labelnames else ()
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        key = self._key(labels) if labels or self.labelnames else ()
+        return self._values.get(key, 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [("", _format_labels(self.labelnames, key), value) for key, value in items]
+
+
+class Gauge(_Metric):
+    """
+    현재 값 (예: 히스토리 크기)
+    func를 지정하면 내보낼 때마다 호출해서 값을 구함 (값이 바뀔 때마다 갱신할 필요 없음)
+    """
+    kind = "gauge"
+
+    def __init__(self, name, documentation, func=None):
+        super().__init__(name, documentation)
+        self._value = 0
+        self._func = func
+
+    def set(self, value):
+        self._value = value
+
+    def set_function(self, func):
+        self._func = func
+
+    def value(self):
+        return self._func() if self._func is not None else self._value
+
+    def samples(self):
+        return [("", "", self.value())]
+
+
+class Summary(_Metric):
+    """
+    소요 시간 분포 (초 단위, 백분위수/합계/횟수로 내보냄)
+    latency_tracker와 같은 로그 스케일 히스토그램을 사용하므로 메모리 사용량이 일정함
+    """
+    kind = "summary"
+
+    def __init__(self, name, documentation):
+        super().__init__(name, documentation)
+        self._histogram = LatencyHistogram()
+
+    def observe(self, seconds):
+        with self._lock:
+            self._histogram.record(seconds * 1_000_000.0)
+
+    @contextmanager
+    def time(self):
+        """with 블록 실행 시간을 기록하는 컨텍스트 매니저"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def samples(self):
+        with self._lock:
+            histogram = self._histogram
+            samples = []
+            if histogram.count:
+                for quantile in SUMMARY_QUANTILES:
+                    samples.append(("", _format_labels((), (), [("quantile", quantile)]),
+                                    histogram.percentile(quantile) / 1_000_000.0))
+            samples.append(("_sum", "", histogram.total_us / 1_000_000.0))
+            samples.append(("_count", "", histogram.count))
+        return samples
+
+
+class MetricsRegistry:
+    """
+    프로세스 안의 지표 모음
+    각 모듈이 불러올 때 지표를 등록하고 값을 기록하며, Prometheus 텍스트 형식으로 내보냄
+    같은 이름으로 다시 등록하면 기존 지표를 반환함
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def _register(self, cls, name, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"{name}: 이미 다른 유형의 지표로 등록되어 있습니다")
+            return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name, documentation, func=None):
+        gauge = self._register(Gauge, name, documentation)
+        if func is not None:
+            gauge.set_function(func)
+        return gauge
+
+    def summary(self, name, documentation):
+        return self._register(Summary, name, documentation)
+
+    def get(self, name):
+        return self._metrics.get(name)
+
+    def render(self):
+        """
+        Prometheus 텍스트 형식 (0.0.4)으로 변환
+
+        Returns:
+            전체 지표 문자열
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines = []
+        for metric in metrics:
+            try:
+                samples = metric.samples()
+            except Exception as e:
+                lines.append(f"# {metric.name}: 값을 구하지 못했습니다 ({e})")
+                continue
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for suffix, labels, value in samples:
+                lines.append(f"{metric.name}{suffix}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path=METRICS_DUMP_FILE):
+        """
+        현재 지표를 파일로 저장 (node_exporter textfile 수집기 등에서 읽을 수 있음)
+
+        Returns:
+            저장한 파일 경로
+        """
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(temp_path, path)
+        return path
+
+
+# 애플리케이션 전역에서 공유하는 지표 모음
+metrics = MetricsRegistry()
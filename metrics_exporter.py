@@ -0,0 +1,108 @@
+import os
+import socket
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from metrics import metrics
+
+# --- 지표 내보내기 관련 상수 ---
+METRICS_HOST = "127.0.0.1"            # HTTP 내보내기는 이 기기에서만 접근 가능
+METRICS_PATH = "/metrics"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _HttpHandler(BaseHTTPRequestHandler):
+    registry = metrics
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in (METRICS_PATH, "/"):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # 수집 요청마다 로그를 남기지 않음
+
+
+class _UnixSocketHandler(socketserver.StreamRequestHandler):
+    """연결하면 현재 지표를 보내고 연결을 닫음 (예: socat - UNIX-CONNECT:<경로>)"""
+    registry = metrics
+
+    def handle(self):
+        self.wfile.write(self.registry.render().encode("utf-8"))
+
+
+class MetricsExporter:
+    """
+    지표 내보내기 서버 (localhost HTTP 포트 및/또는 Unix 소켓)
+    각 서버는 데몬 스레드에서 동작함
+    """
+
+    def __init__(self, registry=metrics, port=0, unix_socket=""):
+        """
+        초기화 함수
+
+        Args:
+            registry: 내보낼 MetricsRegistry
+            port: HTTP 포트 (0이면 HTTP로 내보내지 않음)
+            unix_socket: Unix 소켓 경로 (빈 값이거나 지원하지 않는 OS면 사용하지 않음)
+        """
+        self.registry = registry
+        self.port = int(port or 0)
+        self.unix_socket = unix_socket or ""
+        self._servers = []
+
+    @classmethod
+    def from_config(cls, config, registry=metrics):
+        """설정 딕셔너리 ("metrics")로 생성 (내보내기가 꺼져 있으면 None)"""
+        config = config or {}
+        if not config.get("enabled"):
+            return None
+        return cls(registry, config.get("port", 0), config.get("unix_socket", ""))
+
+    def start(self):
+        """
+        서버 시작
+
+        Returns:
+            열린 주소 목록 (예: ["http://127.0.0.1:9464/metrics"])
+        """
+        addresses = []
+        if self.port:
+            handler = type("MetricsHttpHandler", (_HttpHandler,), {"registry": self.registry})
+            server = ThreadingHTTPServer((METRICS_HOST, self.port), handler)
+            server.daemon_threads = True
+            self._serve(server)
+            addresses.append(f"http://{METRICS_HOST}:{server.server_address[1]}{METRICS_PATH}")
+        if self.unix_socket and hasattr(socket, "AF_UNIX"):
+            if os.path.exists(self.unix_socket):
+                os.unlink(self.unix_socket)  # 이전 실행에서 남은 소켓 파일
+            handler = type("MetricsUnixHandler", (_UnixSocketHandler,), {"registry": self.registry})
+            server = socketserver.ThreadingUnixStreamServer(self.unix_socket, handler)
+            server.daemon_threads = True
+            self._serve(server)
+            addresses.append(f"unix:{self.unix_socket}")
+        return addresses
+
+    def _serve(self, server):
+        thread = threading.Thread(target=server.serve_forever, name="MetricsExporter", daemon=True)
+        thread.start()
+        self._servers.append(server)
+
+    def stop(self):
+        """서버 종료 (Unix 소켓 파일도 삭제)"""
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+        self._servers = []
+        if self.unix_socket and os.path.exists(self.unix_socket):
+            try:
+                os.unlink(self.unix_socket)
+            except OSError:
+                pass
@@ -0,0 +1,302 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from app_logging import get_logger
+from clipboard_monitor import detect_clip_type
+
+log = get_logger(__name__)
+
+# --- 메모장 저장소 관련 상수 ---
+NOTES_DIR = "notes"                 # 메모 저장 폴더
+NOTES_INDEX_FILE = "index.json"     # 메모 목록(메타데이터) 파일
+NOTES_PREVIEW_LEN = 120             # 목록에 보관하는 미리보기 길이
+NOTES_BODY_CACHE_SIZE = 16          # 메모리에 유지하는 본문 수 (나머지는 필요할 때 읽음)
+NOTES_COMPACT_PATCHES = 200         # 패치가 이만큼 쌓이면 본문 파일을 새로 씀
+NOTES_INDEX_SAVE_INTERVAL_SEC = 5.0 # 메모 목록 파일 최소 저장 간격
+
+
+def compute_patch(old_text, new_text):
+    """
+    두 텍스트의 차이를 한 번의 치환(위치, 삭제 길이, 삽입 문자열)으로 계산
+    공통 앞부분/뒷부분을 제외한 구간만 기록하므로 일반적인 입력은 몇 글자짜리 패치가 됨
+
+    Returns:
+        (pos, delete_len, insert_text) 또는 변경이 없으면 None
+    """
+    if old_text == new_text:
+        return None
+    limit = min(len(old_text), len(new_text))
+    start = 0
+    while start < limit and old_text[start] == new_text[start]:
+        start += 1
+    old_end, new_end = len(old_text), len(new_text)
+    while old_end > start and new_end > start and old_text[old_end - 1] == new_text[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+    return start, old_end - start, new_text[start:new_end]
+
+
+def apply_patch(text, pos, delete_len, insert_text):
+    """compute_patch 결과를 텍스트에 적용"""
+    return text[:pos] + insert_text + text[pos + delete_len:]
+
+
+def _note_title(body):
+    """메모 제목 반환 (첫 번째 비어있지 않은 줄)"""
+    for line in body.splitlines():
+        if line.strip():
+            return line.strip()[:60]
+    return "새 메모"
+
+
+class NotesStore:
+    """
+    메모장 저장소 클래스
+
+    메모마다 본문 파일(<id>.<세대>.txt)과 추가 전용 패치 기록(<id>.<세대>.log)을 두어
+    편집 내용은 파일 전체를 다시 쓰지 않고 변경된 구간만 덧붙여 저장함.
+    시작 시에는 목록 파일(index.json)의 메타데이터만 읽고,
+    본문은 실제로 열거나 검색할 때 읽어서 제한된 개수만 메모리에 보관함.
+    """
+
+    def __init__(self, directory=NOTES_DIR):
+        """
+        초기화 함수
+
+        Args:
+            directory: 메모 저장 폴더
+        """
+        self.directory = directory
+        self._lock = threading.RLock()
+        self._index = {}  # 메모 ID -> 메타데이터 (title, preview, type, time, created, length, gen, patches)
+        self._bodies = OrderedDict()  # 메모 ID -> 본문 (LRU)
+        self._index_dirty = False
+        self._index_saved_at = 0.0
+        self._load_index()
+
+    # --- 파일 경로 ---
+    def _index_path(self):
+        return os.path.join(self.directory, NOTES_INDEX_FILE)
+
+    def _gen(self, note_id):
+        return self._index[note_id].get("gen", 0)
+
+    def _body_path(self, note_id, gen=None):
+        return os.path.join(self.directory, f"{note_id}.{self._gen(note_id) if gen is None else gen}.txt")
+
+    def _journal_path(self, note_id, gen=None):
+        return os.path.join(self.directory, f"{note_id}.{self._gen(note_id) if gen is None else gen}.log")
+
+    # --- 목록 ---
+    def _load_index(self):
+        """메모 목록 파일 로드 (본문은 읽지 않음)"""
+        path = self._index_path()
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._index = {note_id: meta for note_id, meta in data.items() if isinstance(meta, dict)}
+        except (OSError, json.JSONDecodeError) as e:
+            log.error("메모 목록 로드 오류: %s", e)
+
+    def save_index(self, force=True):
+        """
+        메모 목록 파일 저장
+
+        Args:
+            force: False이면 최소 저장 간격이 지나지 않았을 때 저장을 미룸
+        """
+        with self._lock:
+            if not self._index_dirty:
+                return
+            now = time.monotonic()
+            if not force and now - self._index_saved_at < NOTES_INDEX_SAVE_INTERVAL_SEC:
+                return
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                tmp_path = self._index_path() + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._index, f, indent=4, ensure_ascii=False)
+                os.replace(tmp_path, self._index_path())
+                self._index_dirty = False
+                self._index_saved_at = now
+            except OSError as e:
+                log.error("메모 목록 저장 오류: %s", e)
+
+    def list_notes(self):
+        """
+        최근 수정 순서의 메모 ID 리스트 반환 (본문을 읽지 않음)
+        """
+        with self._lock:
+            return sorted(self._index, key=lambda note_id: self._index[note_id].get("time", 0), reverse=True)
+
+    def get_meta(self, note_id):
+        """메모 메타데이터 반환 (없으면 None)"""
+        return self._index.get(note_id)
+
+    def search_meta(self):
+        """
+        검색 스레드용 메타데이터 딕셔너리 반환 (search_query.QueryPlan.match_meta 형식)
+        """
+        with self._lock:
+            return {note_id: dict(meta) for note_id, meta in self._index.items()}
+
+    # --- 본문 ---
+    def get_body(self, note_id):
+        """
+        메모 본문 반환 (필요할 때 파일에서 읽어서 패치 기록을 적용함)
+
+        Returns:
+            본문 문자열 또는 없는 메모면 None
+        """
+        with self._lock:
+            body = self._bodies.get(note_id)
+            if body is not None:
+                self._bodies.move_to_end(note_id)
+                return body
+            if note_id not in self._index:
+                return None
+            body = self._read_body(note_id)
+            self._cache_body(note_id, body)
+            return body
+
+    def _read_body(self, note_id):
+        """본문 파일과 패치 기록을 읽어 현재 본문 복원"""
+        body = ""
+        try:
+            with open(self._body_path(note_id), "r", encoding="utf-8", newline="") as f:
+                body = f.read()
+        except FileNotFoundError:
+            pass
+        try:
+            with open(self._journal_path(note_id), "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        pos, delete_len, insert_text = json.loads(line)
+                    except (ValueError, TypeError):
+                        break  # 저장 도중 종료되어 잘린 마지막 줄
+                    body = apply_patch(body, pos, delete_len, insert_text)
+        except FileNotFoundError:
+            pass
+        return body
+
+    def _cache_body(self, note_id, body):
+        """본문을 LRU 캐시에 보관 (잠금을 보유한 상태에서 호출)"""
+        self._bodies[note_id] = body
+        self._bodies.move_to_end(note_id)
+        while len(self._bodies) > NOTES_BODY_CACHE_SIZE:
+            self._bodies.popitem(last=False)
+
+    # --- 편집 ---
+    def create_note(self, body=""):
+        """
+        새 메모 생성
+
+        Returns:
+            새 메모 ID
+        """
+        now = time.time()
+        with self._lock:
+            note_id = f"{int(now * 1000):x}"
+            while note_id in self._index:
+                note_id = f"{int(note_id, 16) + 1:x}"
+            os.makedirs(self.directory, exist_ok=True)
+            self._index[note_id] = {"created": now, "gen": 0, "patches": 0}
+            self._write_base(note_id, body)
+            self._update_meta(note_id, body, now)
+            self._cache_body(note_id, body)
+            self.save_index()
+        return note_id
+
+    def update_note(self, note_id, new_body):
+        """
+        메모 본문 변경 저장 (변경된 구간만 패치 기록에 덧붙임)
+
+        Returns:
+            저장할 변경이 있었으면 True
+        """
+        with self._lock:
+            old_body = self.get_body(note_id)
+            if old_body is None:
+                return False
+            patch = compute_patch(old_body, new_body)
+            if patch is None:
+                return False
+            try:
+                with open(self._journal_path(note_id), "a", encoding="utf-8") as f:
+                    f.write(json.dumps(patch, ensure_ascii=False) + "\n")
+            except OSError as e:
+                log.error("메모 저장 오류: %s", e)
+                return False
+            meta = self._index[note_id]
+            meta["patches"] = meta.get("patches", 0) + 1
+            self._cache_body(note_id, new_body)
+            self._update_meta(note_id, new_body, time.time())
+            if meta["patches"] >= NOTES_COMPACT_PATCHES:
+                self._compact(note_id, new_body)
+            self.save_index(force=False)
+        return True
+
+    def delete_note(self, note_id):
+        """메모 삭제"""
+        with self._lock:
+            if note_id not in self._index:
+                return
+            paths = (self._body_path(note_id), self._journal_path(note_id))
+            del self._index[note_id]
+            self._bodies.pop(note_id, None)
+            for path in paths:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    log.error("메모 파일 삭제 오류: %s", e)
+            self._index_dirty = True
+            self.save_index()
+
+    def _update_meta(self, note_id, body, timestamp):
+        """목록 메타데이터 갱신 (잠금을 보유한 상태에서 호출)"""
+        meta = self._index[note_id]
+        meta["title"] = _note_title(body)
+        meta["preview"] = body[:NOTES_PREVIEW_LEN]
+        meta["type"] = detect_clip_type(body) if body.strip() else "text"
+        meta["time"] = timestamp
+        meta["length"] = len(body)
+        self._index_dirty = True
+
+    def _write_base(self, note_id, body, gen=None):
+        """본문 파일을 원자적으로 새로 씀"""
+        path = self._body_path(note_id, gen)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+
+    def _compact(self, note_id, body):
+        """
+        쌓인 패치를 합친 새 세대의 본문 파일을 만들고 이전 세대 파일 삭제 (잠금을 보유한 상태에서 호출)
+        목록 파일이 새 세대를 가리키도록 저장된 뒤에 이전 파일을 지우므로
+        도중에 종료되어도 패치가 두 번 적용되거나 사라지지 않음
+        """
+        meta = self._index[note_id]
+        old_gen = meta.get("gen", 0)
+        try:
+            self._write_base(note_id, body, old_gen + 1)
+        except OSError as e:
+            log.error("메모 정리 오류: %s", e)
+            return
+        meta["gen"] = old_gen + 1
+        meta["patches"] = 0
+        self._index_dirty = True
+        self.save_index()
+        for path in (self._body_path(note_id, old_gen), self._journal_path(note_id, old_gen)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
@@ -0,0 +1,600 @@
+import sys
+import threading
+from functools import lru_cache
+
+import pyperclip
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from pynput.keyboard import Key, Controller as KeyboardController
+
+from clipboard_monitor import ClipboardMonitorThread
+from config_manager import DEFAULT_PASTE_CONFIG
+from latency_tracker import latency_tracker
+from app_logging import get_logger
+from metrics import metrics
+
+log = get_logger(__name__)
+
+PASTES = metrics.counter("unipaste_pastes_total", "Successful pastes", ("method",))
+PASTE_FAILURES = metrics.counter("unipaste_paste_failures_total", "Paste attempts that failed, per method", ("method",))
+
+# --- 붙여넣기 상태 ---
+PASTE_IDLE = "idle"
+PASTE_WAIT_HIDE = "wait_hide"        # 팝업이 실제로 숨겨질 때까지 대기
+PASTE_WAIT_FOCUS = "wait_focus"      # 이전 앱으로 포커스가 돌아갈 때까지 대기
+PASTE_WRITE_CLIPBOARD = "write_clipboard"
+PASTE_WAIT_RELEASE = "wait_release"    # 빠른 붙여넣기 단축키의 수정자 키가 떼어질 때까지 대기
+PASTE_SEND_KEYS = "send_keys"
+
+# Windows 가상 키 코드
+INPUT_KEYBOARD, KEYEVENTF_KEYUP, VK_CONTROL, VK_V = 1, 0x0002, 0x11, 0x56
+
+
+@lru_cache(maxsize=1)
+def _get_win_input_types():
+    """
+    SendInput에 필요한 ctypes 구조체를 한 번만 생성하여 반환 (Windows 전용)
+
+    Returns:
+        (user32, Input, InputUnion, KeyBdInput) 튜플
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.WinDLL('user32', use_last_error=True)
+
+    class KeyBdInput(ctypes.Structure):
+        _fields_ = [("wVk", wintypes.WORD), ("wScan", wintypes.WORD), ("dwFlags", wintypes.DWORD),
+                    ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.POINTER(wintypes.ULONG))]
+
+    class MouseInput(ctypes.Structure):
+        _fields_ = [("dx", wintypes.LONG), ("dy", wintypes.LONG), ("mouseData", wintypes.DWORD),
+                    ("dwFlags", wintypes.DWORD), ("time", wintypes.DWORD),
+                    ("dwExtraInfo", ctypes.POINTER(wintypes.ULONG))]
+
+    class HardwareInput(ctypes.Structure):
+        _fields_ = [("uMsg", wintypes.DWORD), ("wParamL", wintypes.WORD), ("wParamH", wintypes.WORD)]
+
+    class InputUnion(ctypes.Union):
+        _fields_ = [("ki", KeyBdInput), ("mi", MouseInput), ("hi", HardwareInput)]
+
+    class Input(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("ii", InputUnion)]
+
+    return user32, Input, InputUnion, KeyBdInput
+
+
+class ClipboardWriter(QObject):
+    """
+    GUI 스레드를 막지 않는 클립보드 쓰기 클래스
+    Qt 클립보드에 쓴 뒤 읽어서 확인(read-back)하거나 dataChanged 시그널로 완료를 확인하고,
+    실패하면 타이머로 재시도한 뒤 마지막으로 작업 스레드에서 pyperclip을 사용함
+    """
+    write_confirmed = pyqtSignal(int)      # 요청 ID
+    write_failed = pyqtSignal(int, str)    # 요청 ID, 오류 메시지
+    _fallback_result = pyqtSignal(int, bool, str)  # 작업 스레드 -> GUI 스레드 결과 전달
+
+    def __init__(self, paste_config=None, parent=None):
+        """
+        초기화 함수
+
+        Args:
+            paste_config: 붙여넣기 설정 딕셔너리 (clipboard_retries, clipboard_retry_ms 사용)
+            parent: QObject 부모
+        """
+        super().__init__(parent)
+        self.config = dict(DEFAULT_PASTE_CONFIG)
+        if paste_config:
+            self.config.update(paste_config)
+        self._request_id = 0
+        self._text = None
+        self._attempt = 0
+        self._pending = False
+        self._clipboard_connected = False
+
+        self._retry_timer = QTimer(self)
+        self._retry_timer.setSingleShot(True)
+        self._retry_timer.timeout.connect(self._on_retry_timeout)
+        self._fallback_result.connect(self._on_fallback_result)
+
+    def write(self, text):
+        """
+        클립보드 쓰기 요청 (이전 요청은 취소됨)
+
+        Args:
+            text: 클립보드에 쓸 텍스트
+
+        Returns:
+            완료 시그널에서 사용될 요청 ID
+        """
+        self.cancel()
+        self._request_id += 1
+        self._text = text
+        self._attempt = 0
+        self._pending = True
+        # 모니터가 이 내용을 새 항목으로 다시 수집하지 않도록 자체 출처로 등록
+        ClipboardMonitorThread.mark_self_write(text)
+        self._ensure_clipboard_signal()
+        # 호출자가 요청 ID를 기록한 뒤 완료 시그널을 받도록 다음 이벤트 루프 차례에 시작
+        request_id = self._request_id
+        QTimer.singleShot(0, lambda: self._start_write(request_id))
+        return request_id
+
+    def _start_write(self, request_id):
+        """예약된 쓰기 요청 시작 (그 사이 취소되거나 새 요청이 들어온 경우 무시)"""
+        if self._pending and request_id == self._request_id:
+            self._try_qt_write()
+
+    def cancel(self):
+        """진행 중인 쓰기 요청 취소"""
+        self._retry_timer.stop()
+        self._pending = False
+
+    def _ensure_clipboard_signal(self):
+        """Qt 클립보드 변경 시그널 연결 (최초 한 번)"""
+        if not self._clipboard_connected:
+            QApplication.clipboard().dataChanged.connect(self._on_clipboard_data_changed)
+            self._clipboard_connected = True
+
+    def _is_written(self):
+        """클립보드 내용을 읽어서 쓰기 완료 여부 확인"""
+        try:
+            return QApplication.clipboard().text() == self._text
+        except Exception:
+            return False
+
+    def _try_qt_write(self):
+        """Qt 클립보드 쓰기 시도 (확인되지 않으면 재시도 타이머 시작)"""
+        self._attempt += 1
+        try:
+            QApplication.clipboard().setText(self._text)
+        except Exception as e:
+            log.warning("Qt 클립보드 설정 실패 (시도 %s): %s", self._attempt, e)
+        if not self._pending:
+            return  # setText 도중 dataChanged로 이미 확인됨
+        if self._is_written():
+            self._confirm()
+            return
+        # dataChanged 시그널 또는 재시도 타이머를 기다림
+        self._retry_timer.start(self.config["clipboard_retry_ms"])
+
+    def _on_clipboard_data_changed(self):
+        """클립보드 변경 시그널 처리 (쓰기 완료 확인)"""
+        if self._pending and self._is_written():
+            self._retry_timer.stop()
+            self._confirm()
+
+    def _on_retry_timeout(self):
+        """확인되지 않은 쓰기 재시도"""
+        if not self._pending:
+            return
+        if self._is_written():
+            self._confirm()
+        elif self._attempt < self.config["clipboard_retries"]:
+            self._try_qt_write()
+        else:
+            self._start_pyperclip_fallback()
+
+    def _start_pyperclip_fallback(self):
+        """작업 스레드에서 pyperclip으로 쓰기 시도 (GUI 스레드를 막지 않음)"""
+        log.warning("Qt 클립보드 설정 확인 실패 - pyperclip 사용")
+        request_id, text = self._request_id, self._text
+
+        def worker():
+            try:
+                pyperclip.copy(text)
+                ok = pyperclip.paste() == text
+                self._fallback_result.emit(request_id, ok, "" if ok else "read-back mismatch")
+            except Exception as e:
+                self._fallback_result.emit(request_id, False, str(e))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_fallback_result(self, request_id, ok, error):
+        """pyperclip 작업 스레드 결과 처리"""
+        if request_id != self._request_id or not self._pending:
+            return
+        if ok:
+            self._confirm()
+        else:
+            self._pending = False
+            log.warning("클립보드 설정 최종 실패: %s", error)
+            self.write_failed.emit(request_id, error)
+
+    def _confirm(self):
+        """쓰기 완료 확인 알림"""
+        self._pending = False
+        self.write_confirmed.emit(self._request_id)
+
+
+class PasteController(QObject):
+    """
+    GUI 스레드를 막지 않는 붙여넣기 상태 머신 클래스
+    고정된 sleep 대신 타이머와 시그널로 각 단계를 진행함:
+    팝업 숨김 대기 -> 포커스 복귀 대기 -> 클립보드 쓰기 -> 붙여넣기 키 전송
+    """
+    paste_finished = pyqtSignal(bool, str)  # 성공 여부, 사용된 붙여넣기 방법
+
+    def __init__(self, paste_config=None, parent=None):
+        """
+        초기화 함수
+
+        Args:
+            paste_config: 붙여넣기 설정 딕셔너리 (config_manager.DEFAULT_PASTE_CONFIG 참고)
+            parent: QObject 부모
+        """
+        super().__init__(parent)
+        self.config = dict(DEFAULT_PASTE_CONFIG)
+        if paste_config:
+            self.config.update(paste_config)
+
+        self.state = PASTE_IDLE
+        self._generation = 0  # 취소된 요청의 타이머 콜백을 무시하기 위한 세대 번호
+        self._text = None
+        self._popup = None
+        self._started_at = None
+        self._keys_started_at = None
+        self._write_started_at = None
+        self._write_request_id = None
+        self._keyboard_controller = None
+        self._held_keys = []  # 붙여넣기 중 눌려 있는 키의 (이름, 떼는 함수), 중단 시 모두 뗌
+        self._quick = False  # 팝업을 거치지 않는 빠른 붙여넣기 요청 여부
+        self._modifiers_held = None  # 단축키 수정자 키가 눌려 있는지 반환하는 함수
+
+        self.clipboard_writer = ClipboardWriter(self.config, self)
+        self.clipboard_writer.write_confirmed.connect(self._on_write_confirmed)
+        self.clipboard_writer.write_failed.connect(self._on_write_failed)
+
+        self._stage_timer = QTimer(self)
+        self._stage_timer.setSingleShot(True)
+        self._stage_timer.timeout.connect(self._on_stage_timeout)
+
+        self._focus_poll_timer = QTimer(self)
+        self._focus_poll_timer.timeout.connect(self._poll_focus)
+
+        self._release_poll_timer = QTimer(self)
+        self._release_poll_timer.timeout.connect(self._poll_release)
+
+    def update_config(self, paste_config):
+        """붙여넣기 설정 변경"""
+        self.config = dict(DEFAULT_PASTE_CONFIG)
+        if paste_config:
+            self.config.update(paste_config)
+        self.clipboard_writer.config = self.config
+
+    def warm_up(self):
+        """
+        첫 붙여넣기에서 필요한 준비를 미리 수행 (시작 후 유휴 시점에 호출)
+        Windows의 SendInput ctypes 구조체와 pynput 키보드 컨트롤러를 생성해 둠
+        """
+        if sys.platform == "win32":
+            try:
+                _get_win_input_types()
+            except Exception as e:
+                log.error("SendInput 준비 중 오류: %s", e)
+        if self._keyboard_controller is None:
+            self._keyboard_controller = KeyboardController()
+
+    def request_paste(self, text, popup=None):
+        """
+        붙여넣기 요청 (진행 중인 요청은 취소됨)
+
+        Args:
+            text: 붙여넣을 텍스트
+            popup: 숨겨질 때까지 기다릴 팝업 위젯 (popup_hidden 시그널 필요)
+        """
+        self._cancel_current()
+        self._generation += 1
+        self._text = text
+        self._popup = popup
+        self._quick = False
+        self._modifiers_held = None
+        self._started_at = latency_tracker.now()
+
+        if popup is not None and popup.isVisible():
+            self._enter_state(PASTE_WAIT_HIDE)
+            popup.popup_hidden.connect(self._on_popup_hidden)
+            self._stage_timer.start(self.config["hide_timeout_ms"])
+        else:
+            self._start_wait_focus()
+
+    def request_quick_paste(self, text, modifiers_held=None):
+        """
+        빠른 붙여넣기 요청 (팝업 숨김/포커스 대기 단계 없이 바로 클립보드 쓰기부터 진행)
+        단축키로 호출되므로 포커스는 이미 대상 앱에 있음
+
+        Args:
+            text: 붙여넣을 텍스트
+            modifiers_held: 단축키 수정자 키가 아직 눌려 있으면 True를 반환하는 함수
+                (눌린 채로 Ctrl+V를 보내면 Ctrl+Alt+V 등으로 인식되므로 떼어질 때까지 대기)
+        """
+        self._cancel_current()
+        self._generation += 1
+        self._text = text
+        self._popup = None
+        self._quick = True
+        self._modifiers_held = modifiers_held
+        self._started_at = latency_tracker.now()
+        self._start_write_clipboard()
+
+    def _enter_state(self, state):
+        """상태 전환"""
+        self.state = state
+
+    def _cancel_current(self):
+        """진행 중인 요청 정리"""
+        self._stage_timer.stop()
+        self._focus_poll_timer.stop()
+        self._release_poll_timer.stop()
+        self._disconnect_popup()
+        if self.state == PASTE_WRITE_CLIPBOARD:
+            self.clipboard_writer.cancel()
+        self._release_held_keys()
+        self.state = PASTE_IDLE
+
+    def _release_held_keys(self):
+        """키 입력 중 중단된 경우 눌린 채로 남은 키를 역순으로 뗌 (Ctrl 등이 계속 눌린 상태로 남지 않도록)"""
+        while self._held_keys:
+            name, release = self._held_keys.pop()
+            try:
+                release()
+            except Exception as e:
+                log.warning("눌린 키 %s 해제 실패: %s", name, e)
+
+    def _chord_steps(self, press, release, keys):
+        """
+        키를 순서대로 누른 뒤 역순으로 떼는 단계 목록 (눌린 키는 _held_keys에 기록됨)
+
+        Args:
+            press: 키를 누르는 함수
+            release: 키를 떼는 함수
+            keys: (이름, 키) 리스트
+        """
+        def press_step(name, key):
+            press(key)
+            self._held_keys.append((name, lambda: release(key)))
+
+        def release_step(name, key):
+            release(key)
+            self._held_keys = [held for held in self._held_keys if held[0] != name]
+
+        steps = [lambda name=name, key=key: press_step(name, key) for name, key in keys]
+        steps += [lambda name=name, key=key: release_step(name, key) for name, key in reversed(keys)]
+        return steps
+
+    def _disconnect_popup(self):
+        """팝업 숨김 시그널 연결 해제"""
+        if self._popup is not None:
+            try:
+                self._popup.popup_hidden.disconnect(self._on_popup_hidden)
+            except TypeError:
+                pass
+
+    def _on_popup_hidden(self):
+        """팝업이 실제로 숨겨졌을 때 처리"""
+        if self.state != PASTE_WAIT_HIDE:
+            return
+        self._stage_timer.stop()
+        self._disconnect_popup()
+        self._start_wait_focus()
+
+    def _on_stage_timeout(self):
+        """대기 단계 제한 시간 초과 처리 (실패로 보지 않고 다음 단계로 진행)"""
+        if self.state == PASTE_WAIT_HIDE:
+            log.warning("팝업 숨김 대기 시간 초과 - 다음 단계 진행")
+            self._disconnect_popup()
+            self._start_wait_focus()
+        elif self.state == PASTE_WAIT_FOCUS:
+            log.warning("포커스 복귀 대기 시간 초과 - 다음 단계 진행")
+            self._focus_poll_timer.stop()
+            self._start_write_clipboard()
+        elif self.state == PASTE_WAIT_RELEASE:
+            log.warning("단축키 수정자 키 해제 대기 시간 초과 - 다음 단계 진행")
+            self._release_poll_timer.stop()
+            self.execute_paste()
+
+    def _start_wait_focus(self):
+        """이전 앱으로 포커스가 돌아갈 때까지 대기 시작"""
+        if self._focus_returned():
+            self._start_write_clipboard()
+            return
+        self._enter_state(PASTE_WAIT_FOCUS)
+        self._focus_poll_timer.start(self.config["focus_poll_ms"])
+        self._stage_timer.start(self.config["focus_timeout_ms"])
+
+    def _focus_returned(self):
+        """이 애플리케이션의 창이 더 이상 활성 창이 아닌지 여부"""
+        return QApplication.activeWindow() is None
+
+    def _poll_focus(self):
+        """포커스 복귀 여부 주기적 확인"""
+        if self.state != PASTE_WAIT_FOCUS:
+            self._focus_poll_timer.stop()
+            return
+        if self._focus_returned():
+            self._focus_poll_timer.stop()
+            self._stage_timer.stop()
+            self._start_write_clipboard()
+
+    def _start_write_clipboard(self):
+        """클립보드 쓰기 단계 (쓰기가 확인되는 즉시 키 전송 단계로 진행)"""
+        self._enter_state(PASTE_WRITE_CLIPBOARD)
+        self.set_clipboard_with_retry(self._text)
+
+    def set_clipboard_with_retry(self, text):
+        """
+        비동기 클립보드 쓰기 시작 (완료는 write_confirmed/write_failed 시그널로 전달됨)
+
+        Args:
+            text: 클립보드에 쓸 텍스트
+        """
+        self._write_started_at = latency_tracker.now()
+        self._write_request_id = self.clipboard_writer.write(text)
+
+    def _on_write_confirmed(self, request_id):
+        """클립보드 쓰기 완료 확인 처리"""
+        if self.state != PASTE_WRITE_CLIPBOARD or request_id != self._write_request_id:
+            return
+        latency_tracker.record("set_clipboard", latency_tracker.now() - self._write_started_at)
+        if self._modifiers_held is not None and self._are_modifiers_held():
+            self._enter_state(PASTE_WAIT_RELEASE)
+            self._release_poll_timer.start(self.config["focus_poll_ms"])
+            self._stage_timer.start(self.config["release_timeout_ms"])
+            return
+        self.execute_paste()
+
+    def _are_modifiers_held(self):
+        """단축키 수정자 키가 아직 눌려 있는지 여부"""
+        try:
+            return bool(self._modifiers_held())
+        except Exception:
+            return False
+
+    def _poll_release(self):
+        """단축키 수정자 키 해제 여부 주기적 확인"""
+        if self.state != PASTE_WAIT_RELEASE:
+            self._release_poll_timer.stop()
+            return
+        if not self._are_modifiers_held():
+            self._release_poll_timer.stop()
+            self._stage_timer.stop()
+            self.execute_paste()
+
+    def _on_write_failed(self, request_id, error):
+        """클립보드 쓰기 실패 처리"""
+        if self.state != PASTE_WRITE_CLIPBOARD or request_id != self._write_request_id:
+            return
+        latency_tracker.record("set_clipboard", latency_tracker.now() - self._write_started_at)
+        self._finish(False, "clipboard")
+
+    def execute_paste(self):
+        """붙여넣기 키 전송 단계 (플랫폼별 방법을 순서대로 시도)"""
+        self._enter_state(PASTE_SEND_KEYS)
+        self._keys_started_at = latency_tracker.now()
+        if sys.platform == "win32":
+            methods = [("SendInput", self._send_input_steps),
+                       ("keybd_event", self._keybd_event_steps),
+                       ("pynput", self._pynput_steps)]
+        else:
+            methods = [("pynput", self._pynput_steps)]
+        self._try_paste_methods(methods, self._generation)
+
+    def _try_paste_methods(self, methods, generation):
+        """
+        붙여넣기 방법을 순서대로 시도
+
+        Args:
+            methods: (이름, 키 단계 생성 함수) 리스트
+            generation: 요청 세대 번호
+        """
+        while methods:
+            name, build_steps = methods[0]
+            try:
+                steps = build_steps()
+            except Exception as e:
+                log.warning("붙여넣기 방법 %s 준비 실패: %s", name, e)
+                PASTE_FAILURES.inc(method=name)
+                methods = methods[1:]
+                continue
+            self._run_key_steps(name, steps, methods[1:], generation)
+            return
+        log.error("모든 붙여넣기 방법이 실패했습니다. 사용자에게 수동 붙여넣기 안내...")
+        self._finish(False, "none")
+
+    def _run_key_steps(self, name, steps, fallback_methods, generation):
+        """
+        키 입력 단계를 key_interval_ms 간격의 타이머로 실행 (GUI 스레드를 막지 않음)
+
+        Args:
+            name: 붙여넣기 방법 이름
+            steps: 순서대로 실행할 함수 리스트
+            fallback_methods: 실패 시 시도할 나머지 방법
+            generation: 요청 세대 번호
+        """
+        if generation != self._generation or self.state != PASTE_SEND_KEYS:
+            # 새 요청으로 바뀐 경우에는 _cancel_current에서 이미 뗐으므로 새 요청의 키는 건드리지 않음
+            if generation == self._generation:
+                self._release_held_keys()
+            return
+        interval = self.config["key_interval_ms"]
+        while steps:
+            step = steps.pop(0)
+            try:
+                step()
+            except Exception as e:
+                log.warning("붙여넣기 방법 %s 실패: %s", name, e)
+                PASTE_FAILURES.inc(method=name)
+                self._release_held_keys()
+                self._try_paste_methods(fallback_methods, generation)
+                return
+            if steps and interval > 0:
+                QTimer.singleShot(interval, lambda: self._run_key_steps(name, steps, fallback_methods, generation))
+                return
+        log.debug("%s 방식 붙여넣기 성공!", name)
+        PASTES.inc(method=name)
+        self._finish(True, name)
+
+    def _send_input_steps(self):
+        """Windows SendInput API로 Ctrl+V를 한 번에 전송하는 단계"""
+        import ctypes
+        user32, Input, InputUnion, KeyBdInput = _get_win_input_types()
+        inputs = (Input * 4)(
+            Input(INPUT_KEYBOARD, InputUnion(ki=KeyBdInput(VK_CONTROL, 0, 0, 0, None))),
+            Input(INPUT_KEYBOARD, InputUnion(ki=KeyBdInput(VK_V, 0, 0, 0, None))),
+            Input(INPUT_KEYBOARD, InputUnion(ki=KeyBdInput(VK_V, 0, KEYEVENTF_KEYUP, 0, None))),
+            Input(INPUT_KEYBOARD, InputUnion(ki=KeyBdInput(VK_CONTROL, 0, KEYEVENTF_KEYUP, 0, None)))
+        )
+
+        def send():
+            result = user32.SendInput(4, ctypes.byref(inputs), ctypes.sizeof(Input))
+            if result != 4:
+                error = ctypes.get_last_error()
+                if result > 0:
+                    # 일부만 전송되어 키가 눌린 채로 남았을 수 있으므로 떼는 입력만 다시 전송
+                    releases = (Input * 2)(inputs[2], inputs[3])
+                    user32.SendInput(2, ctypes.byref(releases), ctypes.sizeof(Input))
+                raise Exception(f"SendInput failed: {error}")
+        return [send]
+
+    def _keybd_event_steps(self):
+        """Windows keybd_event API 단계"""
+        user32 = _get_win_input_types()[0]
+        return self._chord_steps(
+            lambda vk: user32.keybd_event(vk, 0, 0, 0),
+            lambda vk: user32.keybd_event(vk, 0, KEYEVENTF_KEYUP, 0),
+            [("ctrl", VK_CONTROL), ("v", VK_V)],
+        )
+
+    def _pynput_steps(self):
+        """pynput 키보드 컨트롤러 단계"""
+        if self._keyboard_controller is None:
+            self._keyboard_controller = KeyboardController()
+        controller = self._keyboard_controller
+        paste_key = Key.cmd if sys.platform == "darwin" else Key.ctrl
+        return self._chord_steps(controller.press, controller.release, [("modifier", paste_key), ("v", 'v')])
+
+    def _finish(self, success, method):
+        """붙여넣기 완료 처리 및 지연 시간 기록"""
+        self._release_held_keys()
+        self.state = PASTE_IDLE
+        finished_at = latency_tracker.now()
+        if self._keys_started_at is not None:
+            latency_tracker.record("execute_paste", finished_at - self._keys_started_at)
+            self._keys_started_at = None
+        if self._started_at is not None:
+            # 빠른 붙여넣기는 팝업 경로와 비교할 수 있도록 별도 지표로 기록
+            metric = "quick_paste" if self._quick else "copy_paste_action"
+            latency_tracker.record(metric, finished_at - self._started_at)
+            self._started_at = None
+        if self._quick:
+            latency_tracker.record_since("hotkey", "hotkey_to_quick_paste", end=finished_at)
+        else:
+            latency_tracker.record_since("paste_click", "click_to_paste", clear=True)
+        self._text = None
+        self._popup = None
+        self._quick = False
+        self._modifiers_held = None
+        try:
+            self.paste_finished.emit(success, method)
+        except Exception:
+            log.exception("붙여넣기 완료 알림 오류")
@@ -0,0 +1,358 @@
+import re
+import time
+from functools import lru_cache
+
+# --- 검색 쿼리 관련 상수 ---
+QUERY_TIME_BUDGET_SEC = 0.3        # 쿼리 하나에 허용되는 최대 검색 시간
+REGEX_CACHE_SIZE = 64              # 컴파일된 정규식 LRU 캐시 크기
+REGEX_MAX_REPEATS = 4              # 허용하는 무제한 반복(*, +, {n,}) 개수 (많을수록 최악의 경우 시간이 급격히 늘어남)
+
+# type: 필터에서 허용하는 이름 -> detect_clip_type() 결과
+TYPE_ALIASES = {
+    "url": "link", "link": "link", "링크": "link",
+    "code": "code", "코드": "code",
+    "email": "email", "mail": "email", "이메일": "email",
+    "number": "number", "num": "number", "숫자": "number",
+    "text": "text", "텍스트": "text",
+}
+
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+_REGEX_FLAGS = {"m": re.MULTILINE, "s": re.DOTALL, "x": re.VERBOSE}
+
+# /정규식/플래그 토큰 또는 공백으로 구분된 일반 토큰
+_TOKEN_PATTERN = re.compile(r'/((?:\\.|[^/\\])+)/([a-z]*)(?=\s|$)|(\S+)')
+_LEN_PATTERN = re.compile(r'^len(>=|<=|>|<|=)(\d+)$')
+_DURATION_PATTERN = re.compile(r'^(\d+(?:\.\d+)?)([smhdw])$')
+
+
+def rank_match(item_lower, term):
+    """
+    검색어 일치 순위 반환 (낮을수록 우선)
+
+    Args:
+        item_lower: 소문자로 변환된 항목 텍스트
+        term: 소문자 검색어
+
+    Returns:
+        0: 앞부분 일치, 1: 단어 시작 일치, 2: 부분 일치, None: 불일치
+    """
+    pos = item_lower.find(term)
+    if pos < 0:
+        return None
+    if pos == 0:
+        return 0
+    if not item_lower[pos - 1].isalnum():
+        return 1
+    return 2
+
+
+class UnsafeRegexError(re.error):
+    """최악의 경우 검색 시간이 급격히 늘어나는 정규식 (중첩 반복, 역참조 등)"""
+
+
+_BRACE_QUANTIFIER = re.compile(r'\{(\d*)(,?)(\d*)\}')
+_GROUP_PREFIX = re.compile(r'\?(?:P<\w+>|<\w+>|<=|<!|[:=!>]|[a-zA-Z-]*:)')
+_INLINE_FLAGS = re.compile(r'\?[a-zA-Z-]*\)')
+_SPECIAL_FIRST = set(".^$[(\\")
+
+
+def _read_quantifier(pattern, pos):
+    """
+    pos 위치의 수량자 읽기
+
+    Returns:
+        (최소 횟수, 최대 횟수(None이면 무제한), 다음 위치) 또는 수량자가 없으면 None
+    """
+    char = pattern[pos:pos + 1]
+    if char == "*":
+        low, high, pos = 0, None, pos + 1
+    elif char == "+":
+        low, high, pos = 1, None, pos + 1
+    elif char == "?":
+        low, high, pos = 0, 1, pos + 1
+    elif char == "{":
+        match = _BRACE_QUANTIFIER.match(pattern, pos)
+        if not match or not (match.group(1) or match.group(3)):
+            return None  # 글자 그대로의 중괄호
+        low = int(match.group(1) or 0)
+        high = low if not match.group(2) else (int(match.group(3)) if match.group(3) else None)
+        pos = match.end()
+    else:
+        return None
+    if pattern[pos:pos + 1] in ("?", "+"):
+        pos += 1  # 최소 일치/소유 수량자
+    return low, high, pos
+
+
+class _GroupScan:
+    """괄호 하나의 검사 상태 (반복 가능한 부분 포함 여부, 선택지 첫 글자)"""
+    __slots__ = ("variable", "firsts", "need_first")
+
+    def __init__(self):
+        self.variable = False  # 횟수가 정해지지 않은 반복이나 모호한 선택이 들어 있는지
+        self.firsts = []       # 선택지별 첫 글자 (알 수 없으면 None)
+        self.need_first = True
+
+    def atom(self, first):
+        if self.need_first:
+            self.firsts.append(first)
+            self.need_first = False
+
+    def ambiguous(self):
+        """선택지가 같은 글자로 시작할 수 있는지 (반복 안에서 경우의 수가 늘어나는 원인)"""
+        if self.need_first:
+            self.firsts.append(None)  # 빈 선택지
+        if len(self.firsts) < 2:
+            return False
+        known = [first for first in self.firsts if first is not None]
+        return len(known) < len(self.firsts) or len(set(known)) < len(known)
+
+
+def check_regex_safety(pattern):
+    """
+    정규식 원문을 훑어 최악의 경우 검색 시간이 지수적으로 늘어나는 구조를 거부
+
+    거부하는 경우:
+        역참조 (\\1, (?P=name))
+        반복되는 괄호 안의 횟수가 정해지지 않은 반복 ((a+)+, (\\w+\\s?)* 등)
+        반복되는 괄호 안의 같은 글자로 시작할 수 있는 선택지 ((a|ab)+ 등)
+        무제한 반복(*, +, {n,})이 REGEX_MAX_REPEATS개를 넘는 경우
+
+    Raises:
+        UnsafeRegexError: 위 구조가 있는 경우
+    """
+    stack = [_GroupScan()]
+    unbounded = 0
+    pos = 0
+    length = len(pattern)
+    while pos < length:
+        char = pattern[pos]
+        frame = stack[-1]
+        if char == "\\":
+            escaped = pattern[pos + 1:pos + 2]
+            if escaped.isdigit() and escaped != "0":
+                raise UnsafeRegexError("역참조는 지원하지 않습니다")
+            frame.atom(escaped.lower() if escaped and not escaped.isalnum() else None)
+            pos += 2
+        elif char == "[":
+            end = pos + 1
+            if pattern[end:end + 1] == "^":
+                end += 1
+            if pattern[end:end + 1] == "]":
+                end += 1
+            while end < length and pattern[end] != "]":
+                end += 2 if pattern[end] == "\\" else 1
+            frame.atom(None)
+            pos = end + 1
+        elif char == "(":
+            if pattern.startswith("(?P=", pos):
+                raise UnsafeRegexError("역참조는 지원하지 않습니다")
+            if pattern.startswith("(?#", pos):
+                end = pattern.find(")", pos)
+                pos = length if end < 0 else end + 1
+                continue
+            flags = _INLINE_FLAGS.match(pattern, pos + 1)
+            if flags:
+                pos = flags.end()  # (?i) 같은 플래그 지정은 괄호가 아님
+                continue
+            prefix = _GROUP_PREFIX.match(pattern, pos + 1)
+            frame.atom(None)
+            stack.append(_GroupScan())
+            pos = prefix.end() if prefix else pos + 1
+            continue
+        elif char == ")" and len(stack) > 1:
+            group = stack.pop()
+            variable = group.variable or group.ambiguous()
+            quantifier = _read_quantifier(pattern, pos + 1)
+            pos += 1
+            if quantifier:
+                low, high, pos = quantifier
+                repeats = high is None or high > 1
+                if repeats and variable and high != low:
+                    raise UnsafeRegexError("반복되는 괄호 안의 반복/선택은 지원하지 않습니다")
+                unbounded += high is None
+                variable = variable or high != low
+            stack[-1].variable = stack[-1].variable or variable
+            continue
+        elif char == "|":
+            frame.atom(None)  # 빈 선택지
+            frame.need_first = True
+            pos += 1
+            continue
+        else:
+            frame.atom(None if char in _SPECIAL_FIRST else char.lower())
+            pos += 1
+        quantifier = _read_quantifier(pattern, pos)
+        if quantifier:
+            low, high, pos = quantifier
+            unbounded += high is None
+            frame.variable = frame.variable or high != low
+    if unbounded > REGEX_MAX_REPEATS:
+        raise UnsafeRegexError("반복이 너무 많습니다")
+
+
+@lru_cache(maxsize=REGEX_CACHE_SIZE)
+def compile_regex(pattern, flag_letters=""):
+    """
+    정규식 컴파일 (LRU 캐시 사용, 기본적으로 대소문자 구분 없음)
+    검색 시간이 급격히 늘어날 수 있는 정규식은 거부함
+
+    Raises:
+        re.error: 잘못된 정규식인 경우
+        UnsafeRegexError: 역참조/중첩 반복 등이 있는 경우 (check_regex_safety 참고)
+    """
+    flags = re.IGNORECASE
+    for letter in flag_letters:
+        flags |= _REGEX_FLAGS.get(letter, 0)
+    regex = re.compile(pattern, flags)
+    check_regex_safety(pattern)
+    return regex
+
+
+def _parse_time_bound(value, now):
+    """
+    after:/before: 값을 타임스탬프로 변환 ('2h', '30m', '2024-01-31' 형식)
+
+    Returns:
+        타임스탬프 또는 해석할 수 없으면 None
+    """
+    match = _DURATION_PATTERN.match(value)
+    if match:
+        return now - float(match.group(1)) * _DURATION_UNITS[match.group(2)]
+    try:
+        return time.mktime(time.strptime(value, "%Y-%m-%d"))
+    except ValueError:
+        return None
+
+
+class QueryPlan:
+    """
+    파싱된 검색 쿼리 실행 계획 클래스
+    메타데이터 필터(유형, 시각, 길이)를 먼저 검사하고, 통과한 항목만 텍스트를 검사함
+    """
+    __slots__ = ("types", "min_time", "max_time", "min_len", "max_len", "terms", "regexes")
+
+    def __init__(self):
+        self.types = None       # 허용 유형 집합 (None이면 제한 없음)
+        self.min_time = None
+        self.max_time = None
+        self.min_len = None
+        self.max_len = None
+        self.terms = []         # 모두 포함되어야 하는 소문자 검색어
+        self.regexes = []       # 모두 일치해야 하는 컴파일된 정규식
+
+    def is_empty(self):
+        """조건이 하나도 없는 쿼리인지 여부"""
+        return (self.types is None and self.min_time is None and self.max_time is None and
+                self.min_len is None and self.max_len is None and
+                not self.terms and not self.regexes)
+
+    def match_meta(self, meta):
+        """
+        메타데이터 조건 검사
+
+        Args:
+            meta: {"type", "time", "length"} 딕셔너리
+        """
+        if self.types is not None and meta["type"] not in self.types:
+            return False
+        length = meta["length"]
+        if self.min_len is not None and length < self.min_len:
+            return False
+        if self.max_len is not None and length > self.max_len:
+            return False
+        timestamp = meta.get("time")
+        if self.min_time is not None and (timestamp is None or timestamp < self.min_time):
+            return False
+        if self.max_time is not None and (timestamp is None or timestamp > self.max_time):
+            return False
+        return True
+
+    def match_text(self, text, text_lower):
+        """
+        텍스트 조건 검사 후 순위 반환
+
+        Returns:
+            순위 (낮을수록 우선) 또는 불일치 시 None
+        """
+        rank = 0
+        for index, term in enumerate(self.terms):
+            term_rank = rank_match(text_lower, term)
+            if term_rank is None:
+                return None
+            if index == 0:
+                rank = term_rank
+        for regex in self.regexes:
+            if not regex.search(text):
+                return None
+        return rank
+
+
+def parse_query(query_text, now=None):
+    """
+    검색창 입력을 쿼리 실행 계획으로 변환
+
+    지원 문법:
+        type:url        유형 필터 (url/link, code, email, number, text, 쉼표로 여러 개)
+        after:2h        최근 2시간 이내 (s, m, h, d, w 단위 또는 YYYY-MM-DD)
+        before:1d       1일 이전
+        len>1000        길이 필터 (>, <, >=, <=, =)
+        /정규식/        정규식 검색 (대소문자 구분 없음, 플래그 m/s/x 지원)
+        그 외 단어      모두 포함해야 하는 일반 검색어
+
+    해석할 수 없는 필터나 잘못된 정규식은 일반 검색어로 취급됨
+    역참조나 중첩 반복((a+)+ 등)이 있는 정규식도 검색 시간이 급격히 늘어날 수 있으므로 일반 검색어로 취급함
+    전체 검색 시간은 검색 스레드가 항목 사이마다 확인함 (QUERY_TIME_BUDGET_SEC)
+
+    Args:
+        query_text: 검색창 입력 문자열
+        now: 상대 시간 계산 기준 시각 (기본값: 현재 시각)
+
+    Returns:
+        QueryPlan 객체
+    """
+    plan = QueryPlan()
+    if now is None:
+        now = time.time()
+
+    for match in _TOKEN_PATTERN.finditer(query_text):
+        regex_body, regex_flags, token = match.groups()
+        if regex_body is not None:
+            try:
+                plan.regexes.append(compile_regex(regex_body, regex_flags))
+            except re.error:
+                plan.terms.append(match.group(0).lower())
+            continue
+
+        lowered = token.lower()
+        if lowered.startswith("type:"):
+            names = [TYPE_ALIASES.get(name) for name in lowered[5:].split(",") if name]
+            if names and all(names):
+                plan.types = (plan.types or set()) | set(names)
+                continue
+        elif lowered.startswith(("after:", "before:")):
+            key, _, value = lowered.partition(":")
+            bound = _parse_time_bound(value, now)
+            if bound is not None:
+                if key == "after":
+                    plan.min_time = bound if plan.min_time is None else max(plan.min_time, bound)
+                else:
+                    plan.max_time = bound if plan.max_time is None else min(plan.max_time, bound)
+                continue
+        else:
+            len_match = _LEN_PATTERN.match(lowered)
+            if len_match:
+                op, value = len_match.group(1), int(len_match.group(2))
+                if op in (">", ">="):
+                    bound = value + 1 if op == ">" else value
+                    plan.min_len = bound if plan.min_len is None else max(plan.min_len, bound)
+                if op in ("<", "<="):
+                    bound = value - 1 if op == "<" else value
+                    plan.max_len = bound if plan.max_len is None else min(plan.max_len, bound)
+                if op == "=":
+                    plan.min_len = plan.max_len = value
+                continue
+
+        plan.terms.append(lowered)
+
+    return plan
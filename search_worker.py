@@ -0,0 +1,201 @@
+import heapq
+import queue
+import threading
+import time
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from clipboard_monitor import make_clip_meta
+from search_query import parse_query, QUERY_TIME_BUDGET_SEC
+from app_logging import get_logger
+from metrics import metrics
+
+log = get_logger(__name__)
+
+SEARCH_SECONDS = metrics.summary("unipaste_search_seconds", "Time to run a search query to completion")
+
+# --- 검색 관련 상수 ---
+SEARCH_SCAN_CHUNK_SIZE = 500   # 결과를 내보내기 전 최대 검사 항목 수
+SEARCH_FIRST_PAGE_SIZE = 30    # 첫 페이지에 필요한 결과 수 (이만큼 모이면 즉시 전송)
+SEARCH_BUDGET_CHECK_INTERVAL = 64  # 시간 예산/취소 여부를 확인하는 항목 간격
+
+
+class SearchCancelToken:
+    """
+    진행 중인 검색 요청을 취소하기 위한 토큰 클래스
+    """
+    __slots__ = ("_event",)
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        """검색 취소 요청"""
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        """취소 여부 반환"""
+        return self._event.is_set()
+
+
+class SearchWorkerThread(QThread):
+    """
+    GUI 스레드를 막지 않도록 백그라운드에서 히스토리를 검색하는 스레드 클래스
+    새 검색 요청이 들어오면 진행 중인 검색은 취소되고,
+    결과는 청크마다 순위순으로 정렬되어 전달됨. 청크가 여러 개였고 뒤 청크에 더 높은 순위가 있으면
+    검색이 끝날 때 전체를 순위순으로 병합한 목록을 첫 청크로 다시 전달함
+    """
+    results_chunk_ready = pyqtSignal(int, list, bool)  # 검색 ID, 결과 청크, 첫 청크 여부 (True면 이전 결과를 대체)
+    search_finished = pyqtSignal(int, int, bool)  # 검색 ID, 전체 결과 수, 시간 초과로 중단 여부
+
+    def __init__(self, parent=None):
+        """
+        초기화 함수
+
+        Args:
+            parent: QObject 부모
+        """
+        super().__init__(parent)
+        self._requests = queue.Queue()
+        self._lock = threading.Lock()
+        self._current_token = None
+        self._query_id = 0
+
+    def submit(self, query_text, items, meta_lookup=None, text_lookup=None):
+        """
+        새 검색 요청 등록 (진행 중인 검색은 취소됨)
+
+        Args:
+            query_text: 검색창 입력 문자열 (search_query 문법)
+            items: 검색 대상 항목 리스트 (호출 후 변경하지 않는 스냅샷이어야 함)
+            meta_lookup: 항목 -> 메타데이터 딕셔너리 (없는 항목은 즉석에서 계산,
+                         검색 스레드에서 읽으므로 다른 스레드가 바꾸지 않는 복사본이어야 함)
+            text_lookup: 항목 -> 검색할 텍스트 함수 (메모처럼 항목이 키인 경우, 검색 스레드에서 호출됨)
+
+        Returns:
+            결과 시그널에서 사용될 검색 ID
+        """
+        with self._lock:
+            if self._current_token:
+                self._current_token.cancel()
+            self._query_id += 1
+            token = SearchCancelToken()
+            self._current_token = token
+            query_id = self._query_id
+        self._requests.put((query_id, query_text, items, meta_lookup or {}, text_lookup, token))
+        return query_id
+
+    def cancel_current(self):
+        """진행 중인 검색 취소"""
+        with self._lock:
+            if self._current_token:
+                self._current_token.cancel()
+                self._current_token = None
+
+    def stop(self):
+        """
+        스레드 정지 함수
+        """
+        self.cancel_current()
+        self._requests.put(None)
+
+    def run(self):
+        """
+        스레드 실행 함수
+        대기 중인 요청 중 가장 최근 것만 처리
+        """
+        while True:
+            request = self._requests.get()
+            if request is None:
+                break
+            # 연속 입력으로 쌓인 요청은 마지막 것만 남김
+            while True:
+                try:
+                    newer = self._requests.get_nowait()
+                except queue.Empty:
+                    break
+                if newer is None:
+                    return
+                request = newer
+
+            query_id, query_text, items, meta_lookup, text_lookup, token = request
+            if token.cancelled:
+                continue
+            try:
+                started = time.perf_counter()
+                self._run_query(query_id, parse_query(query_text), items, meta_lookup, token, text_lookup)
+                if not token.cancelled:
+                    SEARCH_SECONDS.observe(time.perf_counter() - started)
+            except Exception as e:
+                log.error("SearchWorkerThread: 검색 중 오류: %s", e)
+
+    def _run_query(self, query_id, plan, items, meta_lookup, token, text_lookup=None):
+        """
+        최신 항목부터 검사하며 결과를 청크 단위로 전송
+        시간 예산을 넘기면 그때까지의 결과만 전송하고 중단함
+
+        Args:
+            query_id: 검색 ID
+            plan: search_query.QueryPlan 객체
+            items: 검색 대상 항목 리스트 (오래된 항목이 앞쪽)
+            meta_lookup: 항목 -> 메타데이터 딕셔너리
+            token: 취소 토큰
+            text_lookup: 항목 -> 검색할 텍스트 함수 (None이면 항목 자체가 텍스트)
+        """
+        deadline = time.monotonic() + QUERY_TIME_BUDGET_SEC
+        # 정규식은 항목 하나에도 시간이 걸릴 수 있으므로 매 항목마다 시간 예산 확인
+        check_interval = 1 if plan.regexes else SEARCH_BUDGET_CHECK_INTERVAL
+        pending = []
+        emitted = []  # 전송한 청크 (청크마다 순위순으로 정렬된 (순위, 순서, 항목) 리스트)
+        scanned_since_emit = 0
+        total = 0
+        is_first = True
+        truncated = False
+        now = time.time()
+
+        for seq, index in enumerate(range(len(items) - 1, -1, -1)):
+            item = items[index]
+            text = item if text_lookup is None else text_lookup(item)
+            if text is not None:
+                meta = meta_lookup.get(item)
+                if meta is None:
+                    meta = make_clip_meta(text, now)
+                if plan.match_meta(meta):
+                    rank = plan.match_text(text, text.lower())
+                    if rank is not None:
+                        pending.append((rank, seq, item))
+            scanned_since_emit += 1
+
+            if pending and (len(pending) >= SEARCH_FIRST_PAGE_SIZE or
+                            scanned_since_emit >= SEARCH_SCAN_CHUNK_SIZE):
+                if token.cancelled:
+                    return
+                pending.sort()
+                self.results_chunk_ready.emit(query_id, [entry[2] for entry in pending], is_first)
+                total += len(pending)
+                is_first = False
+                emitted.append(pending)
+                pending = []
+                scanned_since_emit = 0
+
+            if seq % check_interval == 0:
+                if token.cancelled:
+                    return
+                if time.monotonic() > deadline:
+                    log.debug("SearchWorkerThread: 시간 예산 초과로 검색 중단 (%s/%s개 검사)", seq + 1, len(items))
+                    truncated = True
+                    break
+
+        if token.cancelled:
+            return
+        if pending:
+            pending.sort()
+            self.results_chunk_ready.emit(query_id, [entry[2] for entry in pending], is_first)
+            total += len(pending)
+            emitted.append(pending)
+        if len(emitted) > 1:
+            # 청크별 정렬 순서가 전체 순위와 다르면 병합한 전체 목록으로 대체
+            merged = list(heapq.merge(*emitted))
+            if merged != [entry for chunk in emitted for entry in chunk]:
+                self.results_chunk_ready.emit(query_id, [entry[2] for entry in merged], True)
+        self.search_finished.emit(query_id, total, truncated)
@@ -0,0 +1,909 @@
+import argparse
+import asyncio
+import collections
+import hashlib
+import hmac
+import json
+import os
+import struct
+import sys
+import threading
+import time
+import uuid
+import zlib
+
+from app_logging import get_logger, redact_address, setup_logging
+from clipboard_monitor import clip_digest
+from sync_summary import HistorySummary, ID_PREFIX_BYTES
+from sync_transfer import (
+    SYNC_CHUNK_THRESHOLD, SYNC_MAX_TRANSFERS, SYNC_OUTGOING_MAX_BYTES, SYNC_TRANSFER_TTL_SEC, ChunkStore,
+    IncomingTransfer, OutgoingClip, OutgoingTransfer, PeerScheduler, TransferStats, chunk_id, pack_ack,
+    unpack_ack, unpack_chunk,
+)
+
+log = get_logger(__name__)
+
+# --- 클립보드 동기화 관련 상수 ---
+SYNC_DEFAULT_PORT = 48650
+SYNC_DEFAULT_HOST = "127.0.0.1"             # 다른 기기의 연결을 받으려면 설정에서 주소를 지정해야 함
+SYNC_PROTOCOL_VERSION = 2
+SYNC_NONCE_BYTES = 16                    # 연결마다 새로 만드는 인증 챌린지 크기
+SYNC_MAX_FRAME_BYTES = 16 * 1024 * 1024  # 프레임 하나의 최대 크기 (이보다 크면 연결 종료)
+SYNC_SEEN_CACHE_SIZE = 4096              # 이미 처리한 항목 ID를 기억하는 개수 (중복/순환 방지)
+SYNC_REJECTED_CACHE_SIZE = 1024          # 히스토리 보관 범위 밖이라 버린 원격 항목을 요약에 남겨 두는 개수
+SYNC_PEER_QUEUE_SIZE = 256               # 피어별 제어 메시지 대기열 크기 (가득 차면 새 메시지 버림)
+SYNC_RECONNECT_MIN_SEC = 1.0             # 재연결 대기 시간 (실패할 때마다 두 배, 최대값까지)
+SYNC_RECONNECT_MAX_SEC = 30.0
+SYNC_HELLO_TIMEOUT_SEC = 5.0             # 연결 후 인사 메시지를 기다리는 시간
+SYNC_PUBLISH_COALESCE_SEC = 0.016        # 새 항목을 모아 한 번에 전송하는 간격 (한 프레임)
+
+# 프레임 헤더: 본문 길이(4바이트, 빅엔디언) + 메시지 종류(1바이트)
+_FRAME_HEADER = struct.Struct("!IB")
+
+# 메시지 종류
+MSG_HELLO = 1       # {"node", "name", "version", "nonce"}
+MSG_CLIP = 2        # {"id", "text", "time", "origin", "live"}
+MSG_SUM_TOP = 3     # 상위 버킷 해시 (바이너리, sync_summary 참고)
+MSG_SUM_LEAVES = 4  # 리프 해시 (바이너리)
+MSG_SUM_IDS = 5     # 리프별 항목 목록 (바이너리)
+MSG_WANT = 6        # 요청하는 항목의 ID 앞부분 목록 (바이너리)
+MSG_MANIFEST = 7    # 큰 항목의 조각 목록 {"id", "time", "origin", "live", "size", "chunks"}
+MSG_NEED = 8        # 받는 쪽에 없는 조각 번호 {"id", "need"} (빈 목록이면 전송 불필요)
+MSG_CHUNK = 9       # 조각 (바이너리, sync_transfer 참고)
+MSG_CHUNK_ACK = 10  # 조각 확인 응답 (바이너리)
+MSG_AUTH = 11       # 상대의 챌린지에 대한 응답 {"proof"}
+
+
+def encode_frame(kind, payload):
+    """
+    메시지를 프레임 바이트열로 변환
+
+    Args:
+        kind: 메시지 종류 (MSG_*)
+        payload: JSON으로 직렬화할 딕셔너리 또는 bytes
+    """
+    if not isinstance(payload, (bytes, bytearray)):
+        payload = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return _FRAME_HEADER.pack(len(payload), kind) + payload
+
+
+async def read_frame(reader):
+    """
+    스트림에서 프레임 하나 읽기
+
+    Returns:
+        (메시지 종류, 본문 bytes)
+
+    Raises:
+        asyncio.IncompleteReadError: 연결이 끊긴 경우
+        ValueError: 프레임이 최대 크기를 넘는 경우
+    """
+    header = await reader.readexactly(_FRAME_HEADER.size)
+    length, kind = _FRAME_HEADER.unpack(header)
+    if length > SYNC_MAX_FRAME_BYTES:
+        raise ValueError(f"프레임이 너무 큽니다 ({length} bytes)")
+    return kind, await reader.readexactly(length)
+
+
+def _auth_proof(secret, challenge, nonce, node_id):
+    """
+    챌린지-응답 인증값
+    상대가 이번 연결에서 보낸 챌린지와 자신의 nonce, 노드 ID에 대한 HMAC이므로
+    한 번 엿본 값을 다른 연결에서 재사용할 수 없음
+
+    Args:
+        secret: 공유 비밀값
+        challenge: 검증하는 쪽이 보낸 nonce (16진수)
+        nonce: 증명하는 쪽의 nonce (16진수)
+        node_id: 증명하는 쪽의 노드 ID
+    """
+    message = f"unipaste-sync-auth|{challenge}|{nonce}|{node_id}".encode("utf-8")
+    return hmac.new(secret.encode("utf-8"), message, hashlib.sha256).hexdigest()
+
+
+class PeerConnection:
+    """
+    피어 하나와의 TCP 연결
+    전송은 피어별 스케줄러와 전송 작업으로 처리하므로 느린 피어가 다른 피어를 막지 않고,
+    큰 항목의 조각이 작은 항목을 막지 않음
+    """
+
+    def __init__(self, service, reader, writer, outbound):
+        self.service = service
+        self.reader = reader
+        self.writer = writer
+        self.outbound = outbound  # 이쪽에서 연결한 경우 True
+        self.node_id = None
+        self.name = ""
+        self.nonce = os.urandom(SYNC_NONCE_BYTES).hex()  # 이 연결에서 상대에게 보내는 챌린지
+        self.peer_nonce = None
+        peer = writer.get_extra_info("peername")
+        self.address = f"{peer[0]}:{peer[1]}" if peer else "?"
+        self.remote_host = peer[0] if peer else None
+        self.endpoint = None  # 상대의 수신 대기 주소 (호스트, 포트), 다시 시작한 노드를 알아보는 데 사용
+        self.scheduler = PeerScheduler(SYNC_PEER_QUEUE_SIZE)
+        self.stats = TransferStats()
+        self._wakeup = asyncio.Event()
+        self._writer_task = None
+
+    def send(self, frame):
+        """제어 메시지/작은 항목 프레임 전송 예약 (이벤트 루프 스레드에서 호출)"""
+        if self.scheduler.push_control(frame):
+            self._wakeup.set()
+
+    def start_transfer(self, clip):
+        """큰 항목의 조각 전송 시작 (목록을 먼저 보내고 받는 쪽의 need 응답을 기다림)"""
+        self.scheduler.transfers[clip.clip_id] = OutgoingTransfer(clip)
+        self.send(encode_frame(MSG_MANIFEST, clip.manifest()))
+
+    def adopt_transfers(self, transfers):
+        """
+        같은 피어로 보내던 전송 상태를 이어받음 (재연결 시 이어서 전송)
+        목록을 다시 보내면 받는 쪽은 아직 받지 못한 조각만 요청함
+        """
+        self.scheduler.transfers = transfers
+        for transfer in transfers.values():
+            transfer.needed = None
+            transfer.inflight = 0
+            self.send(encode_frame(MSG_MANIFEST, transfer.clip.manifest()))
+
+    def wake(self):
+        self._wakeup.set()
+
+    def _next_frame(self):
+        scheduler = self.scheduler
+        if scheduler.control:
+            return scheduler.control.popleft()
+        picked = scheduler.next_chunk()
+        if picked is None:
+            return None
+        transfer, index = picked
+        body, raw_size = transfer.clip.packed_chunk(index)
+        self.stats.chunks_sent += 1
+        self.stats.chunk_raw_bytes += raw_size
+        self.stats.chunk_wire_bytes += len(body)
+        return encode_frame(MSG_CHUNK, body)
+
+    async def _write_loop(self):
+        try:
+            while True:
+                frame = self._next_frame()
+                if frame is None:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                self.writer.write(frame)
+                self.stats.on_sent(len(frame))
+                await self.writer.drain()
+        except (ConnectionError, OSError):
+            self.close()  # 수신 쪽도 연결 종료를 감지하고 정리함
+
+    async def run(self):
+        """인사 교환 후 연결이 끊길 때까지 메시지 수신"""
+        service = self.service
+        self._writer_task = asyncio.ensure_future(self._write_loop())
+        try:
+            # 인사(nonce 교환) 후 서로 상대의 nonce에 대한 응답을 보내 인증
+            self.send(encode_frame(MSG_HELLO, service.hello_payload(self)))
+            kind, body = await asyncio.wait_for(read_frame(self.reader), SYNC_HELLO_TIMEOUT_SEC)
+            self.stats.on_received(_FRAME_HEADER.size + len(body))
+            if kind != MSG_HELLO or not service.check_hello(self, json.loads(body)):
+                return
+            self.send(encode_frame(MSG_AUTH, service.auth_payload(self)))
+            kind, body = await asyncio.wait_for(read_frame(self.reader), SYNC_HELLO_TIMEOUT_SEC)
+            self.stats.on_received(_FRAME_HEADER.size + len(body))
+            if kind != MSG_AUTH or not service.accept_auth(self, json.loads(body)):
+                return
+            while True:
+                kind, body = await read_frame(self.reader)
+                self.stats.on_received(_FRAME_HEADER.size + len(body))
+                handler = service.handlers.get(kind)
+                if handler is None:
+                    continue  # 알 수 없는 메시지는 무시 (이후 버전과의 호환성)
+                handler(self, body)
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.TimeoutError):
+            pass
+        except (ValueError, KeyError, TypeError, IndexError, zlib.error, struct.error) as e:
+            log.warning("SyncService: 잘못된 메시지로 연결 종료 (%s): %s", redact_address(self.address), e)
+        finally:
+            self.close()
+            service.remove_peer(self)
+
+    def close(self):
+        if self._writer_task is not None and not self._writer_task.done():
+            self._writer_task.cancel()
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+    def snapshot(self):
+        """전송 통계 딕셔너리 (이벤트 루프 스레드에서 호출)"""
+        stats = self.stats
+        control, chunks, pending_bytes = self.scheduler.backlog()
+        ratio = stats.compression_ratio()
+        return {
+            "peer": self.name or (self.node_id or "")[:8],
+            "address": self.address,
+            "outbound": self.outbound,
+            "connected_sec": round(time.monotonic() - stats.connected_at, 1),
+            "bytes_sent": stats.bytes_sent,
+            "bytes_received": stats.bytes_received,
+            "send_rate_bps": round(stats.send_rate(), 1),
+            "clips_sent": stats.clips_sent,
+            "clips_received": stats.clips_received,
+            "chunks_sent": stats.chunks_sent,
+            "chunks_received": stats.chunks_received,
+            "compression_ratio": None if ratio is None else round(ratio, 3),
+            "backlog_frames": control,
+            "backlog_chunks": chunks,
+            "backlog_bytes": pending_bytes,
+            "transfers": len(self.scheduler.transfers),
+            "dropped": self.scheduler.dropped,
+        }
+
+
+class SyncService:
+    """
+    LAN 클립보드 동기화 서비스
+    별도 스레드의 asyncio 이벤트 루프 하나에서 서버 소켓과 모든 피어 연결을 처리함.
+    새 로컬 항목은 publish()로 모든 피어에 전송하고, 피어에게 받은 항목은
+    on_remote_clip 콜백으로 전달함 (받은 항목은 다른 피어에게 다시 전송하지 않음).
+    """
+
+    def __init__(self, port=SYNC_DEFAULT_PORT, peers=(), host=SYNC_DEFAULT_HOST, secret="",
+                 name="", on_remote_clip=None):
+        """
+        초기화 함수
+
+        Args:
+            port: 수신 대기 포트 (0이면 임의의 포트)
+            peers: 연결할 피어 주소 리스트 ("호스트:포트")
+            host: 수신 대기 주소 (기본값: 이 기기에서만 접속 가능, 다른 기기의 연결을 받으려면 주소를 지정)
+            secret: 피어 인증용 공유 비밀값 (필수)
+            name: 피어에게 알릴 이 기기의 이름
+            on_remote_clip: 원격 항목 수신 시 호출할 함수 (text, timestamp, origin, live), 이벤트 루프 스레드에서 호출됨
+                            live는 새로 복사된 항목이면 True, 재연결 동기화로 받은 이전 항목이면 False
+        """
+        if not secret:
+            raise ValueError("동기화에는 공유 비밀값(secret)이 필요합니다")
+        self.port = port
+        self.host = host or SYNC_DEFAULT_HOST
+        self.peer_addresses = [self._parse_address(address) for address in peers]
+        self.secret = secret
+        self.name = name
+        self.on_remote_clip = on_remote_clip
+        self.node_id = uuid.uuid4().hex
+        self.peers = set()
+        self._seen = collections.OrderedDict()  # 처리한 (항목 ID, 복사 시각) (LRU)
+        self.summary = HistorySummary()  # 로컬 히스토리 요약 (재연결 시 차이만 교환)
+        self._texts = {}  # 항목 ID -> (텍스트, 복사 시각)
+        self._rejected = collections.OrderedDict()  # 받았지만 히스토리에 넣지 않은 항목 ID -> 복사 시각 (LRU)
+        self._primary = {}  # 노드 ID -> 항목 전송에 사용하는 연결 (양쪽에서 연결해 연결이 둘일 수 있음)
+        self._outgoing = {}  # 노드 ID -> {항목 ID: OutgoingTransfer} (연결이 끊겨도 잠시 유지해 재연결 시 이어서 전송)
+        self._detached = {}  # 연결이 모두 끊긴 노드 ID -> (끊긴 시각, 수신 대기 주소)
+        self._incoming = collections.OrderedDict()  # 항목 ID -> IncomingTransfer
+        self._chunk_store = ChunkStore()
+        self._pending_publish = []  # 다음 전송 때 보낼 (텍스트, 복사 시각)
+        self._publish_handle = None
+        self.publish_coalesced = 0  # 한 프레임 안에 연달아 복사되어 피어 클립보드에는 적용하지 않은 항목 수
+        self.handlers = {
+            MSG_CLIP: self._handle_clip,
+            MSG_SUM_TOP: self._handle_sum_top,
+            MSG_SUM_LEAVES: self._handle_sum_leaves,
+            MSG_SUM_IDS: self._handle_sum_ids,
+            MSG_WANT: self._handle_want,
+            MSG_MANIFEST: self._handle_manifest,
+            MSG_NEED: self._handle_need,
+            MSG_CHUNK: self._handle_chunk,
+            MSG_CHUNK_ACK: self._handle_ack,
+        }
+        self._loop = None
+        self._stopped = None
+        self._thread = None
+        self._ready = threading.Event()
+
+    @staticmethod
+    def _parse_address(address):
+        host, _, port = str(address).rpartition(":")
+        return (host or "127.0.0.1", int(port or SYNC_DEFAULT_PORT))
+
+    # --- 스레드 / 이벤트 루프 관리 ---
+
+    def start(self):
+        """이벤트 루프 스레드 시작 (서버 소켓이 열릴 때까지 대기)"""
+        self._thread = threading.Thread(target=self._run_loop, name="SyncService", daemon=True)
+        self._thread.start()
+        self._ready.wait(5.0)
+
+    def stop(self, timeout=1.0):
+        """모든 연결을 닫고 이벤트 루프 스레드 종료"""
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self._stopped.set)
+            except RuntimeError:
+                pass  # 이미 종료된 루프
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run_loop(self):
+        loop = self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._main())
+        except Exception as e:
+            log.error("SyncService: 이벤트 루프 오류: %s", e)
+        finally:
+            self._ready.set()
+            loop.close()
+            log.info("SyncService: 중지됨.")
+
+    async def _main(self):
+        self._stopped = asyncio.Event()
+        server = await asyncio.start_server(self._handle_inbound, self.host, self.port)
+        self.port = server.sockets[0].getsockname()[1]
+        log.info("SyncService: %s:%s에서 수신 대기 (노드 %s)", self.host, self.port, self.node_id[:8])
+        connectors = [asyncio.ensure_future(self._connect_forever(address)) for address in self.peer_addresses]
+        self._ready.set()
+        try:
+            await self._stopped.wait()
+        finally:
+            server.close()
+            for task in connectors:
+                task.cancel()
+            for peer in list(self.peers):
+                peer.close()
+            # 남은 연결 작업 정리 (인사 교환 중인 연결 포함)
+            pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await server.wait_closed()
+
+    async def _handle_inbound(self, reader, writer):
+        try:
+            await PeerConnection(self, reader, writer, outbound=False).run()
+        except asyncio.CancelledError:
+            pass  # 서비스 종료 중
+
+    async def _connect_forever(self, address):
+        """피어에 연결하고, 연결이 끊기면 대기 시간을 늘려 가며 다시 연결"""
+        delay = SYNC_RECONNECT_MIN_SEC
+        while True:
+            try:
+                reader, writer = await asyncio.open_connection(*address)
+                delay = SYNC_RECONNECT_MIN_SEC
+                await PeerConnection(self, reader, writer, outbound=True).run()
+            except OSError:
+                pass
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, SYNC_RECONNECT_MAX_SEC)
+
+    # --- 피어 관리 ---
+
+    def hello_payload(self, peer):
+        return {
+            "node": self.node_id,
+            "name": self.name,
+            "version": SYNC_PROTOCOL_VERSION,
+            "nonce": peer.nonce,
+            "port": self.port,
+        }
+
+    def check_hello(self, peer, hello):
+        """
+        피어의 인사 메시지 확인 (아직 인증 전)
+
+        Returns:
+            인증을 계속 진행하면 True (자기 자신이거나 버전/nonce가 맞지 않으면 False)
+        """
+        node_id = str(hello.get("node", ""))
+        nonce = str(hello.get("nonce", ""))
+        if not node_id or node_id == self.node_id:
+            return False
+        if hello.get("version") != SYNC_PROTOCOL_VERSION or len(nonce) != SYNC_NONCE_BYTES * 2 or nonce == peer.nonce:
+            log.warning("SyncService: 지원하지 않는 인사 메시지로 연결 거부 (%s)", redact_address(peer.address))
+            return False
+        peer.node_id = node_id
+        peer.name = str(hello.get("name", ""))
+        peer.peer_nonce = nonce
+        port = hello.get("port")
+        if peer.remote_host and isinstance(port, int) and 0 < port < 65536:
+            peer.endpoint = (peer.remote_host, port)
+        return True
+
+    def auth_payload(self, peer):
+        """상대가 보낸 챌린지에 대한 응답"""
+        return {"proof": _auth_proof(self.secret, peer.peer_nonce, peer.nonce, self.node_id)}
+
+    def accept_auth(self, peer, auth):
+        """
+        피어의 챌린지 응답 확인 후 연결 등록
+
+        Returns:
+            연결을 유지하면 True (인증에 실패하면 False)
+        """
+        expected = _auth_proof(self.secret, peer.nonce, peer.peer_nonce, peer.node_id)
+        if not hmac.compare_digest(str(auth.get("proof", "")), expected):
+            log.warning("SyncService: 인증 실패로 연결 거부 (%s)", redact_address(peer.address))
+            return False
+        node_id = peer.node_id
+        self.peers.add(peer)
+        log.info("SyncService: 피어 연결됨 %s (%s)", peer.name or node_id[:8], redact_address(peer.address))
+        if node_id not in self._primary:
+            self._detached.pop(node_id, None)
+            self._drop_replaced_nodes(node_id, peer.endpoint)
+            self._primary[node_id] = peer
+            peer.adopt_transfers(self._outgoing.setdefault(node_id, {}))
+        if peer.outbound:
+            self._start_reconcile(peer)
+        return True
+
+    def remove_peer(self, peer):
+        if peer in self.peers:
+            self.peers.discard(peer)
+            log.info("SyncService: 피어 연결 종료 %s (%s)", peer.name or peer.node_id[:8], redact_address(peer.address))
+        if peer.node_id is not None and self._primary.get(peer.node_id) is peer:
+            del self._primary[peer.node_id]
+            # 같은 노드와의 다른 연결이 있으면 전송 작업을 넘겨받음
+            for other in self.peers:
+                if other.node_id == peer.node_id:
+                    self._primary[peer.node_id] = other
+                    other.adopt_transfers(self._outgoing[peer.node_id])
+                    break
+            else:
+                self._detach(peer.node_id, peer.endpoint)
+
+    def _route(self, peer):
+        """항목을 보낼 연결 (같은 노드의 대표 연결)"""
+        return self._primary.get(peer.node_id, peer)
+
+    # --- 연결이 끊긴 노드의 전송 정리 ---
+
+    def _detach(self, node_id, endpoint):
+        """연결이 모두 끊긴 노드의 전송을 SYNC_TRANSFER_TTL_SEC 동안만 보관"""
+        if not self._outgoing.get(node_id):
+            self._outgoing.pop(node_id, None)
+            return
+        self._detached[node_id] = (time.monotonic(), endpoint)
+        if self._loop is not None:
+            self._loop.call_later(SYNC_TRANSFER_TTL_SEC, self._expire_outgoing)
+
+    def _drop_outgoing(self, node_id):
+        self._detached.pop(node_id, None)
+        transfers = self._outgoing.pop(node_id, None)
+        if transfers:
+            log.debug("SyncService: 노드 %s로 보내던 전송 %d개 정리", node_id[:8], len(transfers))
+
+    def _expire_outgoing(self):
+        """연결이 끊긴 지 SYNC_TRANSFER_TTL_SEC가 지난 노드의 전송을 버림"""
+        now = time.monotonic()
+        for node_id, (since, _) in list(self._detached.items()):
+            if now - since >= SYNC_TRANSFER_TTL_SEC:
+                self._drop_outgoing(node_id)
+
+    def _drop_replaced_nodes(self, node_id, endpoint):
+        """
+        같은 수신 대기 주소로 다른 노드 ID가 연결되면 그 주소의 이전 노드 전송을 버림
+        (노드 ID는 실행할 때마다 새로 만들므로 다시 시작한 피어는 이전 전송을 이어받지 못함)
+        """
+        if endpoint is None:
+            return
+        for other_id, (_, other_endpoint) in list(self._detached.items()):
+            if other_id != node_id and other_endpoint == endpoint:
+                self._drop_outgoing(other_id)
+
+    def _trim_outgoing(self):
+        """
+        보내는 중인 항목의 전체 크기를 SYNC_OUTGOING_MAX_BYTES 이하로 유지
+        연결이 끊긴 노드의 전송부터, 그 안에서는 우선순위가 낮은 전송부터 버림
+        (여러 피어가 공유하는 항목은 모든 전송이 버려져야 크기가 줄어듦)
+        """
+        sizes = {}
+        references = collections.Counter()
+        candidates = []
+        for node_id, transfers in self._outgoing.items():
+            detached = node_id in self._detached
+            for clip_id, transfer in transfers.items():
+                sizes[clip_id] = transfer.clip.size
+                references[clip_id] += 1
+                candidates.append((detached, transfer.priority, node_id, clip_id))
+        held = sum(sizes.values())
+        if held <= SYNC_OUTGOING_MAX_BYTES:
+            return
+        candidates.sort(reverse=True)
+        for _, _, node_id, clip_id in candidates:
+            if held <= SYNC_OUTGOING_MAX_BYTES:
+                break
+            del self._outgoing[node_id][clip_id]
+            references[clip_id] -= 1
+            if not references[clip_id]:
+                held -= sizes[clip_id]
+        for node_id in list(self._detached):
+            if not self._outgoing.get(node_id):
+                self._drop_outgoing(node_id)
+
+    # --- 로컬 히스토리 추적 ---
+
+    def load_history(self, items):
+        """
+        시작 전에 현재 히스토리로 요약 생성
+
+        Args:
+            items: (텍스트, 복사 시각) 목록
+        """
+        for text, timestamp in items:
+            self._track(text, timestamp)
+
+    def track(self, text, timestamp):
+        """히스토리에 항목이 추가/갱신됨 (어느 스레드에서나 호출 가능)"""
+        self._call_in_loop(self._track, text, timestamp)
+
+    def untrack(self, text):
+        """히스토리에서 항목이 삭제됨 (어느 스레드에서나 호출 가능)"""
+        self._call_in_loop(self._untrack, text)
+
+    def reject(self, text, timestamp):
+        """
+        받은 항목이 히스토리의 가장 오래된 항목보다 오래되어 버려짐 (어느 스레드에서나 호출 가능)
+        요약에는 가진 항목처럼 남겨 두어 피어가 재연결할 때마다 다시 보내지 않도록 함
+        """
+        self._call_in_loop(self._reject, text, timestamp)
+
+    def _track(self, text, timestamp):
+        clip_id = clip_digest(text)
+        self._rejected.pop(clip_id, None)
+        self._texts[clip_id] = (text, timestamp)
+        self.summary.add(clip_id, timestamp)
+
+    def _reject(self, text, timestamp):
+        clip_id = clip_digest(text)
+        if clip_id in self._texts:
+            return
+        rejected = self._rejected
+        rejected[clip_id] = timestamp
+        rejected.move_to_end(clip_id)
+        self.summary.add(clip_id, timestamp)
+        if len(rejected) > SYNC_REJECTED_CACHE_SIZE:
+            oldest, _ = rejected.popitem(last=False)
+            self.summary.remove(oldest)
+
+    def _untrack(self, text):
+        clip_id = clip_digest(text)
+        self._texts.pop(clip_id, None)
+        self.summary.remove(clip_id)
+
+    def _call_in_loop(self, func, *args):
+        """이벤트 루프 스레드에서 실행 (루프 시작 전이면 바로 실행)"""
+        loop = self._loop
+        if loop is None:
+            func(*args)
+            return
+        try:
+            loop.call_soon_threadsafe(func, *args)
+        except RuntimeError:
+            pass  # 종료된 루프
+
+    # --- 항목 전송 / 수신 ---
+
+    def _seen_key(self, clip_id, timestamp):
+        return (clip_id, round(float(timestamp), 3))
+
+    def _remember(self, clip_id, timestamp):
+        """
+        항목(ID와 복사 시각)을 처리 완료로 기록
+        같은 내용을 나중에 다시 복사하면 시각이 달라지므로 다시 전송됨
+
+        Returns:
+            처음 보는 항목이면 True
+        """
+        seen = self._seen
+        key = self._seen_key(clip_id, timestamp)
+        if key in seen:
+            seen.move_to_end(key)
+            return False
+        seen[key] = None
+        if len(seen) > SYNC_SEEN_CACHE_SIZE:
+            seen.popitem(last=False)
+        return True
+
+    def _clip_message(self, clip_id, text, timestamp, live):
+        return {"id": clip_id, "text": text, "time": timestamp, "origin": self.node_id, "live": live}
+
+    def _prepare_clip(self, clip_id, text, timestamp, live):
+        """
+        항목 전송 준비 (여러 피어에 보낼 때 한 번만 만들어 공유)
+
+        Returns:
+            작은 항목이면 MSG_CLIP 프레임 bytes, 큰 항목이면 조각으로 나눈 OutgoingClip
+        """
+        if len(text) * 4 > SYNC_CHUNK_THRESHOLD:  # UTF-8 인코딩 후 기준을 넘을 수 있는 경우만 확인
+            clip = OutgoingClip(clip_id, text, timestamp, self.node_id, live)
+            if clip.size > SYNC_CHUNK_THRESHOLD:
+                return clip
+        return encode_frame(MSG_CLIP, self._clip_message(clip_id, text, timestamp, live))
+
+    def _send_prepared(self, peer, prepared):
+        peer = self._route(peer)
+        if not isinstance(prepared, OutgoingClip):
+            peer.send(prepared)
+            return
+        transfers = peer.scheduler.transfers
+        transfers.pop(prepared.clip_id, None)
+        if len(transfers) >= SYNC_MAX_TRANSFERS:
+            # 우선순위가 가장 낮은 전송을 포기 (받는 쪽은 다음 재연결 동기화 때 다시 요청함)
+            del transfers[max(transfers.values(), key=lambda transfer: transfer.priority).clip.clip_id]
+        peer.start_transfer(prepared)
+        self._trim_outgoing()
+
+    def publish(self, text, timestamp=None):
+        """
+        새 로컬 항목을 모든 피어에 전송 (어느 스레드에서나 호출 가능, 바로 반환)
+
+        Args:
+            text: 항목 텍스트
+            timestamp: 복사 시각 (기본값: 현재 시각)
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._queue_publish, text, time.time() if timestamp is None else timestamp)
+        except RuntimeError:
+            pass  # 종료 중인 루프
+
+    def _queue_publish(self, text, timestamp):
+        self._pending_publish.append((text, timestamp))
+        if self._publish_handle is None:
+            self._publish_handle = self._loop.call_later(SYNC_PUBLISH_COALESCE_SEC, self._flush_publish)
+
+    def _flush_publish(self):
+        """
+        모아 둔 새 항목 전송
+        한 프레임 안에 여러 항목이 복사되면 마지막 항목만 피어 클립보드에 적용되도록(live) 보내고,
+        나머지는 히스토리에만 추가되도록 보냄
+        """
+        pending, self._pending_publish = self._pending_publish, []
+        self._publish_handle = None
+        self.publish_coalesced += len(pending) - 1
+        for index, (text, timestamp) in enumerate(pending):
+            self._broadcast(text, timestamp, live=index == len(pending) - 1)
+
+    def _broadcast(self, text, timestamp, live=True):
+        clip_id = clip_digest(text)
+        if not self._remember(clip_id, timestamp):
+            return  # 방금 피어에게 받은 항목 (다시 보내지 않음)
+        if not self._primary:
+            return
+        prepared = self._prepare_clip(clip_id, text, timestamp, live)
+        for peer in list(self._primary.values()):
+            self._send_prepared(peer, prepared)
+
+    def _deliver(self, peer, clip_id, text, timestamp, origin, live):
+        """받은 항목을 콜백으로 전달 (이미 처리한 항목이면 무시)"""
+        if not self._remember(clip_id, timestamp):
+            return
+        peer.stats.clips_received += 1
+        if self.on_remote_clip is not None:
+            try:
+                self.on_remote_clip(text, timestamp, origin or peer.node_id, live)
+            except Exception as e:
+                log.error("SyncService: 원격 항목 처리 중 오류: %s", e)
+
+    def _handle_clip(self, peer, body):
+        message = json.loads(body)
+        text = message["text"]
+        clip_id = message["id"]
+        timestamp = float(message.get("time") or time.time())
+        if not isinstance(text, str) or clip_digest(text) != clip_id:
+            raise ValueError("항목 ID가 내용과 일치하지 않습니다")
+        self._deliver(peer, clip_id, text, timestamp, message.get("origin"), bool(message.get("live", True)))
+
+    def _send_clips(self, peer, clip_ids):
+        """히스토리 항목을 재연결 동기화용(live=False)으로 전송"""
+        for clip_id in clip_ids:
+            entry = self._texts.get(clip_id)
+            if entry is not None:
+                text, timestamp = entry
+                self._send_prepared(peer, self._prepare_clip(clip_id, text, timestamp, False))
+
+    # --- 큰 항목 조각 전송 ---
+    # 보내는 쪽(A)과 받는 쪽(B) 사이의 교환 순서:
+    #   A -> B  MSG_MANIFEST   항목 정보와 조각 해시 목록
+    #   B -> A  MSG_NEED       B에게 없는 조각 번호 (받은 조각 보관소에 있는 조각은 제외)
+    #   A -> B  MSG_CHUNK ...  우선순위 순으로 항목별 전송 창 안에서 전송
+    #   B -> A  MSG_CHUNK_ACK  조각마다 확인 응답
+    # 연결이 끊기면 A는 재연결 후 목록을 다시 보내고, B는 아직 받지 못한 조각만 요청함
+
+    def _handle_manifest(self, peer, body):
+        manifest = json.loads(body)
+        transfer = IncomingTransfer(manifest)
+        clip_id = transfer.clip_id
+        if self._seen_key(clip_id, transfer.timestamp) in self._seen:
+            peer.send(encode_frame(MSG_NEED, {"id": clip_id, "need": []}))
+            return
+        incoming = self._incoming
+        previous = incoming.pop(clip_id, None)
+        if previous is not None and previous.chunk_ids == transfer.chunk_ids:
+            previous.live = transfer.live
+            transfer = previous
+        else:
+            for index, key in enumerate(transfer.chunk_ids):
+                data = self._chunk_store.get(key)
+                if data is not None:
+                    transfer.received[index] = data
+        if transfer.complete():
+            peer.send(encode_frame(MSG_NEED, {"id": clip_id, "need": []}))
+            self._finish_incoming(peer, transfer)
+            return
+        incoming[clip_id] = transfer
+        if len(incoming) > SYNC_MAX_TRANSFERS:
+            incoming.popitem(last=False)
+        peer.send(encode_frame(MSG_NEED, {"id": clip_id, "need": transfer.missing()}))
+
+    def _handle_chunk(self, peer, body):
+        clip_id, index, data = unpack_chunk(body)
+        peer.send(encode_frame(MSG_CHUNK_ACK, pack_ack(clip_id, index)))
+        peer.stats.chunks_received += 1
+        transfer = self._incoming.get(clip_id)
+        if transfer is None or not 0 <= index < len(transfer.chunk_ids):
+            return  # 이미 완료했거나 포기한 전송
+        key = chunk_id(data)
+        if key != transfer.chunk_ids[index]:
+            raise ValueError("조각 해시가 목록과 일치하지 않습니다")
+        self._chunk_store.put(key, data)
+        transfer.received[index] = data
+        if transfer.complete():
+            del self._incoming[clip_id]
+            self._finish_incoming(peer, transfer)
+
+    def _finish_incoming(self, peer, transfer):
+        text = transfer.assemble()
+        if clip_digest(text) != transfer.clip_id:
+            raise ValueError("항목 ID가 내용과 일치하지 않습니다")
+        self._deliver(peer, transfer.clip_id, text, transfer.timestamp, transfer.origin, transfer.live)
+
+    def _handle_need(self, peer, body):
+        message = json.loads(body)
+        transfers = peer.scheduler.transfers
+        transfer = transfers.get(message["id"])
+        if transfer is None:
+            return
+        count = len(transfer.clip.chunks)
+        need = sorted({int(index) for index in message["need"] if 0 <= int(index) < count})
+        if not need:
+            del transfers[transfer.clip.clip_id]  # 받는 쪽에 이미 있음
+            peer.stats.clips_sent += 1
+            return
+        transfer.needed = collections.deque(need)
+        transfer.inflight = 0
+        peer.wake()
+
+    def _handle_ack(self, peer, body):
+        clip_id, _ = unpack_ack(body)
+        transfers = peer.scheduler.transfers
+        transfer = transfers.get(clip_id)
+        if transfer is None:
+            return
+        transfer.inflight = max(0, transfer.inflight - 1)
+        transfer.acked += 1
+        if not transfer.needed and transfer.inflight == 0:
+            del transfers[clip_id]
+            peer.stats.clips_sent += 1
+        peer.wake()
+
+    # --- 전송 통계 ---
+
+    def peer_stats(self, timeout=1.0):
+        """
+        피어별 전송 통계 (어느 스레드에서나 호출 가능)
+
+        Returns:
+            피어별 통계 딕셔너리 리스트 (서비스가 실행 중이 아니면 빈 리스트)
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return []
+
+        async def collect():
+            return [peer.snapshot() for peer in self.peers]
+
+        try:
+            return asyncio.run_coroutine_threadsafe(collect(), loop).result(timeout)
+        except Exception as e:
+            log.warning("SyncService: 전송 통계 수집 실패: %s", e)
+            return []
+
+    def format_peer_stats(self):
+        """피어별 전송 통계를 사람이 읽기 쉬운 문자열로 반환"""
+        stats = self.peer_stats()
+        if not stats:
+            return "동기화: 연결된 피어 없음"
+        lines = [f"동기화 피어 (묶어서 보낸 항목 {self.publish_coalesced}):"]
+        for item in stats:
+            ratio = item["compression_ratio"]
+            lines.append(
+                f"  {item['peer']} ({item['address']}): "
+                f"송신 {item['bytes_sent'] / 1024:.1f}KB ({item['send_rate_bps'] / 1024:.1f}KB/s), "
+                f"수신 {item['bytes_received'] / 1024:.1f}KB, "
+                f"항목 {item['clips_sent']}/{item['clips_received']}, "
+                f"대기 {item['backlog_chunks']}조각/{item['transfers']}건"
+                + (f", 압축률 {ratio:.2f}" if ratio is not None else "")
+            )
+        return "\n".join(lines)
+
+    # --- 재연결 동기화 (차이가 있는 버킷만 교환) ---
+    # 연결한 쪽(A)과 받은 쪽(B) 사이의 교환 순서:
+    #   A -> B  MSG_SUM_TOP     상위 버킷 해시 64개
+    #   B -> A  MSG_SUM_LEAVES  해시가 다른 상위 버킷의 리프 해시
+    #   A -> B  MSG_SUM_IDS     해시가 다른 리프의 (ID 앞부분, 시각) 목록
+    #   B -> A  MSG_CLIP ...    A에게 없거나 A 것이 오래된 항목
+    #   B -> A  MSG_WANT        B에게 없거나 B 것이 오래된 항목의 ID 앞부분
+    #   A -> B  MSG_CLIP ...
+
+    def _start_reconcile(self, peer):
+        peer.send(encode_frame(MSG_SUM_TOP, self.summary.pack_top()))
+
+    def _handle_sum_top(self, peer, body):
+        buckets = self.summary.diff_top(body)
+        if buckets:
+            peer.send(encode_frame(MSG_SUM_LEAVES, self.summary.pack_leaves(buckets)))
+
+    def _handle_sum_leaves(self, peer, body):
+        leaves = self.summary.diff_leaves(body)
+        if leaves:
+            peer.send(encode_frame(MSG_SUM_IDS, self.summary.pack_ids(leaves)))
+
+    def _handle_sum_ids(self, peer, body):
+        send, want = self.summary.compare_ids(body)
+        self._send_clips(peer, send)
+        if want:
+            peer.send(encode_frame(MSG_WANT, b"".join(want)))
+
+    def _handle_want(self, peer, body):
+        if len(body) % ID_PREFIX_BYTES:
+            raise ValueError("요청 목록 크기가 올바르지 않습니다")
+        prefixes = (body[offset:offset + ID_PREFIX_BYTES] for offset in range(0, len(body), ID_PREFIX_BYTES))
+        self._send_clips(peer, [clip_id for clip_id in map(self.summary.resolve_prefix, prefixes) if clip_id])
+
+
+def main(argv=None):
+    """
+    단독 실행 모드 (같은 컴퓨터에서 여러 인스턴스로 동기화 확인용)
+    표준 입력의 각 줄을 새 항목으로 전송하고, 받은 항목을 출력함
+
+    예:
+        python sync_service.py --port 48650
+        python sync_service.py --port 48651 --peer 127.0.0.1:48650
+    """
+    parser = argparse.ArgumentParser(description="UniPaste 클립보드 동기화 노드")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=SYNC_DEFAULT_PORT)
+    parser.add_argument("--peer", action="append", default=[], help="연결할 피어 (호스트:포트), 여러 번 지정 가능")
+    parser.add_argument("--secret", default="")
+    parser.add_argument("--name", default="")
+    args = parser.parse_args(argv)
+    setup_logging()
+
+    def on_remote_clip(text, timestamp, origin, live):
+        print(f"[{origin[:8]}{'' if live else ', 동기화'}] {text}", flush=True)
+        service.track(text, timestamp)
+
+    service = SyncService(args.port, args.peer, args.host, args.secret, args.name, on_remote_clip)
+    service.start()
+    try:
+        for line in sys.stdin:
+            line = line.rstrip("\n")
+            if line:
+                now = time.time()
+                service.track(line, now)
+                service.publish(line, now)
+    except KeyboardInterrupt:
+        pass
+    service.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+import hashlib
+import struct
+
+# --- 히스토리 요약 관련 상수 ---
+SUMMARY_FANOUT = 64                               # 단계별 버킷 수 (상위 64개 x 하위 64개)
+SUMMARY_LEAVES = SUMMARY_FANOUT * SUMMARY_FANOUT  # 하위 버킷(리프) 총 개수
+ID_PREFIX_BYTES = 8                               # 항목 목록 교환 시 사용하는 ID 앞부분 길이
+
+_HASH = struct.Struct("!I")
+_LEAF_HEADER = struct.Struct("!HH")   # 리프 번호, 항목 수
+_ID_ENTRY = struct.Struct(f"!{ID_PREFIX_BYTES}sI")  # ID 앞부분, 복사 시각(초)
+
+
+def _item_hash(clip_id, timestamp):
+    """항목 하나의 32비트 해시 (ID와 초 단위 복사 시각)"""
+    digest = hashlib.blake2b(f"{clip_id}:{timestamp}".encode("ascii"), digest_size=4).digest()
+    return _HASH.unpack(digest)[0]
+
+
+def leaf_of(clip_id):
+    """항목 ID(16진수 문자열)의 리프 번호 (앞 12비트)"""
+    return int(clip_id[:3], 16)
+
+
+def id_prefix(clip_id):
+    """항목 ID의 앞부분 (bytes)"""
+    return bytes.fromhex(clip_id[:ID_PREFIX_BYTES * 2])
+
+
+class HistorySummary:
+    """
+    항목 ID/복사 시각 집합의 2단계 버킷 해시 요약 (머클 트리의 단순화된 형태)
+
+    각 리프 해시는 그 리프에 속한 항목 해시의 XOR이고, 상위 버킷 해시는 하위 64개 리프의 XOR이므로
+    항목 추가/삭제는 O(1)로 갱신됨. 두 기기는 상위 64개 해시 -> 다른 상위 버킷의 리프 해시 ->
+    다른 리프의 항목 ID 순서로 차이가 있는 부분만 좁혀 가며 교환함.
+    """
+
+    def __init__(self):
+        self.top = [0] * SUMMARY_FANOUT
+        self.leaves = [0] * SUMMARY_LEAVES
+        self.items = {}     # 항목 ID -> 복사 시각 (초, 정수)
+        self._by_leaf = {}  # 리프 번호 -> 항목 ID 집합
+        self._by_prefix = {}  # ID 앞부분 -> 항목 ID
+
+    def __len__(self):
+        return len(self.items)
+
+    def add(self, clip_id, timestamp):
+        """항목 추가 (이미 있으면 복사 시각 갱신)"""
+        seconds = int(timestamp)
+        if self.items.get(clip_id) == seconds:
+            return
+        self.remove(clip_id)
+        leaf = leaf_of(clip_id)
+        value = _item_hash(clip_id, seconds)
+        self.leaves[leaf] ^= value
+        self.top[leaf // SUMMARY_FANOUT] ^= value
+        self.items[clip_id] = seconds
+        self._by_leaf.setdefault(leaf, set()).add(clip_id)
+        self._by_prefix[id_prefix(clip_id)] = clip_id
+
+    def remove(self, clip_id):
+        """항목 삭제 (없으면 무시)"""
+        seconds = self.items.pop(clip_id, None)
+        if seconds is None:
+            return
+        leaf = leaf_of(clip_id)
+        value = _item_hash(clip_id, seconds)
+        self.leaves[leaf] ^= value
+        self.top[leaf // SUMMARY_FANOUT] ^= value
+        members = self._by_leaf[leaf]
+        members.discard(clip_id)
+        if not members:
+            del self._by_leaf[leaf]
+        self._by_prefix.pop(id_prefix(clip_id), None)
+
+    def resolve_prefix(self, prefix):
+        """ID 앞부분으로 항목 ID 찾기 (없으면 None)"""
+        return self._by_prefix.get(prefix)
+
+    # --- 1단계: 상위 버킷 ---
+
+    def pack_top(self):
+        """상위 버킷 해시 64개 (256바이트)"""
+        return b"".join(_HASH.pack(value) for value in self.top)
+
+    def diff_top(self, packed):
+        """
+        상대의 상위 버킷 해시와 비교
+
+        Returns:
+            해시가 다른 상위 버킷 번호 리스트
+        """
+        if len(packed) != SUMMARY_FANOUT * _HASH.size:
+            raise ValueError("상위 버킷 요약 크기가 올바르지 않습니다")
+        return [
+            bucket for bucket, (theirs,) in enumerate(_HASH.iter_unpack(packed))
+            if theirs != self.top[bucket]
+        ]
+
+    # --- 2단계: 리프 ---
+
+    def pack_leaves(self, buckets):
+        """
+        지정한 상위 버킷들의 리프 해시 (버킷마다 번호 1바이트 + 해시 64개)
+        """
+        parts = []
+        for bucket in buckets:
+            start = bucket * SUMMARY_FANOUT
+            parts.append(bytes((bucket,)))
+            parts.extend(_HASH.pack(value) for value in self.leaves[start:start + SUMMARY_FANOUT])
+        return b"".join(parts)
+
+    def diff_leaves(self, packed):
+        """
+        상대의 리프 해시와 비교
+
+        Returns:
+            해시가 다른 리프 번호 리스트
+        """
+        record_size = 1 + SUMMARY_FANOUT * _HASH.size
+        if len(packed) % record_size:
+            raise ValueError("리프 요약 크기가 올바르지 않습니다")
+        different = []
+        for offset in range(0, len(packed), record_size):
+            bucket = packed[offset]
+            if bucket >= SUMMARY_FANOUT:
+                raise ValueError("잘못된 상위 버킷 번호")
+            hashes = _HASH.iter_unpack(packed[offset + 1:offset + record_size])
+            start = bucket * SUMMARY_FANOUT
+            for index, (theirs,) in enumerate(hashes):
+                if theirs != self.leaves[start + index]:
+                    different.append(start + index)
+        return different
+
+    # --- 3단계: 항목 목록 ---
+
+    def pack_ids(self, leaves):
+        """
+        지정한 리프들의 항목 목록 (리프마다 번호/개수 + (ID 앞부분, 복사 시각) 목록)
+        """
+        parts = []
+        for leaf in leaves:
+            members = self._by_leaf.get(leaf, ())
+            parts.append(_LEAF_HEADER.pack(leaf, len(members)))
+            parts.extend(_ID_ENTRY.pack(id_prefix(clip_id), self.items[clip_id]) for clip_id in members)
+        return b"".join(parts)
+
+    def compare_ids(self, packed):
+        """
+        상대의 항목 목록과 비교
+
+        Returns:
+            (상대에게 없거나 상대 것이 더 오래된 내 항목 ID 리스트,
+             나에게 없거나 내 것이 더 오래된 상대 항목의 ID 앞부분 리스트)
+        """
+        send, want = [], []
+        offset = 0
+        while offset < len(packed):
+            leaf, count = _LEAF_HEADER.unpack_from(packed, offset)
+            offset += _LEAF_HEADER.size
+            if leaf >= SUMMARY_LEAVES:
+                raise ValueError("잘못된 리프 번호")
+            theirs = {}
+            for _ in range(count):
+                prefix, seconds = _ID_ENTRY.unpack_from(packed, offset)
+                offset += _ID_ENTRY.size
+                theirs[prefix] = seconds
+            for clip_id in self._by_leaf.get(leaf, ()):
+                their_seconds = theirs.pop(id_prefix(clip_id), None)
+                mine = self.items[clip_id]
+                if their_seconds is None or their_seconds < mine:
+                    send.append(clip_id)
+                elif their_seconds > mine:
+                    want.append(id_prefix(clip_id))
+            want.extend(theirs)  # 나에게 없는 항목
+        return send, want
@@ -0,0 +1,285 @@
+import collections
+import hashlib
+import heapq
+import itertools
+import struct
+import time
+import zlib
+
+# --- 큰 항목 전송 관련 상수 ---
+SYNC_CHUNK_THRESHOLD = 64 * 1024       # 이 크기(바이트)를 넘는 항목은 조각으로 나눠 전송
+SYNC_CHUNK_SIZE = 64 * 1024            # 조각 하나의 원본 크기
+SYNC_CHUNK_WINDOW = 8                  # 항목별로 확인 응답 없이 보낼 수 있는 조각 수
+SYNC_COMPRESS_LEVEL = 6
+SYNC_CHUNK_STORE_BYTES = 32 * 1024 * 1024  # 받은 조각 보관 용량 (중단된 전송 재개, 같은 조각 재사용)
+SYNC_RATE_WINDOW_SEC = 5.0             # 전송 속도 계산 구간
+SYNC_MAX_CLIP_BYTES = 64 * 1024 * 1024  # 조각으로 받을 수 있는 항목의 최대 크기
+SYNC_MAX_TRANSFERS = 32                # 피어별/수신 중 전송 작업 최대 개수 (넘으면 우선순위가 낮은 것부터 버림)
+SYNC_TRANSFER_TTL_SEC = 10 * 60        # 연결이 끊긴 피어로 보내던 전송을 재연결에 대비해 보관하는 시간
+SYNC_OUTGOING_MAX_BYTES = 128 * 1024 * 1024  # 보내는 중인 항목 전체의 최대 보관 크기 (넘으면 끊긴 피어의 전송부터 버림)
+
+# 조각 프레임 헤더: 항목 ID(16바이트) + 조각 번호(4바이트) + 플래그(1바이트, 1=zlib 압축)
+_CHUNK_HEADER = struct.Struct("!16sIB")
+CHUNK_FLAG_ZLIB = 1
+
+# 조각 확인 응답: 항목 ID(16바이트) + 조각 번호(4바이트)
+_CHUNK_ACK = struct.Struct("!16sI")
+
+
+def chunk_id(data):
+    """조각 내용의 해시 (16진수, 내용 주소)"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def pack_chunk(clip_id, index, data):
+    """
+    조각 프레임 본문 생성 (압축해서 작아질 때만 압축)
+
+    Returns:
+        (본문 bytes, 압축 전 크기)
+    """
+    compressed = zlib.compress(data, SYNC_COMPRESS_LEVEL)
+    if len(compressed) < len(data):
+        return _CHUNK_HEADER.pack(bytes.fromhex(clip_id), index, CHUNK_FLAG_ZLIB) + compressed, len(data)
+    return _CHUNK_HEADER.pack(bytes.fromhex(clip_id), index, 0) + data, len(data)
+
+
+def unpack_chunk(body):
+    """
+    조각 프레임 본문 해석
+
+    Returns:
+        (항목 ID, 조각 번호, 원본 데이터)
+    """
+    raw_id, index, flags = _CHUNK_HEADER.unpack_from(body)
+    data = body[_CHUNK_HEADER.size:]
+    if flags & CHUNK_FLAG_ZLIB:
+        decompressor = zlib.decompressobj()
+        data = decompressor.decompress(data, SYNC_CHUNK_SIZE + 1)
+        if decompressor.unconsumed_tail or len(data) > SYNC_CHUNK_SIZE:
+            raise ValueError("조각이 최대 크기를 넘습니다")
+    return raw_id.hex(), index, data
+
+
+def pack_ack(clip_id, index):
+    return _CHUNK_ACK.pack(bytes.fromhex(clip_id), index)
+
+
+def unpack_ack(body):
+    """
+    조각 확인 응답 해석
+
+    Returns:
+        (항목 ID, 조각 번호)
+    """
+    raw_id, index = _CHUNK_ACK.unpack(body)
+    return raw_id.hex(), index
+
+
+class OutgoingClip:
+    """
+    조각으로 나눈 전송 대상 항목 (모든 피어가 공유)
+    """
+
+    def __init__(self, clip_id, text, timestamp, origin, live):
+        self.clip_id = clip_id
+        self.timestamp = timestamp
+        self.origin = origin
+        self.live = live
+        payload = text.encode("utf-8", "surrogatepass")
+        self.size = len(payload)
+        self.chunks = [payload[offset:offset + SYNC_CHUNK_SIZE] for offset in range(0, len(payload), SYNC_CHUNK_SIZE)]
+        self.chunk_ids = [chunk_id(chunk) for chunk in self.chunks]
+        self._packed = {}  # 조각 번호 -> (압축된 본문, 원본 크기), 여러 피어에 보낼 때 재사용
+
+    def manifest(self):
+        return {
+            "id": self.clip_id,
+            "time": self.timestamp,
+            "origin": self.origin,
+            "live": self.live,
+            "size": self.size,
+            "chunks": self.chunk_ids,
+        }
+
+    def packed_chunk(self, index):
+        packed = self._packed.get(index)
+        if packed is None:
+            packed = self._packed[index] = pack_chunk(self.clip_id, index, self.chunks[index])
+        return packed
+
+
+class OutgoingTransfer:
+    """
+    피어 하나로 보내는 항목 하나의 진행 상태
+    연결이 끊겨도 서비스에 남아 있다가 같은 피어가 다시 연결되면 이어서 전송됨
+    """
+
+    def __init__(self, clip):
+        self.clip = clip
+        self.needed = None           # 보낼 조각 번호 (받는 쪽의 need 응답 전에는 None)
+        self.inflight = 0            # 확인 응답을 기다리는 조각 수
+        self.acked = 0
+
+    @property
+    def priority(self):
+        """작을수록 먼저 전송 (새로 복사된 항목, 작은 항목, 최근 항목 순)"""
+        clip = self.clip
+        return (not clip.live, len(clip.chunks), -clip.timestamp)
+
+    @property
+    def remaining(self):
+        """아직 확인 응답을 받지 못한 조각 수"""
+        if self.needed is None:
+            return len(self.clip.chunks)
+        return len(self.needed) + self.inflight
+
+    def ready(self):
+        return bool(self.needed) and self.inflight < SYNC_CHUNK_WINDOW
+
+
+class IncomingTransfer:
+    """받고 있는 항목 하나 (조각 번호 -> 데이터)"""
+
+    def __init__(self, manifest):
+        self.clip_id = manifest["id"]
+        self.timestamp = float(manifest.get("time") or time.time())
+        self.origin = manifest.get("origin")
+        self.live = bool(manifest.get("live", True))
+        self.size = int(manifest["size"])
+        self.chunk_ids = [str(value) for value in manifest["chunks"]]
+        self.received = {}
+        if not 0 < self.size <= SYNC_MAX_CLIP_BYTES:
+            raise ValueError(f"항목 크기가 허용 범위를 벗어났습니다 ({self.size} bytes)")
+        if len(self.chunk_ids) != -(-self.size // SYNC_CHUNK_SIZE):
+            raise ValueError("조각 수가 항목 크기와 맞지 않습니다")
+
+    def missing(self):
+        return [index for index in range(len(self.chunk_ids)) if index not in self.received]
+
+    def complete(self):
+        return len(self.received) == len(self.chunk_ids)
+
+    def assemble(self):
+        data = b"".join(self.received[index] for index in range(len(self.chunk_ids)))
+        if len(data) != self.size:
+            raise ValueError("항목 크기가 목록과 다릅니다")
+        return data.decode("utf-8", "surrogatepass")
+
+
+class ChunkStore:
+    """
+    받은 조각을 내용 해시로 보관하는 LRU 저장소 (용량 제한)
+    끊긴 전송을 다시 받을 때나 같은 조각이 다른 항목에 있을 때 다시 받지 않도록 함
+    """
+
+    def __init__(self, capacity=SYNC_CHUNK_STORE_BYTES):
+        self.capacity = capacity
+        self.size = 0
+        self._chunks = collections.OrderedDict()
+
+    def get(self, key):
+        data = self._chunks.get(key)
+        if data is not None:
+            self._chunks.move_to_end(key)
+        return data
+
+    def put(self, key, data):
+        if key in self._chunks:
+            self._chunks.move_to_end(key)
+            return
+        self._chunks[key] = data
+        self.size += len(data)
+        while self.size > self.capacity and self._chunks:
+            _, evicted = self._chunks.popitem(last=False)
+            self.size -= len(evicted)
+
+
+class PeerScheduler:
+    """
+    피어 하나의 전송 순서 결정
+    제어 메시지와 작은 항목은 바로 보내고, 큰 항목의 조각은 우선순위가 높은 항목부터
+    항목별 전송 창(SYNC_CHUNK_WINDOW) 안에서 번갈아 보내므로 큰 항목이 작은 항목을 막지 않음
+    """
+
+    def __init__(self, control_limit):
+        self.control = collections.deque()
+        self.control_limit = control_limit
+        self.transfers = {}  # 항목 ID -> OutgoingTransfer
+        self._order = itertools.count()
+        self.dropped = 0
+
+    def push_control(self, frame):
+        if len(self.control) >= self.control_limit:
+            self.dropped += 1
+            return False
+        self.control.append(frame)
+        return True
+
+    def next_chunk(self):
+        """
+        다음에 보낼 조각 선택
+
+        Returns:
+            (OutgoingTransfer, 조각 번호) 또는 보낼 조각이 없으면 None
+        """
+        ready = [
+            (transfer.priority, next(self._order), transfer)
+            for transfer in self.transfers.values() if transfer.ready()
+        ]
+        if not ready:
+            return None
+        transfer = heapq.nsmallest(1, ready)[0][2]
+        index = transfer.needed.popleft()
+        transfer.inflight += 1
+        return transfer, index
+
+    def backlog(self):
+        """(대기 중인 제어 메시지 수, 남은 조각 수, 남은 바이트 추정치)"""
+        chunks = sum(transfer.remaining for transfer in self.transfers.values())
+        pending_bytes = sum(
+            transfer.remaining * min(transfer.clip.size, 1 << 16) for transfer in self.transfers.values()
+        )
+        return len(self.control), chunks, pending_bytes
+
+
+class TransferStats:
+    """피어 하나의 전송량/속도 통계"""
+
+    def __init__(self):
+        self.connected_at = time.monotonic()
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.frames_sent = 0
+        self.frames_received = 0
+        self.chunks_sent = 0
+        self.chunks_received = 0
+        self.chunk_raw_bytes = 0     # 보낸 조각의 압축 전 크기
+        self.chunk_wire_bytes = 0    # 보낸 조각의 실제 전송 크기
+        self.clips_sent = 0
+        self.clips_received = 0
+        self._rate_samples = collections.deque()  # (시각, 누적 송신 바이트)
+
+    def on_sent(self, size):
+        self.bytes_sent += size
+        self.frames_sent += 1
+        now = time.monotonic()
+        samples = self._rate_samples
+        samples.append((now, self.bytes_sent))
+        while len(samples) > 1 and now - samples[0][0] > SYNC_RATE_WINDOW_SEC:
+            samples.popleft()
+
+    def on_received(self, size):
+        self.bytes_received += size
+        self.frames_received += 1
+
+    def send_rate(self):
+        """최근 전송 속도 (바이트/초)"""
+        samples = self._rate_samples
+        if len(samples) < 2:
+            return 0.0
+        (start, start_bytes), (end, end_bytes) = samples[0], samples[-1]
+        return (end_bytes - start_bytes) / (end - start) if end > start else 0.0
+
+    def compression_ratio(self):
+        return self.chunk_wire_bytes / self.chunk_raw_bytes if self.chunk_raw_bytes else None
@@ -0,0 +1,228 @@
+import re
+import threading
+import time
+
+from config_manager import load_config, save_config
+
+# --- 이메일 템플릿 관련 상수 ---
+TEMPLATE_DATE_FORMAT = "%Y-%m-%d"
+TEMPLATE_TIME_FORMAT = "%H:%M"
+
+# {이름} 형식의 치환자 ({{ 와 }} 는 중괄호 문자 자체)
+_PLACEHOLDER_PATTERN = re.compile(r'\{\{|\}\}|\{([A-Za-z_가-힣][\w가-힣]*)\}')
+
+
+def _latest_clipboard_item():
+    """가장 최근 클립보드 히스토리 항목 반환 (히스토리 복사 없이 마지막 항목만 읽음)"""
+    from clipboard_monitor import ClipboardMonitorThread
+    history = ClipboardMonitorThread.clipboard_history
+    return history[-1] if history else ""
+
+
+# 기본 제공 치환자 -> 값 계산 함수 (렌더링할 때마다 호출됨)
+BUILTIN_PLACEHOLDERS = {
+    "date": lambda: time.strftime(TEMPLATE_DATE_FORMAT),
+    "time": lambda: time.strftime(TEMPLATE_TIME_FORMAT),
+    "clipboard": _latest_clipboard_item,
+    "날짜": lambda: time.strftime(TEMPLATE_DATE_FORMAT),
+    "시간": lambda: time.strftime(TEMPLATE_TIME_FORMAT),
+    "클립보드": _latest_clipboard_item,
+}
+
+
+def compile_template(source):
+    """
+    템플릿 문자열을 렌더링 함수로 컴파일
+    파싱은 여기서 한 번만 수행하고, 렌더링 함수는 미리 나눠 둔 조각만 이어 붙임
+
+    지원 문법:
+        {name}          사용자 변수 (설정의 template_variables)
+        {date}, {time}  현재 날짜/시각
+        {clipboard}     가장 최근 클립보드 항목
+        {{, }}          중괄호 문자
+
+    정의되지 않은 치환자는 그대로 남겨둠
+
+    Args:
+        source: 템플릿 문자열
+
+    Returns:
+        render(variables) 함수 (variables: 사용자 변수 딕셔너리)
+    """
+    parts = []  # 문자열 조각 또는 (치환자 이름, 기본 제공 함수)
+    literal = []
+    position = 0
+    for match in _PLACEHOLDER_PATTERN.finditer(source):
+        literal.append(source[position:match.start()])
+        position = match.end()
+        token = match.group(0)
+        if token == "{{":
+            literal.append("{")
+        elif token == "}}":
+            literal.append("}")
+        else:
+            if literal:
+                parts.append("".join(literal))
+                literal = []
+            name = match.group(1)
+            parts.append((name, BUILTIN_PLACEHOLDERS.get(name)))
+    literal.append(source[position:])
+    tail = "".join(literal)
+    if tail:
+        parts.append(tail)
+
+    if not any(isinstance(part, tuple) for part in parts):
+        constant = "".join(parts)
+        return lambda variables=None: constant
+
+    parts = tuple(parts)
+
+    def render(variables=None):
+        variables = variables or {}
+        output = []
+        for part in parts:
+            if part.__class__ is str:
+                output.append(part)
+                continue
+            name, builtin = part
+            value = variables.get(name)
+            if value is None:
+                value = builtin() if builtin is not None else "{" + name + "}"
+            output.append(str(value))
+        return "".join(output)
+
+    return render
+
+
+class TemplateStore:
+    """
+    이메일 템플릿 저장소 클래스
+    템플릿은 설정 파일의 email_templates에 저장되며,
+    컴파일된 렌더링 함수는 템플릿이 수정될 때까지 캐시됨
+    """
+
+    def __init__(self, templates=None, variables=None):
+        """
+        초기화 함수
+
+        Args:
+            templates: [{"id", "title", "body"}] 리스트 (None이면 설정 파일에서 로드)
+            variables: 사용자 변수 딕셔너리 (None이면 설정 파일에서 로드)
+        """
+        self._lock = threading.Lock()
+        if templates is None or variables is None:
+            config = load_config()
+            if templates is None:
+                templates = config.get("email_templates", [])
+            if variables is None:
+                variables = config.get("template_variables", {})
+        self.variables = dict(variables) if isinstance(variables, dict) else {}
+        self._templates = {}  # 템플릿 ID -> {"id", "title", "body", "version"}
+        self._order = []      # 표시 순서
+        self._compiled = {}   # 템플릿 ID -> (버전, 렌더링 함수)
+        for template in templates if isinstance(templates, list) else []:
+            if isinstance(template, dict) and isinstance(template.get("body"), str):
+                template_id = str(template.get("id") or self._new_id())
+                self._templates[template_id] = {
+                    "id": template_id,
+                    "title": str(template.get("title") or "템플릿"),
+                    "body": template["body"],
+                    "version": 0,
+                }
+                self._order.append(template_id)
+
+    def _new_id(self):
+        """새 템플릿 ID 생성"""
+        template_id = f"t{int(time.time() * 1000):x}"
+        while template_id in self._templates:
+            template_id += "_"
+        return template_id
+
+    def list_templates(self):
+        """템플릿 ID 리스트 반환 (표시 순서)"""
+        return list(self._order)
+
+    def get(self, template_id):
+        """템플릿 딕셔너리 반환 (없으면 None)"""
+        return self._templates.get(template_id)
+
+    def get_body(self, template_id):
+        """템플릿 본문 반환 (검색용, 없으면 None)"""
+        template = self._templates.get(template_id)
+        return template["body"] if template else None
+
+    def get_renderer(self, template_id):
+        """
+        컴파일된 렌더링 함수 반환 (수정된 템플릿만 다시 컴파일)
+
+        Returns:
+            render(variables) 함수 또는 없는 템플릿이면 None
+        """
+        template = self._templates.get(template_id)
+        if template is None:
+            return None
+        cached = self._compiled.get(template_id)
+        if cached is not None and cached[0] == template["version"]:
+            return cached[1]
+        with self._lock:
+            renderer = compile_template(template["body"])
+            self._compiled[template_id] = (template["version"], renderer)
+        return renderer
+
+    def render(self, template_id):
+        """
+        템플릿을 현재 변수 값으로 렌더링
+
+        Returns:
+            완성된 텍스트 또는 없는 템플릿이면 None
+        """
+        renderer = self.get_renderer(template_id)
+        return renderer(self.variables) if renderer is not None else None
+
+    def save_template(self, template_id, title, body):
+        """
+        템플릿 추가 또는 수정 후 설정 파일에 저장
+
+        Args:
+            template_id: 수정할 템플릿 ID (None이면 새 템플릿)
+            title: 제목
+            body: 본문
+
+        Returns:
+            템플릿 ID
+        """
+        with self._lock:
+            if template_id is None or template_id not in self._templates:
+                template_id = self._new_id()
+                self._templates[template_id] = {"id": template_id, "version": 0}
+                self._order.append(template_id)
+            template = self._templates[template_id]
+            template["title"] = title or "템플릿"
+            template["body"] = body
+            template["version"] += 1  # 캐시된 렌더링 함수 무효화
+        self.save()
+        return template_id
+
+    def delete_template(self, template_id):
+        """템플릿 삭제 후 설정 파일에 저장"""
+        with self._lock:
+            if self._templates.pop(template_id, None) is None:
+                return
+            self._order.remove(template_id)
+            self._compiled.pop(template_id, None)
+        self.save()
+
+    def set_variables(self, variables):
+        """사용자 변수 변경 후 설정 파일에 저장 (템플릿을 다시 컴파일할 필요 없음)"""
+        self.variables = dict(variables)
+        self.save()
+
+    def save(self):
+        """템플릿과 사용자 변수를 설정 파일에 저장"""
+        config_data = load_config()
+        config_data["email_templates"] = [
+            {"id": t["id"], "title": t["title"], "body": t["body"]}
+            for t in (self._templates[template_id] for template_id in self._order)
+        ]
+        config_data["template_variables"] = dict(self.variables)
+        save_config(config_data)
@@ -0,0 +1,34 @@
+import pytest
+
+pytest.importorskip("PyQt6.QtCore")
+pytest.importorskip("pyperclip")
+
+from clipboard_monitor import ClipboardMonitorThread
+from config_manager import MAX_HISTORY_ITEMS
+
+
+@pytest.fixture
+def monitor(monkeypatch):
+    monkeypatch.setattr(ClipboardMonitorThread, "_save_history", staticmethod(lambda: None))
+    monkeypatch.setattr(ClipboardMonitorThread, "history_listeners", [])
+    history = [f"local {index}" for index in range(MAX_HISTORY_ITEMS)]
+    thread = ClipboardMonitorThread(history, [1000.0 + index for index in range(MAX_HISTORY_ITEMS)])
+    rejected = []
+    thread.on_remote_rejected = lambda text, timestamp: rejected.append((text, timestamp))
+    return thread, rejected
+
+
+def test_remote_item_older_than_full_history_is_reported_as_rejected(monitor):
+    thread, rejected = monitor
+    added = thread._ingest_remote_batch([("too old", 10.0, False), ("local 3", 500.0, False)])
+    assert added == 0
+    assert rejected == [("too old", 10.0)]  # 이미 있는 항목은 버려진 것이 아님
+    assert "too old" not in ClipboardMonitorThread.clipboard_history
+
+
+def test_remote_item_within_history_is_inserted_in_time_order(monitor):
+    thread, rejected = monitor
+    assert thread._ingest_remote_batch([("remote", 1010.5, False)]) == 1
+    history = ClipboardMonitorThread.clipboard_history
+    assert len(history) == MAX_HISTORY_ITEMS and rejected == []
+    assert history.index("remote") == history.index("local 10") + 1
@@ -0,0 +1,94 @@
+import enum
+import os
+import sys
+
+import pytest
+
+# 디스플레이가 없는 리눅스에서는 xorg 백엔드를 불러올 수 없으므로 dummy 백엔드 사용
+if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+    os.environ.setdefault("PYNPUT_BACKEND", "dummy")
+
+pytest.importorskip("pynput")
+
+from pynput.keyboard import Key, KeyCode
+
+from config_manager import DEFAULT_BINDINGS, HOTKEY_ACTIONS
+from hotkey_matcher import HotkeyMatcher, build_bindings
+
+SEQUENCE = {"sequence": [{"modifiers": ["ctrl_l", "shift_l"], "key": "v"}, {"key": "3"}],
+            "action": "paste_recent", "arg": 3}
+
+# dummy 백엔드는 Key 멤버 값이 모두 같으므로 서로 다른 값의 대체 열거형 사용
+if len(Key) != len(Key.__members__):
+    Key = enum.Enum("Key", {name: KeyCode.from_vk(0x10000 + index) for index, name in enumerate(Key.__members__)})
+
+
+class _ManualTimer:
+    """연속 단축키 대기 타이머 대신 사용 (시간이 지나지 않음)"""
+
+    def __init__(self, interval, function, args=()):
+        self.daemon = False
+
+    def start(self):
+        pass
+
+    def cancel(self):
+        pass
+
+
+def _press_sequence(binding_configs):
+    matcher = HotkeyMatcher(build_bindings(None, binding_configs, HOTKEY_ACTIONS), key_enum=Key,
+                            timer_factory=_ManualTimer)
+    matcher.on_press(Key.ctrl_l)
+    matcher.on_press(Key.shift_l)
+    matcher.on_press(KeyCode.from_char("V"))
+    matcher.on_release(Key.shift_l)
+    matcher.on_release(Key.ctrl_l)
+    return matcher.on_press(KeyCode.from_char("3"))
+
+
+def test_unmodified_final_step_is_erased_by_default():
+    binding = _press_sequence([SEQUENCE])
+    assert binding is not None and binding.action == "paste_recent"
+    assert binding.backspace
+
+
+def test_explicit_backspace_setting_is_kept():
+    binding = _press_sequence([dict(SEQUENCE, backspace=False)])
+    assert binding is not None and not binding.backspace
+
+
+def test_modified_final_step_is_not_erased():
+    config = {"sequence": [{"modifiers": ["ctrl_l"], "key": "k"}, {"modifiers": ["ctrl_l"], "key": "c"}],
+              "action": "open_settings"}
+    single = {"modifiers": ["ctrl_l", "alt_l"], "key": "s", "action": "open_settings"}
+    bindings = build_bindings(None, [config, single], HOTKEY_ACTIONS)
+    assert [binding.backspace for binding in bindings] == [False, False]
+
+
+def test_default_quick_paste_bindings_are_disabled():
+    assert build_bindings(None, DEFAULT_BINDINGS, HOTKEY_ACTIONS) == []
+    enabled = [dict(config, enabled=True) for config in DEFAULT_BINDINGS]
+    assert len(build_bindings(None, enabled, HOTKEY_ACTIONS)) == len(DEFAULT_BINDINGS)
+
+
+def test_sequence_sharing_the_popup_hotkey_is_rejected():
+    popup = {"modifiers": ["ctrl_l", "shift_l"], "key": "v"}
+    other = {"sequence": [{"modifiers": ["ctrl_l", "alt_l"], "key": "v"}, {"key": "3"}], "action": "paste_recent"}
+    bindings = build_bindings(popup, [SEQUENCE, other], HOTKEY_ACTIONS)
+    assert [binding.action for binding in bindings] == ["open_popup", "paste_recent"]
+    assert bindings[1].config is other
+
+
+def test_bound_on_press_follows_sequence_state():
+    matcher = HotkeyMatcher(build_bindings(None, [SEQUENCE], HOTKEY_ACTIONS), key_enum=Key,
+                            timer_factory=_ManualTimer)
+    on_press = matcher.on_press  # 벤치마크처럼 메서드를 한 번만 조회해도 진행 상태가 반영됨
+    for key in (Key.ctrl_l, Key.shift_l, KeyCode.from_char("V")):
+        assert on_press(key) is None
+    assert matcher.sequence_pending
+    matcher.on_release(Key.shift_l)
+    matcher.on_release(Key.ctrl_l)
+    binding = on_press(KeyCode.from_char("3"))
+    assert binding is not None and binding.action == "paste_recent"
+    assert not matcher.sequence_pending and "on_press" not in vars(matcher)
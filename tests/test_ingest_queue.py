@@ -0,0 +1,73 @@
+from ingest_queue import IngestQueue
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _queue(**kwargs):
+    clock = _Clock()
+    return IngestQueue(clock=clock, **kwargs), clock
+
+
+def test_changes_within_settle_time_are_coalesced_to_the_latest():
+    queue, clock = _queue(settle_sec=0.15, max_wait_sec=1.0)
+    for index in range(5):
+        queue.offer(f"step {index}", clock.now)
+        clock.now += 0.05
+    assert queue.drain() == []  # 아직 연속 변경 중
+    assert queue.next_delay() > 0
+
+    clock.now += 0.15
+    assert [text for text, _ in queue.drain()] == ["step 4"]
+    assert queue.stats()["coalesced"] == 4
+
+
+def test_continuous_changes_are_released_after_max_wait():
+    queue, clock = _queue(settle_sec=0.15, max_wait_sec=1.0)
+    released = []
+    for index in range(30):
+        queue.offer(f"step {index}", clock.now)
+        released += [text for text, _ in queue.drain()]
+        clock.now += 0.125
+    # 변경이 멈추지 않아도 max_wait_sec마다 그 시점의 최근 항목이 기록됨
+    assert released == ["step 8", "step 17", "step 26"]
+
+
+def test_separate_changes_are_all_kept():
+    queue, clock = _queue(settle_sec=0.15)
+    for text in ("a", "b", "c"):
+        queue.offer(text, clock.now)
+        clock.now += 0.5
+    assert [text for text, _ in queue.drain()] == ["a", "b", "c"]
+
+
+def test_token_bucket_limits_rate_and_keeps_the_latest():
+    queue, clock = _queue(max_per_sec=2.0, burst=3, settle_sec=0.0)
+    for index in range(10):
+        queue.offer(f"item {index}", clock.now)
+    assert [text for text, _ in queue.drain()] == ["item 9"]  # 허용량(3)을 넘어 최근 항목만 남김
+
+    for index in range(3):
+        queue.offer(f"next {index}", clock.now)
+    assert [text for text, _ in queue.drain()] == ["next 2"]  # 남은 토큰 2개보다 많아 최근 항목만 기록
+
+    queue.offer("later", clock.now)
+    assert [text for text, _ in queue.drain()] == ["later"]
+    queue.offer("again", clock.now)
+    assert queue.drain() == []  # 토큰을 모두 사용함
+    assert queue.next_delay() == 0.5
+    clock.now += 0.5
+    assert [text for text, _ in queue.drain()] == ["again"]
+
+
+def test_full_queue_drops_oldest():
+    queue, clock = _queue(max_size=2, max_per_sec=0, settle_sec=0.0)
+    for text in ("a", "b", "c"):
+        queue.offer(text, clock.now)
+    assert [text for text, _ in queue.drain()] == ["b", "c"]
+    assert queue.stats()["dropped"] == 1
@@ -0,0 +1,78 @@
+import socket
+import urllib.request
+
+import pytest
+
+from metrics import MetricsRegistry
+from metrics_exporter import PROMETHEUS_CONTENT_TYPE, MetricsExporter
+
+
+def _parse(text):
+    """Prometheus 텍스트 형식의 표본 줄 -> 값"""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, _, value = line.rpartition(" ")
+            samples[name] = float(value)
+    return samples
+
+
+def test_counter_with_labels_renders_escaped_sorted_samples():
+    registry = MetricsRegistry()
+    counter = registry.counter("test_failures_total", "Failures by method", ("method",))
+    counter.inc(method="SendInput")
+    counter.inc(2, method='quote"back\\slash\nnewline')
+    text = registry.render()
+    assert text.startswith("# HELP test_failures_total Failures by method\n# TYPE test_failures_total counter\n")
+    assert 'test_failures_total{method="SendInput"} 1\n' in text
+    assert 'test_failures_total{method="quote\\"back\\\\slash\\nnewline"} 2\n' in text
+    assert text.endswith("\n")
+
+
+def test_gauge_function_and_summary_quantiles():
+    registry = MetricsRegistry()
+    registry.gauge("test_history_items", "History size", lambda: 42)
+    summary = registry.summary("test_save_seconds", "Save time")
+    for _ in range(100):
+        summary.observe(0.002)
+    samples = _parse(registry.render())
+    assert samples["test_history_items"] == 42
+    assert samples["test_save_seconds_count"] == 100
+    assert samples["test_save_seconds_sum"] == pytest.approx(0.2)
+    for quantile in ("0.5", "0.95", "0.99"):
+        assert samples[f'test_save_seconds{{quantile="{quantile}"}}'] == pytest.approx(0.002, rel=0.25)
+
+
+def test_metrics_are_sorted_and_reregistration_returns_same_metric():
+    registry = MetricsRegistry()
+    second = registry.counter("test_b_total", "B")
+    registry.counter("test_a_total", "A")
+    assert registry.counter("test_b_total", "B") is second
+    with pytest.raises(ValueError):
+        registry.gauge("test_b_total", "B")
+    names = [line.split()[2] for line in registry.render().splitlines() if line.startswith("# TYPE")]
+    assert names == ["test_a_total", "test_b_total"]
+
+
+def test_failing_gauge_does_not_break_the_rest():
+    registry = MetricsRegistry()
+    registry.gauge("test_broken", "Broken", lambda: 1 / 0)
+    registry.counter("test_ok_total", "Ok").inc()
+    text = registry.render()
+    assert "# test_broken:" in text and "test_ok_total 1\n" in text
+
+
+def test_http_exporter_serves_text_format():
+    registry = MetricsRegistry()
+    registry.counter("test_requests_total", "Requests").inc(3)
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    exporter = MetricsExporter(registry, port=port)
+    try:
+        address, = exporter.start()
+        with urllib.request.urlopen(address, timeout=5) as response:
+            assert response.headers["Content-Type"] == PROMETHEUS_CONTENT_TYPE
+            assert _parse(response.read().decode("utf-8"))["test_requests_total"] == 3
+    finally:
+        exporter.stop()
@@ -0,0 +1,67 @@
+import os
+
+import pytest
+
+pytest.importorskip("PyQt6.QtCore")
+pytest.importorskip("pyperclip")
+
+import notes_store
+from notes_store import NotesStore, apply_patch, compute_patch
+
+
+@pytest.mark.parametrize("old, new", [
+    ("", "hello"), ("hello", ""), ("hello world", "hello brave world"), ("abcabc", "abc"), ("같은 글", "같은 글자"),
+])
+def test_patch_round_trip(old, new):
+    patch = compute_patch(old, new)
+    assert apply_patch(old, *patch) == new
+    assert compute_patch(new, new) is None
+
+
+def test_body_is_rebuilt_from_base_and_journal(tmp_path):
+    store = NotesStore(str(tmp_path))
+    note_id = store.create_note("first line\n")
+    for body in ("first line\nsecond\n", "First line\nsecond\n", "First line\nsecond\nthird"):
+        assert store.update_note(note_id, body)
+    assert not store.update_note(note_id, "First line\nsecond\nthird")  # 변경 없음
+    store.save_index()
+
+    with open(os.path.join(str(tmp_path), f"{note_id}.0.txt"), encoding="utf-8") as f:
+        assert f.read() == "first line\n"  # 본문 파일은 그대로이고 변경은 패치 기록에만 덧붙음
+    reopened = NotesStore(str(tmp_path))
+    assert reopened.get_body(note_id) == "First line\nsecond\nthird"
+    assert reopened.get_meta(note_id)["title"] == "First line"
+
+
+def test_truncated_last_journal_line_is_ignored(tmp_path):
+    store = NotesStore(str(tmp_path))
+    note_id = store.create_note("abc")
+    store.update_note(note_id, "abcd")
+    store.save_index()
+    with open(os.path.join(str(tmp_path), f"{note_id}.0.log"), "a", encoding="utf-8") as f:
+        f.write('[4, 0, "e')  # 저장 도중 종료
+    assert NotesStore(str(tmp_path)).get_body(note_id) == "abcd"
+
+
+def test_compaction_writes_new_generation_and_removes_old_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(notes_store, "NOTES_COMPACT_PATCHES", 3)
+    store = NotesStore(str(tmp_path))
+    note_id = store.create_note("v0")
+    for version in range(1, 5):
+        store.update_note(note_id, f"v{version}")
+    store.save_index()
+
+    meta = store.get_meta(note_id)
+    assert (meta["gen"], meta["patches"]) == (1, 1)
+    assert sorted(os.listdir(str(tmp_path))) == sorted(["index.json", f"{note_id}.1.txt", f"{note_id}.1.log"])
+    reopened = NotesStore(str(tmp_path))
+    assert reopened.get_body(note_id) == "v4"
+
+
+def test_delete_removes_files(tmp_path):
+    store = NotesStore(str(tmp_path))
+    note_id = store.create_note("bye")
+    store.update_note(note_id, "bye!")
+    store.delete_note(note_id)
+    assert os.listdir(str(tmp_path)) == ["index.json"]
+    assert NotesStore(str(tmp_path)).list_notes() == []
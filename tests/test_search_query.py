@@ -0,0 +1,54 @@
+import time
+
+from search_query import QUERY_TIME_BUDGET_SEC, parse_query
+
+
+def _match_time(query, text):
+    plan = parse_query(query)
+    start = time.perf_counter()
+    plan.match_text(text, text.lower())
+    return plan, time.perf_counter() - start
+
+
+def test_nested_quantifier_falls_back_to_plain_term():
+    plan, elapsed = _match_time("/(a+)+$/", "a" * 100_000 + "!")
+    assert not plan.regexes
+    assert plan.terms == ["/(a+)+$/"]
+    assert elapsed < QUERY_TIME_BUDGET_SEC
+
+
+def test_backreference_falls_back_to_plain_term():
+    plan = parse_query(r"/(\w+)\1/")
+    assert not plan.regexes
+
+
+def test_other_unsafe_patterns_fall_back_to_plain_term():
+    for query in ["/(\\w+\\s?)+$/", "/(a|ab)*c/", "/(a{1,3})+/", "/(?P<x>a)(?P=x)/", "/a*a*a*a*a*b/"]:
+        assert not parse_query(query).regexes, query
+
+
+def test_regex_matches_past_former_scan_limits():
+    for query, text in [
+        (r"/foo\d+/", "x" * 5000 + " foo123"),
+        (r"/[a-z]+@[a-z]+\.com/", "x " * 60_000 + "me@example.com"),
+        (r"/https?:\S+/", "." * 150_000 + " https://example.com"),
+    ]:
+        plan, elapsed = _match_time(query, text)
+        assert plan.regexes, query
+        assert plan.match_text(text, text.lower()) is not None, query
+        assert elapsed < QUERY_TIME_BUDGET_SEC, (query, elapsed)
+
+
+def test_exact_count_repeat_is_not_treated_as_unbounded():
+    for query in ["/a{5}b/", "/(ab){5}/", "/(a{5})+/", r"/\d{3}-\d{4}/"]:
+        assert parse_query(query).regexes, query
+    plan = parse_query("/(a{5})+!/")
+    text = "a" * 100_000 + "!"
+    assert plan.match_text(text, text) is not None
+
+
+def test_safe_regex_still_matches():
+    plan = parse_query(r"/https?:\S+/")
+    assert plan.regexes
+    assert plan.match_text("see https://example.com", "see https://example.com") == 0
+    assert plan.match_text("no link here", "no link here") is None
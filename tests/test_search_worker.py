@@ -0,0 +1,47 @@
+import pytest
+
+pytest.importorskip("PyQt6.QtCore")
+pytest.importorskip("pyperclip")
+
+import search_worker
+from search_query import parse_query
+from search_worker import SearchCancelToken, SearchWorkerThread
+
+
+def _run(query, items, meta_lookup=None):
+    worker = SearchWorkerThread()
+    chunks, finished = [], []
+    worker.results_chunk_ready.connect(lambda query_id, chunk, is_first: chunks.append(list(chunk)))
+    worker.search_finished.connect(lambda query_id, total, truncated: finished.append((total, truncated)))
+    worker._run_query(1, parse_query(query), items, meta_lookup or {}, SearchCancelToken())
+    return chunks, finished
+
+
+def test_regex_finds_match_deep_in_long_item():
+    chunks, finished = _run(r"/foo\d+/", ["x" * 200_000 + " foo123"])
+    assert chunks == [["x" * 200_000 + " foo123"]]
+    assert finished == [(1, False)]
+
+
+def test_time_budget_marks_query_truncated(monkeypatch):
+    monkeypatch.setattr(search_worker, "QUERY_TIME_BUDGET_SEC", -1.0)
+    items = [f"item {index}" for index in range(5000)]
+    chunks, finished = _run("item", items)
+    total, truncated = finished[0]
+    assert truncated
+    assert total == sum(len(chunk) for chunk in chunks) < len(items)
+
+
+def test_later_chunk_with_better_rank_is_merged_into_final_list():
+    newer = [f"item{index}foo" for index in range(40)]  # 부분 일치 (순위 2)
+    items = ["foo first"] + newer                        # 가장 오래된 항목이 앞부분 일치 (순위 0)
+    chunks, finished = _run("foo", items)
+    assert len(chunks) == 3
+    assert chunks[-1] == ["foo first"] + newer[::-1]
+    assert finished == [(41, False)]
+
+
+def test_chunks_already_in_rank_order_are_not_sent_again():
+    items = [f"item{index}foo" for index in range(40)]
+    chunks, _ = _run("foo", items)
+    assert [len(chunk) for chunk in chunks] == [30, 10]
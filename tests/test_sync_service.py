@@ -0,0 +1,149 @@
+import time
+
+import pytest
+
+pytest.importorskip("pyperclip")
+
+import sync_service
+from clipboard_monitor import clip_digest
+from sync_service import SyncService
+from sync_transfer import SYNC_CHUNK_SIZE, OutgoingClip, OutgoingTransfer
+
+SECRET = "test-secret"
+
+
+def _wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+@pytest.fixture
+def start_service():
+    services = []
+
+    def start(peers=(), secret=SECRET, received=None):
+        """127.0.0.1의 임의 포트로 서비스를 시작하고, 받은 항목을 received에 기록"""
+        def on_remote_clip(text, timestamp, origin, live):
+            if received is not None:
+                received.append(text)
+        service = SyncService(0, [f"127.0.0.1:{peer.port}" for peer in peers], "127.0.0.1", secret,
+                              f"node{len(services)}", on_remote_clip)
+        services.append(service)
+        service.start()
+        return service
+
+    yield start
+    for service in services:
+        service.stop()
+
+
+def test_clip_reaches_every_peer_exactly_once(start_service):
+    received = [[], [], []]
+    services = []
+    for index in range(3):
+        services.append(start_service(peers=services, received=received[index]))
+    assert _wait_until(lambda: [len(service.peers) for service in services] == [2, 2, 2])
+
+    services[0].publish("from node 0")
+    services[2].publish("from node 2")
+    assert _wait_until(lambda: sum(map(len, received)) == 4)
+    time.sleep(0.3)  # 다시 전송되는 항목이 있다면 도착할 시간
+
+    assert received[0] == ["from node 2"]
+    assert received[1] in (["from node 0", "from node 2"], ["from node 2", "from node 0"])
+    assert received[2] == ["from node 0"]
+
+
+def test_wrong_secret_is_rejected(start_service):
+    received = []
+    service = start_service(received=received)
+    intruder = start_service(peers=[service], secret="wrong-secret")
+    time.sleep(0.5)
+    assert not service.peers and not intruder.peers
+
+    intruder.publish("should not arrive")
+    time.sleep(0.2)
+    assert received == []
+
+
+def _reconcile(initiator, other):
+    """재연결 동기화 교환을 연결 없이 실행 (initiator가 보낼 항목 ID, 받을 ID 앞부분)"""
+    buckets = other.summary.diff_top(initiator.summary.pack_top())
+    if not buckets:
+        return [], []
+    leaves = initiator.summary.diff_leaves(other.summary.pack_leaves(buckets))
+    return initiator.summary.compare_ids(other.summary.pack_ids(leaves))
+
+
+def test_rejected_remote_item_is_not_resent_on_reconnect():
+    sender = SyncService(secret=SECRET)
+    receiver = SyncService(secret=SECRET)
+    sender.load_history([("old item", 10.0), ("shared", 2000.0)])
+    receiver.load_history([("shared", 2000.0)] + [(f"recent {index}", 1000.0 + index) for index in range(5)])
+    send, _ = _reconcile(sender, receiver)
+    assert send == [clip_digest("old item")]
+
+    # 받는 쪽 히스토리가 가득 차 넣지 못한 항목은 요약에 남아 다음 재연결 때 다시 오지 않음
+    receiver.reject("old item", 10.0)
+    send, want = _reconcile(sender, receiver)
+    assert send == [] and len(want) == 5
+    send, want = _reconcile(receiver, sender)
+    assert set(send) == {clip_digest(f"recent {index}") for index in range(5)} and want == []
+
+
+def test_rejected_items_are_bounded(monkeypatch):
+    monkeypatch.setattr(sync_service, "SYNC_REJECTED_CACHE_SIZE", 2)
+    service = SyncService(secret=SECRET)
+    for index in range(3):
+        service.reject(f"old {index}", float(index))
+    assert len(service.summary) == 2 and clip_digest("old 0") not in service.summary.items
+
+    service.track("old 1", 1.0)  # 나중에 히스토리에 들어온 항목은 버린 목록에서 빠짐
+    assert clip_digest("old 1") not in service._rejected and len(service.summary) == 2
+
+
+def _hold_transfer(service, node_id, clip_id, size, live=True):
+    clip = OutgoingClip(clip_id, "x" * size, 1.0, service.node_id, live)
+    service._outgoing.setdefault(node_id, {})[clip_id] = OutgoingTransfer(clip)
+
+
+def test_detached_transfers_expire_after_ttl(monkeypatch):
+    service = SyncService(secret=SECRET)
+    _hold_transfer(service, "gone", "aa" * 16, SYNC_CHUNK_SIZE * 2)
+    service._detach("gone", ("10.0.0.2", 48650))
+    service._expire_outgoing()
+    assert "gone" in service._outgoing
+
+    monkeypatch.setattr(sync_service, "SYNC_TRANSFER_TTL_SEC", 0.0)
+    service._expire_outgoing()
+    assert "gone" not in service._outgoing and not service._detached
+
+
+def test_restarted_node_replaces_transfers_held_for_its_address():
+    service = SyncService(secret=SECRET)
+    _hold_transfer(service, "old", "aa" * 16, SYNC_CHUNK_SIZE * 2)
+    _hold_transfer(service, "other", "bb" * 16, SYNC_CHUNK_SIZE * 2)
+    service._detach("old", ("10.0.0.2", 48650))
+    service._detach("other", ("10.0.0.3", 48650))
+    service._drop_replaced_nodes("new", ("10.0.0.2", 48650))
+    assert set(service._outgoing) == {"other"}
+
+
+def test_held_transfer_bytes_are_capped(monkeypatch):
+    monkeypatch.setattr(sync_service, "SYNC_OUTGOING_MAX_BYTES", SYNC_CHUNK_SIZE * 5)
+    service = SyncService(secret=SECRET)
+    _hold_transfer(service, "connected", "aa" * 16, SYNC_CHUNK_SIZE * 2)
+    _hold_transfer(service, "connected", "bb" * 16, SYNC_CHUNK_SIZE * 2, live=False)
+    _hold_transfer(service, "gone", "cc" * 16, SYNC_CHUNK_SIZE * 2)
+    service._detached["gone"] = (time.monotonic(), None)
+    service._trim_outgoing()
+    # 끊긴 노드의 전송부터 버리므로 연결된 노드의 전송은 모두 남음
+    assert set(service._outgoing) == {"connected"} and not service._detached
+
+    _hold_transfer(service, "connected", "dd" * 16, SYNC_CHUNK_SIZE * 2)
+    service._trim_outgoing()
+    assert set(service._outgoing["connected"]) == {"aa" * 16, "dd" * 16}
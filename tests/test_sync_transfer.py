@@ -0,0 +1,93 @@
+import collections
+import random
+
+from sync_transfer import (
+    CHUNK_FLAG_ZLIB, SYNC_CHUNK_SIZE, SYNC_CHUNK_WINDOW, ChunkStore, IncomingTransfer, OutgoingClip,
+    OutgoingTransfer, PeerScheduler, chunk_id, pack_chunk, unpack_chunk,
+)
+
+CLIP_ID = "0123456789abcdef0123456789abcdef"
+
+
+def _random_text(length, seed=0):
+    rng = random.Random(seed)
+    return "".join(rng.choice("abcdefghijklmnopqrstuvwxyz가나다라마바사") for _ in range(length))
+
+
+def test_clip_is_split_into_chunks_and_reassembled():
+    text = _random_text(SYNC_CHUNK_SIZE)  # 한글이 섞여 UTF-8로 여러 조각이 됨
+    clip = OutgoingClip(CLIP_ID, text, 1.0, "node", True)
+    assert clip.size == len(text.encode("utf-8"))
+    assert len(clip.chunks) == -(-clip.size // SYNC_CHUNK_SIZE) > 1
+    assert all(len(chunk) == SYNC_CHUNK_SIZE for chunk in clip.chunks[:-1])
+
+    incoming = IncomingTransfer(clip.manifest())
+    for index in reversed(range(len(clip.chunks))):
+        body, raw_size = clip.packed_chunk(index)
+        clip_id, received_index, data = unpack_chunk(body)
+        assert (clip_id, received_index, raw_size) == (CLIP_ID, index, len(data))
+        assert chunk_id(data) == incoming.chunk_ids[index]
+        incoming.received[index] = data
+    assert incoming.complete()
+    assert incoming.assemble() == text
+
+
+def test_only_compressible_chunks_are_compressed():
+    clip = OutgoingClip(CLIP_ID, "a" * (SYNC_CHUNK_SIZE + 10), 1.0, "node", True)
+    body, raw_size = clip.packed_chunk(0)
+    assert body[20] & CHUNK_FLAG_ZLIB and len(body) < raw_size
+    assert unpack_chunk(body)[2] == clip.chunks[0]
+
+    noise = random.Random(1).randbytes(1000)
+    body, _ = pack_chunk(CLIP_ID, 3, noise)
+    assert not body[20] & CHUNK_FLAG_ZLIB
+    assert unpack_chunk(body) == (CLIP_ID, 3, noise)
+
+
+def test_resumed_transfer_requests_only_missing_chunks():
+    clip = OutgoingClip(CLIP_ID, _random_text(SYNC_CHUNK_SIZE * 2, seed=2), 1.0, "node", True)
+    store = ChunkStore()
+    for index in (0, 2):
+        data = unpack_chunk(clip.packed_chunk(index)[0])[2]
+        store.put(chunk_id(data), data)
+
+    # 연결이 끊긴 뒤 목록을 다시 받으면 보관소에 있는 조각은 다시 요청하지 않음
+    incoming = IncomingTransfer(clip.manifest())
+    for index, key in enumerate(incoming.chunk_ids):
+        data = store.get(key)
+        if data is not None:
+            incoming.received[index] = data
+    missing = incoming.missing()
+    assert missing == [index for index in range(len(clip.chunks)) if index not in (0, 2)]
+
+    scheduler = PeerScheduler(control_limit=8)
+    transfer = scheduler.transfers[CLIP_ID] = OutgoingTransfer(clip)
+    transfer.needed = collections.deque(missing)
+    sent = []
+    while (picked := scheduler.next_chunk()) is not None:
+        sent.append(picked[1])
+    assert sent == missing[:SYNC_CHUNK_WINDOW]
+    assert transfer.remaining == len(missing)
+
+
+def test_scheduler_sends_live_and_small_clips_first():
+    scheduler = PeerScheduler(control_limit=8)
+    big = OutgoingTransfer(OutgoingClip("aa" * 16, "x" * (SYNC_CHUNK_SIZE * 3), 2.0, "node", True))
+    small = OutgoingTransfer(OutgoingClip("bb" * 16, "y" * (SYNC_CHUNK_SIZE + 1), 1.0, "node", True))
+    old = OutgoingTransfer(OutgoingClip("cc" * 16, "z" * (SYNC_CHUNK_SIZE + 1), 3.0, "node", False))
+    for transfer in (big, small, old):
+        transfer.needed = collections.deque(range(len(transfer.clip.chunks)))
+        scheduler.transfers[transfer.clip.clip_id] = transfer
+    order = [scheduler.next_chunk()[0] for _ in range(7)]
+    assert order == [small, small, big, big, big, old, old]
+
+
+def test_chunk_store_evicts_least_recently_used():
+    store = ChunkStore(capacity=10)
+    store.put("a", b"1234")
+    store.put("b", b"1234")
+    store.get("a")
+    store.put("c", b"1234")
+    assert store.get("b") is None
+    assert store.get("a") == b"1234" and store.get("c") == b"1234"
+    assert store.size == 8
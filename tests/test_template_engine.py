@@ -0,0 +1,52 @@
+import time
+
+import pytest
+
+import template_engine
+from template_engine import TemplateStore, compile_template
+
+
+def test_double_braces_are_literal_braces():
+    render = compile_template("{{name}} = {name}, set {{a, b}}")
+    assert render({"name": "Kim"}) == "{name} = Kim, set {a, b}"
+
+
+def test_unknown_placeholders_are_left_as_is():
+    render = compile_template("Hi {name}, {unknown} and {not valid} {")
+    assert render({"name": "Lee"}) == "Hi Lee, {unknown} and {not valid} {"
+    assert render() == "Hi {name}, {unknown} and {not valid} {"
+
+
+def test_template_without_placeholders_renders_constant():
+    assert compile_template("a {{b}} c")() == "a {b} c"
+
+
+def test_builtin_placeholders_are_evaluated_at_render_time(monkeypatch):
+    monkeypatch.setitem(template_engine.BUILTIN_PLACEHOLDERS, "clipboard", lambda: "copied text")
+    render = compile_template("{date} {clipboard}")
+    assert render() == f"{time.strftime(template_engine.TEMPLATE_DATE_FORMAT)} copied text"
+    assert render({"clipboard": "override"}).endswith(" override")  # 사용자 변수가 우선
+
+
+def test_korean_placeholder_names():
+    assert compile_template("{이름}님 {{이름}}")({"이름": "박"}) == "박님 {이름}"
+
+
+def test_store_recompiles_only_edited_templates(monkeypatch):
+    monkeypatch.setattr(TemplateStore, "save", lambda self: None)
+    store = TemplateStore([{"id": "t1", "title": "A", "body": "Hi {name}"}], {"name": "Choi"})
+    renderer = store.get_renderer("t1")
+    assert store.get_renderer("t1") is renderer
+    assert store.render("t1") == "Hi Choi"
+
+    store.save_template("t1", "A", "Bye {name} {{x}}")
+    assert store.get_renderer("t1") is not renderer
+    assert store.render("t1") == "Bye Choi {x}"
+    assert store.render("missing") is None
+
+
+@pytest.mark.parametrize("source, expected", [
+    ("{", "{"), ("}", "}"), ("{{{name}}}", "{x}"), ("}}{{", "}{"), ("{{name}", "{name}"),
+])
+def test_unbalanced_braces_are_kept(source, expected):
+    assert compile_template(source)({"name": "x"}) == expected
@@ -0,0 +1,56 @@
+import pytest
+
+from usage_ranker import USAGE_HALF_LIFE_SEC, UsageRanker
+
+LANDMARK = 1_000_000.0
+
+
+def test_count_halves_every_half_life():
+    ranker = UsageRanker(LANDMARK)
+    ranker.record("a", LANDMARK)
+    ranker.record("a", LANDMARK)
+    assert ranker.count("a", LANDMARK) == pytest.approx(2.0)
+    assert ranker.count("a", LANDMARK + USAGE_HALF_LIFE_SEC) == pytest.approx(1.0)
+    assert ranker.count("missing", LANDMARK) == 0.0
+
+
+def test_recent_use_outranks_older_uses():
+    ranker = UsageRanker(LANDMARK)
+    for _ in range(3):
+        ranker.record("old favourite", LANDMARK)
+    # 반감기 두 번이 지나면 예전 3회는 0.75회에 해당하므로 최근 1회가 앞섬
+    ranker.record("recent", LANDMARK + 2 * USAGE_HALF_LIFE_SEC)
+    assert ranker.top_n() == ["recent", "old favourite"]
+
+    ranker.record("old favourite", LANDMARK + 2 * USAGE_HALF_LIFE_SEC)
+    assert ranker.top_n() == ["old favourite", "recent"]
+
+
+def test_order_does_not_change_as_time_passes():
+    ranker = UsageRanker(LANDMARK)
+    for index, text in enumerate(["c", "b", "a"]):
+        for _ in range(index + 1):
+            ranker.record(text, LANDMARK + index * 3600)
+    assert ranker.top_n() == ["a", "b", "c"]
+    counts = [ranker.count(text, LANDMARK + 10 * USAGE_HALF_LIFE_SEC) for text in ranker.top_n()]
+    assert counts == sorted(counts, reverse=True)
+
+
+def test_forget_and_limit():
+    ranker = UsageRanker(LANDMARK)
+    for index in range(5):
+        for _ in range(index + 1):
+            ranker.record(f"item {index}", LANDMARK)
+    ranker.forget("item 4")
+    assert ranker.top_n(2) == ["item 3", "item 2"]
+    assert ranker.top_n() == ["item 3", "item 2", "item 1", "item 0"]
+
+
+def test_round_trip_through_config_keeps_order_and_drops_unknown_items():
+    ranker = UsageRanker(LANDMARK)
+    ranker.record("a", LANDMARK)
+    ranker.record("b", LANDMARK + USAGE_HALF_LIFE_SEC)
+    restored = UsageRanker.from_dict(ranker.to_dict(), valid_items={"a", "b"})
+    assert restored.top_n() == ["b", "a"]
+    assert UsageRanker.from_dict(ranker.to_dict(), valid_items={"a"}).top_n() == ["a"]
+    assert UsageRanker.from_dict({"scores": "broken"}).top_n() == []
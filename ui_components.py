@@ -1,11 +1,11 @@
 import sys
 import time
-import traceback
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QScrollArea, QFrame, QLineEdit, QApplication, QDialog,
     QSizePolicy, QGraphicsOpacityEffect, QToolButton, QGridLayout,
-    QListWidget, QListWidgetItem, QCheckBox, QComboBox, QMessageBox
+    QListWidget, QListWidgetItem, QCheckBox, QComboBox, QMessageBox,
+    QPlainTextEdit
 )
 from PyQt6.QtGui import (
     QCursor, QPixmap, QPainter, QColor, QFont, QPalette, 
@@ -16,14 +16,33 @@ from PyQt6.QtCore import (
     QEasingCurve, QEvent, pyqtSlot, QSize, QPoint, QMargins
 )
 
-from pynput.keyboard import Key, Controller as KeyboardController
-import pyperclip
 import re
 import webbrowser
 
 from config_manager import CLIP_PREVIEW_MAX_LEN, format_hotkey_for_display
-from clipboard_monitor import ClipboardMonitorThread
+from clipboard_monitor import ClipboardMonitorThread, detect_clip_type
 from hotkey_manager import HotkeyRecordingThread
+from search_worker import SearchWorkerThread
+from notes_store import NotesStore
+from template_engine import TemplateStore
+from latency_tracker import latency_tracker
+from app_logging import get_logger, redact
+from metrics import metrics
+
+log = get_logger(__name__)
+
+POPUP_OPENS = metrics.counter("unipaste_popup_opens_total", "Times the history popup was shown")
+
+# 항목 유형별 표시 이름
+CLIP_TYPE_NAMES = {"link": "링크", "code": "코드", "email": "이메일", "number": "숫자", "text": "텍스트"}
+
+# 단축키 -> 첫 화면 표시까지의 목표 지연 시간 (60Hz 한 프레임)
+POPUP_SHOW_TARGET_MS = 16.0
+
+# 메모장 탭 관련 상수
+NOTES_PAGE_SIZE = 30            # 한 번에 만드는 메모 카드 수
+NOTES_PAGE_PRELOAD_PX = 400     # 스크롤이 끝에서 이만큼 남으면 다음 페이지 로드
+NOTE_AUTOSAVE_DEBOUNCE_MS = 500 # 마지막 입력 후 자동 저장까지 대기 시간
 
 # 공통 색상 및 스타일 상수
 COLOR_PRIMARY = "#0078D7"       # 주요 색상 (파란색, Microsoft 스타일)
@@ -42,6 +61,7 @@ class ClipboardHistoryPopup(QWidget):
     """
     item_selected_signal = pyqtSignal(str) 
     paste_requested_signal = pyqtSignal(str) 
+    popup_hidden = pyqtSignal()  # 창이 실제로 숨겨진 후 발생
 
     def __init__(self):
         """
@@ -60,12 +80,38 @@ class ClipboardHistoryPopup(QWidget):
         # 내부 상태 변수
         self.dark_mode = False  # 기본: 라이트 모드
         self.current_category = 0  # 0: 클립보드 히스토리
-        self.keyboard_controller = KeyboardController()
         self.clipboard_times = {}  # 시간 표시용
         self.current_history_items = []
         self.filtered_items = []
         self.search_text = ""
         
+        # 카드 목록 컨테이너 (검색 결과 청크를 이어 붙이기 위해 보관)
+        self._cards_container = None
+        self._cards_layout = None
+        self._cards_list_item = None
+        self._displayed_count = 0  # 실제로 카드가 만들어진 항목 수 (메모장 탭은 페이지 단위로 생성)
+        
+        # 메모장 저장소 (시작 시에는 목록만 읽고 본문은 필요할 때 읽음)
+        self.notes_store = NotesStore()
+        self._note_editors = {}  # 메모 ID -> 열려 있는 편집 창
+        
+        # 이메일 템플릿 저장소 (렌더링 함수는 템플릿이 수정될 때까지 캐시됨)
+        self.template_store = TemplateStore()
+        self._template_editor = None
+        
+        # 백그라운드 검색 스레드
+        self._active_query_id = 0
+        self.search_worker = SearchWorkerThread(self)
+        self.search_worker.results_chunk_ready.connect(self._on_search_chunk_ready)
+        self.search_worker.search_finished.connect(self._on_search_finished)
+        self.search_worker.start()
+        
+        # 미리 준비(pre-warm) 모드 상태
+        self.prewarm_enabled = False
+        self._content_dirty = True  # 표시된 카드가 최신 히스토리와 다른지 여부
+        self._prewarm_scheduled = False
+        self._show_requested_at = None  # 표시 요청 시각 (첫 프레임 지연 측정용)
+        
         # 애니메이션 설정
         self.opacity_effect = QGraphicsOpacityEffect(self)
         self.setGraphicsEffect(self.opacity_effect)
@@ -74,6 +120,8 @@ class ClipboardHistoryPopup(QWidget):
         self.animation.setEasingCurve(QEasingCurve.Type.OutQuad)
         self.animation.setStartValue(0.0)
         self.animation.setEndValue(1.0)
+        # finished 시그널은 표시/숨김 과정에서 연결이 해제되므로 상태 변경 시그널로 측정
+        self.animation.stateChanged.connect(self._on_animation_state_changed)
         
         # 다크 모드 감지
         self.detect_system_theme()
@@ -231,6 +279,7 @@ class ClipboardHistoryPopup(QWidget):
             }
         """)
         self.items_list.itemClicked.connect(self.on_item_clicked)
+        self.items_list.horizontalScrollBar().valueChanged.connect(self._on_cards_scrolled)
         
         # 비어있을 때 표시할 메시지
         self.empty_message = QLabel("클립보드 항목이 없습니다")
@@ -253,6 +302,11 @@ class ClipboardHistoryPopup(QWidget):
         self.status_label = QLabel("단축키: " + format_hotkey_for_display({"modifiers": ["shift"], "key": "+"}))
         self.status_label.setObjectName("statusLabel")
         
+        # 검색이 시간 예산을 넘겨 일부 항목만 검사했을 때 표시
+        self.search_notice_label = QLabel("검색 시간 초과 - 최근 항목 일부만 검색됨")
+        self.search_notice_label.setObjectName("statusLabel")
+        self.search_notice_label.setVisible(False)
+        
         # 설정 버튼
         self.settings_button = QPushButton("설정")
         self.settings_button.setObjectName("settingsButton")
@@ -261,6 +315,7 @@ class ClipboardHistoryPopup(QWidget):
         
         footer_layout.addWidget(self.status_label)
         footer_layout.addStretch()
+        footer_layout.addWidget(self.search_notice_label)
         footer_layout.addWidget(self.settings_button)
         
         # 레이아웃에 구성 요소 추가
@@ -275,11 +330,11 @@ class ClipboardHistoryPopup(QWidget):
     def _open_url(self, url):
         """주어진 URL을 웹 브라우저에서 엽니다."""
         try:
-            print(f"Opening URL: {url}")
+            log.debug("Opening URL: %s", redact(url))
             webbrowser.open(url)
             self.hide_popup() # 링크를 열면 팝업은 닫히도록
         except Exception as e:
-            print(f"Error opening URL {url}: {e}")
+            log.error("Error opening URL %s: %s", redact(url), e)
 
     def apply_theme(self):
         """현재 테마(다크/라이트 모드)에 맞는 스타일 적용"""
@@ -496,42 +551,111 @@ class ClipboardHistoryPopup(QWidget):
             return
             
         self.current_category = category_idx
-        
-        # 카테고리 버튼 상태 업데이트
-        for i, btn in enumerate(self.category_buttons):
-            is_selected = (i == category_idx)
-            btn.setProperty("selected", is_selected)
-            btn.setChecked(is_selected)
-            btn.style().unpolish(btn)
-            btn.style().polish(btn)
+        self._update_category_buttons()
         
         # 카테고리에 맞는 데이터 로드
         if category_idx == 0:  # 클립보드 히스토리
-            print("최근 기록 탭으로 이동")
+            log.debug("최근 기록 탭으로 이동")
             # 최신 클립보드 히스토리 데이터 직접 가져오기
             from clipboard_monitor import ClipboardMonitorThread
             current_history = ClipboardMonitorThread.get_history()
-            print(f"클립보드 히스토리 로드: {len(current_history)}개 항목")
+            log.debug("클립보드 히스토리 로드: %s개 항목", len(current_history))
             self.current_history_items = current_history
             
             # 검색창 초기화하고 필터링
             self.search_box.clear()
             self.filter_history("")
-        else:
-            # 다른 카테고리는 현재 구현 전
-            self.empty_message.setText(f"{self.category_buttons[category_idx].text()} 기능은 준비 중입니다.")
-            self.items_list.clear()
-            self.empty_message.setVisible(True)
-            self.items_list.setVisible(False)
+        elif category_idx == 1:  # 자주 쓰는 항목 (사용 빈도 힙에서 상위 N개만 가져오므로 바로 표시됨)
+            log.debug("자주 쓰는 항목 탭으로 이동")
+            self.search_box.clear()
+            self.filter_history("")
+        elif category_idx == 2:  # 메모장 (목록 메타데이터로 첫 페이지만 표시)
+            log.debug("메모장 탭으로 이동")
+            self.search_box.clear()
+            self.filter_history("")
+        elif category_idx == 3:  # 이메일 템플릿
+            log.debug("이메일 템플릿 탭으로 이동")
+            self.search_box.clear()
+            self.filter_history("")
+    
+    def _update_category_buttons(self):
+        """현재 카테고리에 맞게 카테고리 버튼 상태 업데이트"""
+        for i, btn in enumerate(self.category_buttons):
+            is_selected = (i == self.current_category)
+            btn.setProperty("selected", is_selected)
+            btn.setChecked(is_selected)
+            btn.style().unpolish(btn)
+            btn.style().polish(btn)
+    
+    def prepare_content(self):
+        """
+        팝업을 기본 상태(최근 기록 탭, 빈 검색어)로 되돌리고 카드 목록을 한 번만 다시 만듦
+        """
+        if self.current_category != 0:
+            self.current_category = 0
+            self._update_category_buttons()
+        
+        # 검색창 초기화 시 textChanged로 인한 중복 필터링 방지
+        self.search_box.blockSignals(True)
+        self.search_box.clear()
+        self.search_box.blockSignals(False)
+        
+        self.current_history_items = ClipboardMonitorThread.get_history()
+        self.filter_history("")
+        self._content_dirty = False
+    
+    def mark_content_dirty(self):
+        """
+        히스토리 변경 알림 (팝업이 숨겨진 동안 호출됨)
+        pre-warm 모드에서는 다음 이벤트 루프 유휴 시점에 카드 목록을 미리 갱신함
+        """
+        self._content_dirty = True
+        if self.prewarm_enabled and not self._prewarm_scheduled:
+            self._prewarm_scheduled = True
+            QTimer.singleShot(0, self._prewarm_refresh)
+    
+    def _prewarm_refresh(self):
+        """숨겨진 상태에서 팝업 내용을 미리 갱신"""
+        self._prewarm_scheduled = False
+        if self.isVisible() or not self._content_dirty:
+            return
+        try:
+            self.prepare_content()
+        except Exception as e:
+            log.error("팝업 미리 준비 중 오류: %s", e)
+    
+    def _is_content_ready(self):
+        """표시할 내용이 이미 기본 상태로 준비되어 있는지 여부"""
+        return (self.prewarm_enabled and not self._content_dirty and
+                self.current_category == 0 and not self.search_box.text())
+    
+    def paintEvent(self, event):
+        """첫 프레임이 그려지는 시점에 표시 지연 시간 측정"""
+        super().paintEvent(event)
+        if self._show_requested_at is not None:
+            elapsed = latency_tracker.now() - self._show_requested_at
+            self._show_requested_at = None
+            latency_tracker.record("popup_request_to_first_paint", elapsed)
+            elapsed_ms = elapsed * 1000
+            if elapsed_ms > POPUP_SHOW_TARGET_MS:
+                log.warning("팝업 첫 프레임 지연: %.1fms (목표 %.0fms 초과)", elapsed_ms, POPUP_SHOW_TARGET_MS)
+            else:
+                log.debug("팝업 첫 프레임 지연: %.1fms", elapsed_ms)
     
     def get_time_display(self, item_text):
         """클립보드 항목의 경과 시간 표시 형식 반환"""
         current_time = time.time()
-        if item_text not in self.clipboard_times:
-            self.clipboard_times[item_text] = current_time
-        
-        elapsed_seconds = current_time - self.clipboard_times[item_text]
+        meta = ClipboardMonitorThread.get_meta(item_text)
+        if meta is not None:
+            copied_time = meta["time"]
+        else:
+            copied_time = self.clipboard_times.setdefault(item_text, current_time)
         
+        return self._format_elapsed(current_time - copied_time)
+    
+    @staticmethod
+    def _format_elapsed(elapsed_seconds):
+        """경과 시간(초)을 '3분 전' 형식으로 변환"""
         if elapsed_seconds < 60:
             return "방금 전"
         elif elapsed_seconds < 60 * 60:
@@ -553,22 +677,19 @@ class ClipboardHistoryPopup(QWidget):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
         
         # 아이템 유형 감지
-        is_link = item_text.startswith(('http://', 'https://', 'www.'))
-        is_code = item_text.startswith(('{"', '[{', '<?xml', '<html', '<!DOCTYPE', 'function', 'class', 'def ', 'import ', 'from '))
-        is_email = '@' in item_text and '.' in item_text.split('@')[1] and not is_link
-        is_number = all(c.isdigit() or c in ',.+-*/() ' for c in item_text.strip()) and any(c.isdigit() for c in item_text)
+        clip_type = self._get_item_type(item_text)
         
         # 아이콘 배경색 및 텍스트 결정
-        if is_link:
+        if clip_type == "link":
             bg_color = QColor("#4285F4")  # Google 블루
             icon_text = "🔗"
-        elif is_code:
+        elif clip_type == "code":
             bg_color = QColor("#0F9D58")  # Google 그린
             icon_text = "{"
-        elif is_email:
+        elif clip_type == "email":
             bg_color = QColor("#DB4437")  # Google 레드
             icon_text = "✉"
-        elif is_number:
+        elif clip_type == "number":
             bg_color = QColor("#F4B400")  # Google 옐로우
             icon_text = "#"
         else:
@@ -708,13 +829,21 @@ class ClipboardHistoryPopup(QWidget):
         item_layout.addLayout(footer_layout)
         
         # 스타일 설정
+        item_widget.setStyleSheet(self._card_stylesheet())
+        
+        # 클릭 이벤트를 위한 커스텀 처리
+        item_widget.mousePressEvent = lambda event, t=item_text: self._on_item_widget_clicked(event, t)
+        
+        return item_widget
+        
+    def _card_stylesheet(self):
+        """카드 위젯 공통 스타일시트 반환 (현재 테마 기준)"""
         bg_color = "#2D2D2D" if self.dark_mode else "white"
         hover_color = "#323232" if self.dark_mode else "#F5F5F5"
         border_color = "#444" if self.dark_mode else "#E0E0E0"
         text_color = "#DDD" if self.dark_mode else "#333"
         
-        # 커스텀 스타일시트 설정
-        item_widget.setStyleSheet(f"""
+        return f"""
             QFrame[customItem=true] {{
                 background-color: {bg_color};
                 border: 1px solid {border_color};
@@ -746,60 +875,292 @@ class ClipboardHistoryPopup(QWidget):
             QToolButton:hover {{
                 background-color: {'rgba(255, 255, 255, 0.15)' if self.dark_mode else 'rgba(0, 0, 0, 0.08)'};
             }}
-        """)
+        """
+
+    def create_note_widget(self, note_id, index):
+        """메모 카드 위젯 생성 (목록 메타데이터만 사용하며 본문은 읽지 않음)"""
+        meta = self.notes_store.get_meta(note_id) or {}
         
-        # 클릭 이벤트를 위한 커스텀 처리
-        item_widget.mousePressEvent = lambda event, t=item_text: self._on_item_widget_clicked(event, t)
+        item_widget = QFrame()
+        item_widget.setProperty("customItem", True)
+        item_widget.setFixedSize(180, 180)
         
+        item_layout = QVBoxLayout(item_widget)
+        item_layout.setContentsMargins(12, 12, 12, 12)
+        item_layout.setSpacing(8)
+        
+        # 제목
+        title_label = QLabel(self.truncate_text(meta.get("title", "새 메모"), 40))
+        title_label.setObjectName("itemTypeLabel")
+        title_label.setTextFormat(Qt.TextFormat.PlainText)
+        title_label.setStyleSheet("color: rgba(128, 128, 128, 220); font-size: 9pt; font-weight: bold;")
+        
+        # 미리보기
+        text_label = QLabel(self.truncate_text(meta.get("preview", ""), CLIP_PREVIEW_MAX_LEN))
+        text_label.setObjectName("contentText")
+        text_label.setWordWrap(True)
+        text_label.setTextFormat(Qt.TextFormat.PlainText)
+        text_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        
+        # 하단 영역 (수정 시각, 글자 수)
+        footer_layout = QHBoxLayout()
+        footer_layout.setContentsMargins(0, 0, 0, 0)
+        time_label = QLabel(self._format_elapsed(time.time() - meta.get("time", time.time())))
+        time_label.setStyleSheet("color: rgba(128, 128, 128, 180); font-size: 8pt;")
+        char_count_label = QLabel(f"{meta.get('length', 0)}자")
+        char_count_label.setStyleSheet("color: rgba(128, 128, 128, 180); font-size: 8pt;")
+        char_count_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        footer_layout.addWidget(time_label)
+        footer_layout.addStretch(1)
+        footer_layout.addWidget(char_count_label)
+        
+        item_layout.addWidget(title_label)
+        item_layout.addWidget(text_label, 1)
+        item_layout.addLayout(footer_layout)
+        
+        item_widget.setStyleSheet(self._card_stylesheet())
+        item_widget.mousePressEvent = lambda event, n=note_id: self.open_note_editor(n)
+        return item_widget
+    
+    def _create_add_card(self, text, on_click):
+        """'새로 만들기' 카드 위젯 생성 (메모장/템플릿 탭 맨 앞)"""
+        item_widget = QFrame()
+        item_widget.setProperty("customItem", True)
+        item_widget.setFixedSize(180, 180)
+        item_layout = QVBoxLayout(item_widget)
+        label = QLabel(f"＋\n{text}")
+        label.setObjectName("contentText")
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        item_layout.addWidget(label)
+        item_widget.setStyleSheet(self._card_stylesheet())
+        item_widget.mousePressEvent = lambda event: on_click()
         return item_widget
+    
+    def create_template_widget(self, template_id, index):
+        """이메일 템플릿 카드 위젯 생성 (클릭 시 렌더링 후 붙여넣기)"""
+        template = self.template_store.get(template_id) or {"title": "", "body": ""}
+        
+        item_widget = QFrame()
+        item_widget.setProperty("customItem", True)
+        item_widget.setFixedSize(180, 180)
         
+        item_layout = QVBoxLayout(item_widget)
+        item_layout.setContentsMargins(12, 12, 12, 12)
+        item_layout.setSpacing(8)
+        
+        # 상단 영역 (제목, 편집 버튼)
+        header_layout = QHBoxLayout()
+        header_layout.setContentsMargins(0, 0, 0, 0)
+        title_label = QLabel(self.truncate_text(template["title"], 40))
+        title_label.setTextFormat(Qt.TextFormat.PlainText)
+        title_label.setStyleSheet("color: rgba(128, 128, 128, 220); font-size: 9pt; font-weight: bold;")
+        edit_button = QToolButton()
+        edit_button.setText("✏️")
+        edit_button.setToolTip("템플릿 편집")
+        edit_button.setFixedSize(20, 20)
+        edit_button.clicked.connect(lambda: self.open_template_editor(template_id))
+        header_layout.addWidget(title_label, 1)
+        header_layout.addWidget(edit_button)
+        
+        # 템플릿 본문 (치환 전)
+        text_label = QLabel(self.truncate_text(template["body"], CLIP_PREVIEW_MAX_LEN))
+        text_label.setObjectName("contentText")
+        text_label.setWordWrap(True)
+        text_label.setTextFormat(Qt.TextFormat.PlainText)
+        text_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        
+        item_layout.addLayout(header_layout)
+        item_layout.addWidget(text_label, 1)
+        
+        item_widget.setStyleSheet(self._card_stylesheet())
+        item_widget.mousePressEvent = lambda event, t=template_id: self._paste_template(t)
+        return item_widget
+    
+    def _paste_template(self, template_id):
+        """템플릿을 렌더링하여 히스토리 항목과 같은 붙여넣기 경로로 전달"""
+        with latency_tracker.span("template_render"):
+            text = self.template_store.render(template_id)
+        if text:
+            self._request_paste(text)
+    
+    def open_template_editor(self, template_id):
+        """
+        템플릿 편집 창 열기
+        
+        Args:
+            template_id: 편집할 템플릿 ID (None이면 새 템플릿)
+        """
+        if self._template_editor is not None:
+            self._template_editor.close()
+        editor = TemplateEditorDialog(self.template_store, template_id, self.dark_mode)
+        editor.templates_changed.connect(self._on_templates_changed)
+        editor.finished.connect(lambda result: setattr(self, "_template_editor", None))
+        self._template_editor = editor
+        self.hide_popup()
+        editor.show()
+        editor.raise_()
+        editor.activateWindow()
+    
+    def _on_templates_changed(self):
+        """템플릿 저장/삭제 알림 처리 (템플릿 탭이 표시 중이면 목록 갱신)"""
+        if self.current_category == 3 and self.isVisible():
+            self.filter_history(self.search_box.text())
+    
+    def open_note_editor(self, note_id):
+        """
+        메모 편집 창 열기 (이미 열려 있으면 앞으로 가져옴)
+        
+        Args:
+            note_id: 편집할 메모 ID (None이면 새 메모 생성)
+        """
+        if note_id is None:
+            note_id = self.notes_store.create_note()
+            self._on_note_changed(note_id)
+        editor = self._note_editors.get(note_id)
+        if editor is None:
+            editor = NoteEditorDialog(self.notes_store, note_id, self.dark_mode)
+            editor.note_changed.connect(self._on_note_changed)
+            editor.finished.connect(lambda result, n=note_id: self._note_editors.pop(n, None))
+            self._note_editors[note_id] = editor
+        self.hide_popup()
+        editor.show()
+        editor.raise_()
+        editor.activateWindow()
+    
+    def _on_note_changed(self, note_id):
+        """메모 저장/삭제 알림 처리 (메모장 탭이 표시 중이면 목록 갱신)"""
+        if self.current_category == 2 and self.isVisible():
+            self.filter_history(self.search_box.text())
+    
+    def flush_notes(self):
+        """열려 있는 메모 편집 창의 변경 내용과 메모 목록 저장 (종료 시 호출)"""
+        for editor in list(self._note_editors.values()):
+            editor.save_now()
+        self.notes_store.save_index()
+    
     def _on_item_widget_clicked(self, event, item_text):
         """카드 클릭 이벤트 처리"""
-        print(f"카드 클릭: {item_text[:30]}... - 붙여넣기 요청")
-        self.hide_popup()
-        QTimer.singleShot(200, lambda t=item_text: self._execute_copy_paste_action(t))
+        self._request_paste(item_text)
         
+    def _get_item_type(self, text):
+        """항목 유형 반환 (모니터가 미리 계산한 메타데이터 우선 사용)"""
+        meta = ClipboardMonitorThread.get_meta(text)
+        return meta["type"] if meta is not None else detect_clip_type(text)
+    
     def _get_item_type_name(self, text):
         """항목 타입 이름 반환"""
-        if text.startswith(('http://', 'https://', 'www.')):
-            return "링크"
-        elif text.startswith(('{"', '[{', '<?xml', '<html', '<!DOCTYPE', 'function', 'class', 'def ', 'import ', 'from ')):
-            return "코드"
-        elif '@' in text and '.' in text.split('@')[1] and not text.startswith(('http://', 'https://', 'www.')):
-            return "이메일"
-        elif all(c.isdigit() or c in ',.+-*/() ' for c in text.strip()) and any(c.isdigit() for c in text):
-            return "숫자"
-        else:
-            return "텍스트"
+        return CLIP_TYPE_NAMES[self._get_item_type(text)]
     
     def filter_history(self, search_term=""):
-        """검색어에 따라 클립보드 히스토리 필터링"""
-        self.search_text = search_term.lower()
+        """
+        검색어에 따라 클립보드 히스토리 필터링 (검색은 백그라운드 스레드에서 수행)
+        type:url, after:2h, len>1000, /정규식/ 등의 쿼리 문법은 search_query.parse_query 참고
+        """
+        self.search_text = search_term.strip()
+        self.search_notice_label.setVisible(False)
         
         # 현재 카테고리에 해당하는 항목 필터링
         if self.current_category == 0:  # 클립보드 히스토리
-            if not self.current_history_items:
-                print("클립보드 히스토리 항목 없음")
-                self.filtered_items = []
+            if not self.search_text:
+                # 빈 검색어는 전체 목록이므로 스캔 없이 바로 표시
+                self.search_worker.cancel_current()
+                self._active_query_id = 0
+                self.filtered_items = list(self.current_history_items)
+            else:
+                # 이전 검색은 취소되고, 결과는 청크 단위로 도착함
+                self._active_query_id = self.search_worker.submit(
+                    self.search_text, self.current_history_items, ClipboardMonitorThread.search_meta()
+                )
+                return
+        elif self.current_category == 1:  # 자주 쓰는 항목
+            frequent_items = ClipboardMonitorThread.get_frequent_items()
+            if not self.search_text:
+                self.search_worker.cancel_current()
+                self._active_query_id = 0
+                self.filtered_items = frequent_items
+            else:
+                # 검색 스레드는 리스트 뒤쪽부터 검사하므로 빈도 순서를 유지하도록 뒤집어서 전달
+                frequent_items.reverse()
+                self._active_query_id = self.search_worker.submit(
+                    self.search_text, frequent_items, ClipboardMonitorThread.search_meta()
+                )
+                return
+        elif self.current_category == 2:  # 메모장
+            note_ids = self.notes_store.list_notes()
+            if not self.search_text:
+                self.search_worker.cancel_current()
+                self._active_query_id = 0
+                self.filtered_items = note_ids
+            else:
+                # 히스토리와 같은 검색 스레드/쿼리 문법 사용, 본문은 검색 스레드에서 필요할 때 읽음
+                note_ids.reverse()
+                self._active_query_id = self.search_worker.submit(
+                    self.search_text, note_ids, self.notes_store.search_meta(), self.notes_store.get_body
+                )
+                return
+        elif self.current_category == 3:  # 이메일 템플릿
+            template_ids = self.template_store.list_templates()
+            if not self.search_text:
+                self.search_worker.cancel_current()
+                self._active_query_id = 0
+                self.filtered_items = template_ids
             else:
-                print(f"필터링: {len(self.current_history_items)}개 항목 중 '{self.search_text}' 검색")
-                self.filtered_items = [item for item in self.current_history_items 
-                                      if self.search_text in item.lower()]
+                template_ids.reverse()
+                self._active_query_id = self.search_worker.submit(
+                    self.search_text, template_ids, None, self.template_store.get_body
+                )
+                return
         
         # 필터링 결과 업데이트
         self.update_displayed_items()
     
+    @pyqtSlot(int, list, bool)
+    def _on_search_chunk_ready(self, query_id, items, is_first):
+        """백그라운드 검색 결과 청크 수신 처리"""
+        if query_id != self._active_query_id:
+            return  # 이미 취소된 검색의 결과
+        if is_first:
+            # 첫 페이지는 전체 스캔 완료를 기다리지 않고 바로 표시
+            self.filtered_items = list(items)
+            self.update_displayed_items()
+        else:
+            self.filtered_items.extend(items)
+            self.append_displayed_items(items)
+    
+    @pyqtSlot(int, int, bool)
+    def _on_search_finished(self, query_id, total, truncated):
+        """백그라운드 검색 완료 처리"""
+        if query_id != self._active_query_id:
+            return
+        self.search_notice_label.setVisible(truncated and total > 0)
+        if total == 0:
+            self.filtered_items = []
+            self.update_displayed_items()
+            if truncated:
+                self.empty_message.setText("검색 시간이 초과되었습니다. 검색어를 좁혀 주세요.")
+    
     def update_displayed_items(self):
         """현재 필터링된 아이템을 화면에 표시 - 가로 스크롤 카드 형태"""
         self.items_list.clear()
-        
-        if not self.filtered_items:
-            print("표시할 항목 없음")
+        self._cards_container = None
+        self._cards_layout = None
+        self._cards_list_item = None
+        self._displayed_count = 0
+        is_notes = self.current_category == 2
+        # 메모장/템플릿 탭은 검색 중이 아니면 항상 '새로 만들기' 카드를 표시
+        show_add_card = self.current_category in (2, 3) and not self.search_text
+        
+        if not self.filtered_items and not show_add_card:
+            log.debug("표시할 항목 없음")
+            if self.current_category == 1 and not self.search_text:
+                self.empty_message.setText("아직 붙여넣은 항목이 없습니다")
+            else:
+                self.empty_message.setText("클립보드 항목이 없습니다")
             self.empty_message.setVisible(True)
             self.items_list.setVisible(False)
             return
         
-        print(f"UI에 {len(self.filtered_items)}개 항목 표시")
+        log.debug("UI에 %s개 항목 표시", len(self.filtered_items))
         self.empty_message.setVisible(False)
         
         # 가로 스크롤을 위한 컨테이너 위젯 설정
@@ -808,12 +1169,24 @@ class ClipboardHistoryPopup(QWidget):
         horizontal_layout.setContentsMargins(15, 10, 15, 10)
         horizontal_layout.setSpacing(15)  # 카드 간 간격
         
+        # 메모장 탭은 새 메모 카드를 맨 앞에 두고, 메모 카드는 첫 페이지만 생성
+        if show_add_card:
+            if is_notes:
+                horizontal_layout.addWidget(self._create_add_card("새 메모", lambda: self.open_note_editor(None)))
+            else:
+                horizontal_layout.addWidget(self._create_add_card("새 템플릿", lambda: self.open_template_editor(None)))
+        if is_notes:
+            items_to_show = self.filtered_items[:NOTES_PAGE_SIZE]
+        else:
+            items_to_show = self.filtered_items
+        
         # 각 항목을 카드로 생성하고 가로 레이아웃에 추가
-        for i, item_text in enumerate(self.filtered_items):
+        for i, item_text in enumerate(items_to_show):
             # 카드 위젯 생성
-            card_widget = self.create_item_widget(item_text, i)
+            card_widget = self._create_card(item_text, i)
             # 가로 레이아웃에 추가
             horizontal_layout.addWidget(card_widget)
+        self._displayed_count = len(items_to_show)
         
         # 항목이 적을 경우를 위한 오른쪽 여백
         horizontal_layout.addStretch(1)
@@ -828,146 +1201,75 @@ class ClipboardHistoryPopup(QWidget):
         self.items_list.setItemWidget(list_item, container_widget)
         self.items_list.setVisible(True)
         
+        self._cards_container = container_widget
+        self._cards_layout = horizontal_layout
+        self._cards_list_item = list_item
+        
         # 스크롤바 설정 업데이트
         self.items_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.items_list.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
     
+    def append_displayed_items(self, items):
+        """이미 표시된 카드 목록 뒤에 항목 추가 (검색 결과 청크용)"""
+        if self._cards_layout is None:
+            self.update_displayed_items()
+            return
+        
+        start_index = self._cards_layout.count() - 1  # 마지막은 오른쪽 여백(stretch)
+        for offset, item_text in enumerate(items):
+            card_widget = self._create_card(item_text, start_index + offset)
+            self._cards_layout.insertWidget(self._cards_layout.count() - 1, card_widget)
+        self._displayed_count += len(items)
+        
+        self._cards_container.adjustSize()
+        self._cards_list_item.setSizeHint(self._cards_container.sizeHint())
+    
+    def _create_card(self, item, index):
+        """현재 카테고리에 맞는 카드 위젯 생성 (메모장 탭의 항목은 메모 ID)"""
+        if self.current_category == 2:
+            return self.create_note_widget(item, index)
+        if self.current_category == 3:
+            return self.create_template_widget(item, index)
+        return self.create_item_widget(item, index)
+    
+    def _on_cards_scrolled(self, value):
+        """메모장 탭에서 스크롤이 끝에 가까워지면 다음 페이지 카드 생성"""
+        if self.current_category != 2 or self._cards_layout is None:
+            return
+        if self._displayed_count >= len(self.filtered_items):
+            return
+        if value < self.items_list.horizontalScrollBar().maximum() - NOTES_PAGE_PRELOAD_PX:
+            return
+        start = self._displayed_count
+        self.append_displayed_items(self.filtered_items[start:start + NOTES_PAGE_SIZE])
+    
     def on_item_clicked(self, item):
         """클립보드 항목 클릭 처리"""
         item_text = item.data(Qt.ItemDataRole.UserRole)
-        print(f"항목 클릭: {item_text[:30]}... - 붙여넣기 요청")
-        
-        self.hide_popup() # 먼저 팝업을 숨기기 시작
-        
-        # 팝업이 닫힐 시간을 고려하여 약간의 지연 후 복사/붙여넣기 실행
-        # 애니메이션 시간 (100ms) + 추가 버퍼
-        QTimer.singleShot(200, lambda t=item_text: self._execute_copy_paste_action(t))
+        self._request_paste(item_text)
     
-    def _execute_copy_paste_action(self, text_to_paste):
-        """지연 후 실제 클립보드 복사 및 붙여넣기 실행"""
-        try:
-            print(f"지연 후 작업 실행: {text_to_paste[:30]}...")
-            
-            # 1. 클립보드에 복사
-            self.set_clipboard_with_retry(text_to_paste)
-            # pyperclip.paste() 등으로 확인 로그는 set_clipboard_with_retry 내부에 이미 있음
-
-            # 2. 클립보드 히스토리 수동 추가 (필요한 경우)
-            #    set_clipboard_with_retry가 성공하면 ClipboardMonitorThread가 자동으로 감지할 가능성이 높음.
-            #    중복 추가를 피하려면 아래 줄은 주석 처리하거나, add_item_manually 내부에서 중복 방지 로직 필요.
-            # ClipboardMonitorThread.add_item_manually(text_to_paste, set_clipboard=False)
-            
-            # 3. 붙여넣기 실행
-            self.execute_paste() # 이 함수 내부에 최종 time.sleep(0.3) 있음
-            print("붙여넣기 작업 완료.")
-            
-        except Exception as e:
-            print(f"붙여넣기 작업 중 오류 (_execute_copy_paste_action): {e}")
-            traceback.print_exc()
-
-    def set_clipboard_with_retry(self, text, max_retries=5):
-        """재시도 로직으로 클립보드 설정"""
-        print(f"클립보드에 텍스트 복사 시도: {text[:30]}...")
-        retry_count = 0
-        last_error = None
-        while retry_count < max_retries:
-            try:
-                QApplication.clipboard().setText(text)
-                print(f"Qt 클립보드 설정 성공 (시도 {retry_count+1})")
-                return
-            except Exception as e:
-                print(f"Qt 클립보드 설정 실패 (시도 {retry_count+1}): {e}")
-                last_error = e
-                retry_count += 1
-                time.sleep(0.1)
+    def _request_paste(self, item_text):
+        """
+        팝업 숨김을 시작하고 붙여넣기 요청
+        (붙여넣기 파이프라인이 팝업이 실제로 숨겨지고 포커스가 돌아온 뒤에 진행함)
+        """
+        log.debug("항목 클릭: %s - 붙여넣기 요청", redact(item_text))
+        latency_tracker.mark("paste_click")
+        self.hide_popup()
+        self.paste_requested_signal.emit(item_text)
+    
+    def hideEvent(self, event):
+        """창이 실제로 숨겨졌음을 알림"""
+        super().hideEvent(event)
+        self.popup_hidden.emit()
+    
+    def show_popup_animated(self, requested_at=None):
+        """
+        애니메이션과 함께 팝업 표시
         
-        retry_count = 0
-        while retry_count < max_retries:
-            try:
-                pyperclip.copy(text)
-                print(f"pyperclip 설정 성공 (시도 {retry_count+1})")
-                return
-            except Exception as e:
-                print(f"pyperclip 설정 실패 (시도 {retry_count+1}): {e}")
-                last_error = e
-                retry_count += 1
-                time.sleep(0.2)
-        
-        print("모든 클립보드 설정 시도 실패")
-        if last_error:
-            # raise last_error # 여기서 바로 에러를 발생시키기 보다 실패를 알리는게 나을수도
-            print(f"클립보드 설정 최종 실패: {last_error}")
-
-    def execute_paste(self):
-        """여러 방법으로 붙여넣기 시도"""
-        time.sleep(0.3) # 실제 붙여넣기 전 약간의 최종 지연
-        try:
-            if sys.platform == "win32":
-                self.try_windows_paste_methods()
-            else:
-                self.try_pynput_paste()
-        except Exception as e:
-            print(f"붙여넣기 실행 오류: {e}")
-            traceback.print_exc()
-
-    def try_windows_paste_methods(self):
-        """Windows 환경에서 여러 붙여넣기 방법 시도"""
-        print("Windows 붙여넣기 시도 중...")
-        try:
-            print("방법 1: Windows SendInput API 사용...")
-            import ctypes
-            from ctypes import wintypes
-            user32 = ctypes.WinDLL('user32', use_last_error=True)
-            class KeyBdInput(ctypes.Structure): _fields_ = [("wVk", wintypes.WORD),("wScan", wintypes.WORD),("dwFlags", wintypes.DWORD),("time", wintypes.DWORD),("dwExtraInfo", ctypes.POINTER(wintypes.ULONG))]
-            class MouseInput(ctypes.Structure): _fields_ = [("dx", wintypes.LONG),("dy", wintypes.LONG),("mouseData", wintypes.DWORD),("dwFlags", wintypes.DWORD),("time", wintypes.DWORD),("dwExtraInfo", ctypes.POINTER(wintypes.ULONG))]
-            class HardwareInput(ctypes.Structure): _fields_ = [("uMsg", wintypes.DWORD),("wParamL", wintypes.WORD),("wParamH", wintypes.WORD)]
-            class InputUnion(ctypes.Union): _fields_ = [("ki", KeyBdInput),("mi", MouseInput),("hi", HardwareInput)]
-            class Input(ctypes.Structure): _fields_ = [("type", wintypes.DWORD),("ii", InputUnion)]
-            INPUT_KEYBOARD, KEYEVENTF_KEYUP, VK_CONTROL, VK_V = 1, 0x0002, 0x11, 0x56
-            inputs = (Input * 4)(
-                Input(INPUT_KEYBOARD, InputUnion(ki=KeyBdInput(VK_CONTROL, 0, 0, 0, None))),
-                Input(INPUT_KEYBOARD, InputUnion(ki=KeyBdInput(VK_V, 0, 0, 0, None))),
-                Input(INPUT_KEYBOARD, InputUnion(ki=KeyBdInput(VK_V, 0, KEYEVENTF_KEYUP, 0, None))),
-                Input(INPUT_KEYBOARD, InputUnion(ki=KeyBdInput(VK_CONTROL, 0, KEYEVENTF_KEYUP, 0, None)))
-            )
-            time.sleep(0.1)
-            # print("SendInput API 호출 전 추가 지연 완료 (0.1초)") # 로그 간소화
-            result = user32.SendInput(4, ctypes.byref(inputs), ctypes.sizeof(Input))
-            if result != 4: print(f"SendInput 실패: {ctypes.get_last_error()}"); raise Exception("SendInput failed")
-            else: print("SendInput 성공!"); return
-        except Exception as e: print(f"방법 1 실패: {e}")
-        try:
-            print("방법 2: Windows keybd_event API 사용...")
-            import ctypes # 중복 import지만, 각 try 블록 독립성 위해 유지
-            user32 = ctypes.WinDLL('user32', use_last_error=True)
-            KEYEVENTF_KEYUP, VK_CONTROL, VK_V = 0x0002, 0x11, 0x56
-            time.sleep(0.1)
-            # print("keybd_event API 호출 전 추가 지연 완료 (0.1초)") # 로그 간소화
-            user32.keybd_event(VK_CONTROL, 0, 0, 0); time.sleep(0.05)
-            user32.keybd_event(VK_V, 0, 0, 0); time.sleep(0.05)
-            user32.keybd_event(VK_V, 0, KEYEVENTF_KEYUP, 0); time.sleep(0.05)
-            user32.keybd_event(VK_CONTROL, 0, KEYEVENTF_KEYUP, 0)
-            print("keybd_event 성공!"); return
-        except Exception as e: print(f"방법 2 실패: {e}")
-        self.try_pynput_paste()
-
-    def try_pynput_paste(self):
-        """pynput 키보드 컨트롤러로 붙여넣기 시도"""
-        print("방법 3: pynput 키보드 컨트롤러 사용...")
-        try:
-            keyboard_controller = KeyboardController()
-            paste_key = Key.cmd if sys.platform == "darwin" else Key.ctrl
-            keyboard_controller.press(paste_key); time.sleep(0.05)
-            keyboard_controller.press('v'); time.sleep(0.05)
-            keyboard_controller.release('v'); time.sleep(0.05)
-            keyboard_controller.release(paste_key)
-            print("pynput 방식 성공!")
-        except Exception as e: 
-            print(f"방법 3 실패: {e}")
-            print("모든 붙여넣기 방법이 실패했습니다. 사용자에게 수동 붙여넣기 안내...")
-
-    def show_popup_animated(self):
-        """애니메이션과 함께 팝업 표시"""
+        Args:
+            requested_at: 표시 요청 시각 (time.perf_counter 기준, 예: 단축키 신호 발생 시각)
+        """
         try:
             animation_active = self.animation.state() == QPropertyAnimation.State.Running
             if self.isVisible() and abs(self.opacity_effect.opacity() - 1.0) < 0.01 and not animation_active:
@@ -975,7 +1277,7 @@ class ClipboardHistoryPopup(QWidget):
             if animation_active and self.animation.direction() == QPropertyAnimation.Direction.Forward:
                 return 
             if animation_active and self.animation.direction() == QPropertyAnimation.Direction.Backward:
-                print("숨김 애니메이션을 표시 애니메이션으로 전환합니다.")
+                log.debug("숨김 애니메이션을 표시 애니메이션으로 전환합니다.")
                 self.animation.stop()
                 self.animation.setDirection(QPropertyAnimation.Direction.Forward)
                 try: self.animation.finished.disconnect() 
@@ -983,16 +1285,11 @@ class ClipboardHistoryPopup(QWidget):
                 self.animation.start()
                 return
 
-            # 클립보드 히스토리 새로고침
-            self.change_category(0) 
-            self.search_box.clear()
+            self._show_requested_at = requested_at if requested_at is not None else latency_tracker.now()
             
-            # 현재 화면에서 사용 가능한 클립보드 항목 업데이트
-            from clipboard_monitor import ClipboardMonitorThread
-            current_history = ClipboardMonitorThread.get_history()
-            print(f"팝업 표시 전 클립보드 히스토리 {len(current_history)}개 항목 로드")
-            self.current_history_items = current_history
-            self.filter_history("")
+            # 미리 준비된 내용이 없을 때만 클립보드 히스토리 새로고침 (한 번만 다시 그림)
+            if not self._is_content_ready():
+                self.prepare_content()
             
             target_screen = QApplication.screenAt(QCursor.pos()) or QApplication.primaryScreen()
             screen_geometry = target_screen.availableGeometry()
@@ -1019,11 +1316,20 @@ class ClipboardHistoryPopup(QWidget):
             
             self.animation.setDirection(QPropertyAnimation.Direction.Forward)
             self.animation.start()
+            POPUP_OPENS.inc()
+            latency_tracker.record("popup_request_to_animation_start", latency_tracker.now() - self._show_requested_at)
+            latency_tracker.mark("show_animation")
             QTimer.singleShot(100, self.search_box.setFocus)
         except Exception as e:
-            print(f"팝업 표시 오류: {e}")
-            traceback.print_exc()
-            
+            log.exception("팝업 표시 오류: %s", e)
+            
+    def _on_animation_state_changed(self, new_state, old_state):
+        """표시 애니메이션 완료 시 소요 시간 기록"""
+        if (new_state == QPropertyAnimation.State.Stopped and
+                self.animation.direction() == QPropertyAnimation.Direction.Forward and
+                abs(self.opacity_effect.opacity() - 1.0) < 0.01):
+            latency_tracker.record_since("show_animation", "popup_show_animation", clear=True)
+    
     def hide_popup(self):
         """애니메이션과 함께 팝업 숨기기 (일반용)"""
         animation_active = self.animation.state() == QPropertyAnimation.State.Running
@@ -1038,7 +1344,7 @@ class ClipboardHistoryPopup(QWidget):
             return
 
         if animation_active and self.animation.direction() == QPropertyAnimation.Direction.Forward:
-            print("표시 애니메이션을 숨김 애니메이션으로 전환합니다.")
+            log.debug("표시 애니메이션을 숨김 애니메이션으로 전환합니다.")
             self.animation.stop()
             self.animation.setDirection(QPropertyAnimation.Direction.Backward)
             # 콜백은 이 함수 하단에서 일반용으로 (재)연결됨
@@ -1065,6 +1371,9 @@ class ClipboardHistoryPopup(QWidget):
            abs(self.opacity_effect.opacity() - self.animation.startValue()) < 0.01:
             # print("일반 숨김 애니메이션 완료.") # 로그 간소화
             self.hide()
+            # 다음 표시 때 바로 보일 수 있도록 기본 상태로 미리 되돌려 둠
+            if self.prewarm_enabled and (self.current_category != 0 or self.search_box.text()):
+                self.mark_content_dirty()
             
         try:
             self.animation.finished.disconnect(self._on_hide_animation_finished)
@@ -1073,7 +1382,7 @@ class ClipboardHistoryPopup(QWidget):
     
     def update_history(self, history_items):
         """클립보드 히스토리 업데이트"""
-        print(f"히스토리 업데이트: {len(history_items)}개 항목")
+        log.debug("히스토리 업데이트: %s개 항목", len(history_items))
         self.current_history_items = list(history_items)
         self.filter_history(self.search_box.text())
 
@@ -1103,6 +1412,172 @@ class ClipboardHistoryPopup(QWidget):
                 parent.open_settings_dialog()
 
 # --- Settings Dialog ---
+class NoteEditorDialog(QDialog):
+    """
+    메모 편집 창 클래스
+    입력이 멈추면 잠시 후 변경된 구간만 저장소에 저장함 (전체 파일을 다시 쓰지 않음)
+    """
+    note_changed = pyqtSignal(str)  # 메모 ID (저장 또는 삭제됨)
+
+    def __init__(self, notes_store, note_id, dark_mode=False, parent=None):
+        """
+        초기화 함수
+        
+        Args:
+            notes_store: NotesStore 객체
+            note_id: 편집할 메모 ID
+            dark_mode: 다크 모드 여부
+            parent: 부모 위젯
+        """
+        super().__init__(parent)
+        self.notes_store = notes_store
+        self.note_id = note_id
+        self.setWindowTitle("메모 편집")
+        self.setMinimumSize(420, 320)
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self.save_now)
+        
+        layout = QVBoxLayout(self)
+        self.editor = QPlainTextEdit()
+        self.editor.setPlainText(notes_store.get_body(note_id) or "")
+        self.editor.textChanged.connect(self._on_text_changed)
+        layout.addWidget(self.editor, 1)
+        
+        button_layout = QHBoxLayout()
+        self.status_label = QLabel("저장됨")
+        self.status_label.setStyleSheet("color: rgba(128, 128, 128, 200); font-size: 8pt;")
+        delete_button = QPushButton("삭제")
+        delete_button.clicked.connect(self.delete_note)
+        close_button = QPushButton("닫기")
+        close_button.clicked.connect(self.accept)
+        button_layout.addWidget(self.status_label, 1)
+        button_layout.addWidget(delete_button)
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+        
+        if dark_mode:
+            self.setStyleSheet(f"QDialog, QPlainTextEdit {{ background-color: {COLOR_BG_DARK}; color: {COLOR_TEXT_DARK}; }}")
+    
+    def _on_text_changed(self):
+        """입력 시 자동 저장 타이머 재시작 (디바운스)"""
+        self.status_label.setText("편집 중...")
+        self._save_timer.start(NOTE_AUTOSAVE_DEBOUNCE_MS)
+    
+    def save_now(self):
+        """대기 중인 변경 내용 저장"""
+        self._save_timer.stop()
+        if self.note_id is None:
+            return
+        if self.notes_store.update_note(self.note_id, self.editor.toPlainText()):
+            self.note_changed.emit(self.note_id)
+        self.status_label.setText("저장됨")
+    
+    def delete_note(self):
+        """메모 삭제 후 창 닫기"""
+        reply = QMessageBox.question(self, "메모 삭제", "이 메모를 삭제할까요?")
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        self._save_timer.stop()
+        note_id, self.note_id = self.note_id, None
+        self.notes_store.delete_note(note_id)
+        self.note_changed.emit(note_id)
+        self.accept()
+    
+    def done(self, result):
+        """창을 닫기 전에 남은 변경 내용과 메모 목록 저장"""
+        self.save_now()
+        self.notes_store.save_index()
+        super().done(result)
+
+
+class TemplateEditorDialog(QDialog):
+    """
+    이메일 템플릿 편집 창 클래스
+    """
+    templates_changed = pyqtSignal()
+
+    def __init__(self, template_store, template_id=None, dark_mode=False, parent=None):
+        """
+        초기화 함수
+        
+        Args:
+            template_store: TemplateStore 객체
+            template_id: 편집할 템플릿 ID (None이면 새 템플릿)
+            dark_mode: 다크 모드 여부
+            parent: 부모 위젯
+        """
+        super().__init__(parent)
+        self.template_store = template_store
+        self.template_id = template_id
+        self.setWindowTitle("이메일 템플릿 편집")
+        self.setMinimumSize(420, 360)
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        
+        template = template_store.get(template_id) if template_id else None
+        
+        layout = QVBoxLayout(self)
+        self.title_edit = QLineEdit(template["title"] if template else "")
+        self.title_edit.setPlaceholderText("템플릿 제목")
+        layout.addWidget(self.title_edit)
+        
+        self.body_edit = QPlainTextEdit(template["body"] if template else "")
+        layout.addWidget(self.body_edit, 1)
+        
+        help_label = QLabel("치환자: {name} 이름, {date} 날짜, {time} 시각, {clipboard} 최근 클립보드 항목")
+        help_label.setWordWrap(True)
+        help_label.setStyleSheet("color: rgba(128, 128, 128, 200); font-size: 8pt;")
+        layout.addWidget(help_label)
+        
+        name_layout = QHBoxLayout()
+        name_layout.addWidget(QLabel("이름 {name}:"))
+        self.name_edit = QLineEdit(str(template_store.variables.get("name", "")))
+        name_layout.addWidget(self.name_edit, 1)
+        layout.addLayout(name_layout)
+        
+        button_layout = QHBoxLayout()
+        button_layout.addStretch(1)
+        if template_id:
+            delete_button = QPushButton("삭제")
+            delete_button.clicked.connect(self.delete_template)
+            button_layout.addWidget(delete_button)
+        cancel_button = QPushButton("취소")
+        cancel_button.clicked.connect(self.reject)
+        save_button = QPushButton("저장")
+        save_button.setDefault(True)
+        save_button.clicked.connect(self.save_template)
+        button_layout.addWidget(cancel_button)
+        button_layout.addWidget(save_button)
+        layout.addLayout(button_layout)
+        
+        if dark_mode:
+            self.setStyleSheet(
+                f"QDialog, QPlainTextEdit, QLineEdit {{ background-color: {COLOR_BG_DARK}; color: {COLOR_TEXT_DARK}; }}"
+            )
+    
+    def save_template(self):
+        """템플릿 저장 (저장된 템플릿만 다음 렌더링 때 다시 컴파일됨)"""
+        name = self.name_edit.text()
+        if name != self.template_store.variables.get("name", ""):
+            self.template_store.variables["name"] = name
+        self.template_id = self.template_store.save_template(
+            self.template_id, self.title_edit.text().strip(), self.body_edit.toPlainText()
+        )
+        self.templates_changed.emit()
+        self.accept()
+    
+    def delete_template(self):
+        """템플릿 삭제"""
+        reply = QMessageBox.question(self, "템플릿 삭제", "이 템플릿을 삭제할까요?")
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        self.template_store.delete_template(self.template_id)
+        self.templates_changed.emit()
+        self.accept()
+
+
 class SettingsDialog(QDialog):
     """
     설정 대화상자 클래스
@@ -1397,7 +1872,7 @@ class SettingsDialog(QDialog):
                 self._recording_listener_thread.stop_listener_and_quit()
                 self._recording_listener_thread.wait(1000)  # 1초까지 기다림
             except Exception as e:
-                print(f"단축키 기록 스레드 정리 중 오류: {e}")
+                log.error("단축키 기록 스레드 정리 중 오류: %s", e)
             
         self._recording_listener_thread = HotkeyRecordingThread(self)
         self._recording_listener_thread.key_combination_recorded.connect(self.on_key_combination_recorded)
@@ -1406,9 +1881,9 @@ class SettingsDialog(QDialog):
         
         try:
             self._recording_listener_thread.start()
-            print("단축키 기록 스레드가 시작되었습니다.")
+            log.info("단축키 기록 스레드가 시작되었습니다.")
         except Exception as e:
-            print(f"단축키 기록 스레드 시작 중 오류: {e}")
+            log.error("단축키 기록 스레드 시작 중 오류: %s", e)
             self.on_recording_canceled()  # 실패 시 취소 처리
     
     @pyqtSlot(str)
@@ -1443,7 +1918,7 @@ class SettingsDialog(QDialog):
                 self._recording_listener_thread.wait(1000)  # 최대 1초 대기
                 self._recording_listener_thread = None
         except Exception as e:
-            print(f"단축키 조합 기록 완료 처리 중 오류: {e}")
+            log.error("단축키 조합 기록 완료 처리 중 오류: %s", e)
             self.on_recording_canceled()  # 문제 발생 시 취소 처리
     
     @pyqtSlot()
@@ -1470,7 +1945,7 @@ class SettingsDialog(QDialog):
                 self._recording_listener_thread.wait(1000)  # 최대 1초 대기
                 self._recording_listener_thread = None
         except Exception as e:
-            print(f"단축키 기록 취소 중 오류: {e}")
+            log.error("단축키 기록 취소 중 오류: %s", e)
             self.record_button.setEnabled(True)
             self.save_button.setEnabled(True)
             self.temp_hotkey_config = None
@@ -0,0 +1,143 @@
+import heapq
+import itertools
+import math
+import threading
+import time
+
+# --- 사용 빈도 순위 관련 상수 ---
+USAGE_HALF_LIFE_SEC = 7 * 86400   # 사용 횟수가 절반으로 줄어드는 시간 (7일)
+USAGE_TOP_N = 50                  # "자주 쓰는 항목" 탭에 표시할 최대 항목 수
+USAGE_HEAP_COMPACT_RATIO = 2      # 유효 항목 대비 힙 크기가 이 배수를 넘으면 힙 재구성
+
+_DECAY_RATE = math.log(2) / USAGE_HALF_LIFE_SEC
+
+
+def _log_add(a, b):
+    """log(exp(a) + exp(b))를 오버플로 없이 계산"""
+    if a < b:
+        a, b = b, a
+    return a + math.log1p(math.exp(b - a))
+
+
+class UsageRanker:
+    """
+    시간에 따라 지수적으로 감소하는 항목별 사용 횟수를 관리하는 클래스
+
+    기준 시각(landmark)에 대한 전방 감쇠(forward decay) 방식을 사용하므로
+    모든 항목의 점수가 같은 비율로 감소하고, 시간이 지나도 순위는 바뀌지 않음.
+    따라서 사용 시에만 힙에 새 점수를 넣으면 되고 (이전 값은 지연 삭제),
+    상위 N개 조회 시 전체 히스토리를 다시 정렬할 필요가 없음.
+    점수는 오버플로를 피하기 위해 로그 값으로 저장함.
+    """
+
+    def __init__(self, landmark=None):
+        """
+        초기화 함수
+
+        Args:
+            landmark: 감쇠 기준 시각 (기본값: 현재 시각)
+        """
+        self._lock = threading.Lock()
+        self.landmark = time.time() if landmark is None else landmark
+        self._scores = {}   # 항목 텍스트 -> 로그 점수
+        self._heap = []     # (-로그 점수, 순번, 항목 텍스트), 점수가 바뀐 항목은 지연 삭제
+        self._counter = itertools.count()
+
+    def _push(self, text, log_score):
+        """힙에 새 점수 추가 (잠금을 보유한 상태에서 호출)"""
+        heapq.heappush(self._heap, (-log_score, next(self._counter), text))
+        if len(self._heap) > USAGE_HEAP_COMPACT_RATIO * len(self._scores) + 16:
+            self._compact()
+
+    def _compact(self):
+        """지연 삭제된 항목을 제거하고 힙 재구성 (잠금을 보유한 상태에서 호출)"""
+        self._heap = [(-score, next(self._counter), text) for text, score in self._scores.items()]
+        heapq.heapify(self._heap)
+
+    def record(self, text, timestamp=None):
+        """
+        항목 사용 기록 (사용 횟수 1 증가)
+
+        Args:
+            text: 사용한 항목 텍스트
+            timestamp: 사용 시각 (기본값: 현재 시각)
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        increment = _DECAY_RATE * (timestamp - self.landmark)
+        with self._lock:
+            previous = self._scores.get(text)
+            log_score = increment if previous is None else _log_add(previous, increment)
+            self._scores[text] = log_score
+            self._push(text, log_score)
+
+    def forget(self, text):
+        """
+        항목 사용 기록 삭제 (히스토리에서 제거된 항목용, 힙 항목은 지연 삭제)
+        """
+        with self._lock:
+            self._scores.pop(text, None)
+
+    def count(self, text, now=None):
+        """
+        현재 시각 기준으로 감쇠된 사용 횟수 반환 (기록이 없으면 0.0)
+        """
+        with self._lock:
+            log_score = self._scores.get(text)
+        if log_score is None:
+            return 0.0
+        if now is None:
+            now = time.time()
+        return math.exp(log_score - _DECAY_RATE * (now - self.landmark))
+
+    def top_n(self, n=USAGE_TOP_N):
+        """
+        사용 빈도가 높은 순서로 최대 n개 항목 반환 (O(n log H))
+
+        Returns:
+            항목 텍스트 리스트
+        """
+        result = []
+        seen = set()
+        valid_entries = []
+        with self._lock:
+            heap = self._heap
+            while heap and len(result) < n:
+                entry = heapq.heappop(heap)
+                neg_score, _, text = entry
+                if text in seen or self._scores.get(text) != -neg_score:
+                    continue  # 이전 점수 또는 삭제된 항목
+                seen.add(text)
+                result.append(text)
+                valid_entries.append(entry)
+            for entry in valid_entries:
+                heapq.heappush(heap, entry)
+        return result
+
+    def to_dict(self):
+        """설정 파일 저장용 딕셔너리 반환"""
+        with self._lock:
+            return {"landmark": self.landmark, "scores": dict(self._scores)}
+
+    @classmethod
+    def from_dict(cls, data, valid_items=None):
+        """
+        설정 파일 데이터로부터 복원
+
+        Args:
+            data: to_dict()로 저장된 딕셔너리 (형식이 잘못되었으면 빈 상태로 시작)
+            valid_items: 복원할 항목 집합 (히스토리에 없는 항목은 버림)
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("scores"), dict):
+            return cls()
+        try:
+            ranker = cls(float(data.get("landmark", time.time())))
+        except (TypeError, ValueError):
+            return cls()
+        for text, log_score in data["scores"].items():
+            if valid_items is not None and text not in valid_items:
+                continue
+            if isinstance(log_score, (int, float)):
+                ranker._scores[text] = float(log_score)
+        ranker._compact()
+        return ranker